@@ -1,10 +1,12 @@
 import os
 from typing import Any, Dict, Tuple, Type, List, final
 import warnings
-from shapely.geometry import shape, Point, Polygon, mapping
+from shapely.geometry import Point
 import json
 import re
 
+import numpy as np
+
 from urllib import parse
 
 from asf_search import ASFSession, ASFSearchResults
@@ -13,6 +15,7 @@ from asf_search.download import download_url
 from asf_search.download.file_download_type import FileDownloadType
 from asf_search.CMR.translate import try_parse_date
 from asf_search.CMR.translate import try_parse_float, try_parse_int, try_round_float
+from asf_search.WKT.footprints import get_centroids
 
 
 class ASFProduct:
@@ -41,6 +44,22 @@ class ASFProduct:
 
     """
 
+    # Products have no instance `__dict__`, subclasses declare their own (usually empty)
+    # `__slots__`. The footprint is kept as float64 arrays, see `geometry`, and its
+    # shapely geometry is cached in `_footprint` (see `asf_search.WKT.footprints`)
+    __slots__ = (
+        'meta',
+        'umm',
+        'properties',
+        'baseline',
+        'session',
+        '_geometry_type',
+        '_coordinates',
+        '_footprint',
+        '_export_cache',
+        '__weakref__',
+    )
+
     @classmethod
     def get_classname(cls):
         return cls.__name__
@@ -141,6 +160,47 @@ class ASFProduct:
         self.baseline = None
         self.session = session
 
+    @property
+    def geometry(self) -> Dict:
+        """
+        The product's footprint as a geojson geometry, `{'coordinates': [...], 'type': 'Polygon'}`
+
+        Coordinates are stored as float64 numpy arrays and converted to lists on each access,
+        so changes to the returned dictionary aren't kept, assign a new geometry instead
+        """
+        if self._geometry_type is None and self._coordinates is None:
+            return None
+
+        return {
+            'coordinates': _unpack_coordinates(self._coordinates),
+            'type': self._geometry_type,
+        }
+
+    @geometry.setter
+    def geometry(self, geometry: Dict):
+        self._footprint = None
+        if geometry is None:
+            self._geometry_type = self._coordinates = None
+            return
+
+        self._geometry_type = geometry.get('type')
+        self._coordinates = _pack_coordinates(geometry.get('coordinates'))
+
+    def __getstate__(self) -> Dict:
+        # `_footprint` and `_export_cache` are rebuilt on demand
+        state = {
+            name: getattr(self, name)
+            for name in ASFProduct.__slots__
+            if name not in ('_footprint', '_export_cache', '__weakref__') and hasattr(self, name)
+        }
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
+    def __setstate__(self, state: Dict):
+        # Products pickled before `__slots__` have a `geometry` entry, set through `geometry`
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __str__(self):
         return json.dumps(self.geojson(), indent=2, sort_keys=True)
 
@@ -172,6 +232,21 @@ class ASFProduct:
         :return: None
         """
 
+        if session is None:
+            session = self.session
+
+        for url, target_filename in self._get_download_targets(filename, fileType):
+            download_url(
+                url=url,
+                path=path,
+                filename=target_filename,
+                session=session,
+            )
+
+    def _get_download_targets(
+        self, filename: str = None, fileType=FileDownloadType.DEFAULT_FILE
+    ) -> List[Tuple[str, str]]:
+        """Returns the `(url, filename)` of each file `download()` saves"""
         default_filename = self.properties['fileName']
 
         if filename is not None:
@@ -187,20 +262,11 @@ class ASFProduct:
             else:
                 default_filename = filename
 
-        if session is None:
-            session = self.session
-
-        urls = self.get_urls(fileType=fileType)
-
-        for url in urls:
-            base_filename = '.'.join(default_filename.split('.')[:-1])
-            extension = url.split('.')[-1]
-            download_url(
-                url=url,
-                path=path,
-                filename=f'{base_filename}.{extension}',
-                session=session,
-            )
+        base_filename = '.'.join(default_filename.split('.')[:-1])
+        return [
+            (url, f'{base_filename}.{url.split(".")[-1]}')
+            for url in self.get_urls(fileType=fileType)
+        ]
 
     def get_urls(self, fileType=FileDownloadType.DEFAULT_FILE) -> list:
         urls = []
@@ -325,16 +391,10 @@ class ASFProduct:
 
     def centroid(self) -> Point:
         """
-        Finds the centroid of a product
+        Finds the centroid of a product, unwrapped across the antimeridian
+        (see `asf_search.WKT.footprints.get_centroids()`, or `ASFSearchResults.centroids()`)
         """
-        coords = mapping(shape(self.geometry))['coordinates'][0]
-        lons = [p[0] for p in coords]
-        if max(lons) - min(lons) > 180:
-            unwrapped_coords = [a if a[0] > 0 else [a[0] + 360, a[1]] for a in coords]
-        else:
-            unwrapped_coords = [a for a in coords]
-
-        return Polygon(unwrapped_coords).centroid
+        return get_centroids([self])[0]
 
     def remotezip(self, session: ASFSession) -> 'RemoteZip':  # type: ignore # noqa: F821
         """Returns a RemoteZip object which can be used to download
@@ -559,3 +619,28 @@ class ASFProduct:
         - item (dict): the CMR UMM-G item to read from
         """
         raise NotImplementedError()
+
+
+def _pack_coordinates(coordinates):
+    """
+    Packs geojson coordinates into float64 arrays, one array when every part is the same length
+    (ex: a single ring polygon) or a tuple of packed parts when they aren't
+    """
+    if coordinates is None:
+        return None
+
+    try:
+        return np.asarray(coordinates, dtype=np.float64)
+    except (ValueError, TypeError):
+        return tuple(_pack_coordinates(part) for part in coordinates)
+
+
+def _unpack_coordinates(coordinates):
+    """Converts coordinates packed by `_pack_coordinates()` back to geojson lists"""
+    if coordinates is None:
+        return None
+
+    if isinstance(coordinates, tuple):
+        return [_unpack_coordinates(part) for part in coordinates]
+
+    return coordinates.tolist()
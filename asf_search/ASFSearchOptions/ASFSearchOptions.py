@@ -5,23 +5,41 @@ from .validator_map import validator_map, validate
 from .config import config
 from asf_search import ASF_LOGGER
 
+# Options are always listed in validator_map order, regardless of the order they were set in
+_key_order = {key: idx for idx, key in enumerate(validator_map)}
+
 
 class ASFSearchOptions:
+    # Only options that have been set are stored, validated, in `_values`.
+    # Copies share `_values` until either side is modified (see `__copy__()`)
+    __slots__ = ('_values', '_shared')
+
     def __init__(self, **kwargs):
         """
-        Initialize the object, creating the list of attributes
-        based on the contents of validator_map, and assign them based on kwargs
+        Initialize the object, assigning search options based on kwargs.
+        Every key in validator_map is readable as an attribute, unset options
+        read as their config default or None
 
         :param kwargs: any search options to be set immediately
         """
-        # init the built in attrs:
-        for key in validator_map:
-            self.__setattr__(key, None)
+        object.__setattr__(self, '_values', {})
+        object.__setattr__(self, '_shared', False)
 
         # Apply any parameters passed in:
         for key, value in kwargs.items():
             self.__setattr__(key, value)
 
+    def __getattr__(self, key):
+        """
+        Returns the value of a search option, or its default if it hasn't been set
+
+        :param key: the name of the option to get
+        """
+        if key in validator_map:
+            return self._values.get(key, config.get(key))
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{key}'")
+
     def __setattr__(self, key, value):
         """
         Set a search option, restricting to the keys in validator_map only,
@@ -30,16 +48,13 @@ class ASFSearchOptions:
         :param key: the name of the option to be set
         :param value: the value to which to set the named option
         """
-        # self.* calls custom __setattr__ method, creating inf loop. Use super().*
         # Let values always be None, even if their validator doesn't agree. Used to delete them too:
         if key in validator_map:
             if value is None:  # always maintain config on required fields
-                if key in config:
-                    super().__setattr__(key, config[key])
-                else:
-                    super().__setattr__(key, None)
+                if key in self._values:
+                    self._writable_values().pop(key)
             else:
-                super().__setattr__(key, validate(key, value))
+                self._writable_values()[key] = validate(key, value)
         else:
             msg = f"key '{key}' is not a valid search option (setattr)"
             ASF_LOGGER.error(msg)
@@ -58,15 +73,53 @@ class ASFSearchOptions:
             ASF_LOGGER.error(msg)
             raise KeyError(msg)
 
+    def __copy__(self):
+        """
+        Returns a copy of the search options without re-validating them.
+        Both objects share the same underlying values until one of them is modified
+        """
+        clone = object.__new__(type(self))
+        object.__setattr__(clone, '_values', self._values)
+        object.__setattr__(clone, '_shared', True)
+        object.__setattr__(self, '_shared', True)
+        return clone
+
+    def __getstate__(self):
+        return dict(self._values)
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_values', state)
+        object.__setattr__(self, '_shared', False)
+
     def __iter__(self):
         """
         Filters search parameters, only returning populated fields. Used when casting to a dict.
         """
+        values = self._values
+        for key in sorted(values, key=_key_order.__getitem__):
+            value = values[key]
+            if key in config and value == config[key]:
+                continue
+            yield key, value
 
-        for key in validator_map:
-            if not self._is_val_default(key):
-                value = self.__getattribute__(key)
-                yield key, value
+    def _set_validated(self, key, value):
+        """
+        Sets a search option to a value that has already been through `validate()`
+
+        :param key: the name of the option to be set
+        :param value: the validated value
+        """
+        self._writable_values()[key] = value
+
+    def _writable_values(self) -> dict:
+        """
+        Returns the stored values, first making a private copy if they're shared with another object
+        """
+        if self._shared:
+            object.__setattr__(self, '_values', dict(self._values))
+            object.__setattr__(self, '_shared', False)
+
+        return self._values
 
     def __str__(self):
         """
@@ -102,9 +155,9 @@ class ASFSearchOptions:
         """
         Resets all populated search options, excluding config options (host, session, etc)
         """
-        for key, _ in self:
+        for key, _ in list(self):
             if key not in config:
-                super().__setattr__(key, None)
+                self._writable_values().pop(key)
 
     def merge_args(self, **kwargs) -> None:
         """
@@ -133,6 +186,6 @@ class ASFSearchOptions:
         :param key: The key to check
         :return: bool
         """
-        default_val = config[key] if key in config else None
-        current_val = getattr(self, key, None)
+        default_val = config.get(key)
+        current_val = self._values.get(key, default_val) if key in validator_map else None
         return current_val == default_val
@@ -1,4 +1,3 @@
-import dateparser
 from datetime import datetime, timezone
 
 import requests
@@ -7,6 +6,8 @@ from typing import Dict, Union, Tuple, TypeVar, Callable, List, Type, Sequence
 import math
 from shapely import wkt, errors
 
+from asf_search.dates import parse_user_date
+
 number = TypeVar('number', int, float)
 
 
@@ -62,7 +63,7 @@ def parse_date(value: Union[str, datetime]) -> Union[datetime, str]:
     if isinstance(value, datetime):
         return _to_utc(value)
 
-    date = dateparser.parse(str(value))
+    date = parse_user_date(str(value))
     if date is None:
         raise ValueError(f"Invalid date: '{value}'.")
 
@@ -1,8 +1,14 @@
 from collections import UserList
 from multiprocessing import Pool
 import json
-from typing import List
+from typing import List, Optional, Union
+
+import numpy as np
+import shapely
+from shapely.geometry.base import BaseGeometry
+
 from asf_search import ASFSession, ASFSearchOptions
+from asf_search.download.burst_download import download_bursts
 from asf_search.download.file_download_type import FileDownloadType
 from asf_search.exceptions import ASFSearchError
 
@@ -13,6 +19,9 @@ from asf_search.export.jsonlite2 import results_to_jsonlite2
 from asf_search.export.json import results_to_json
 from asf_search.export.kml import results_to_kml
 from asf_search.export.metalink import results_to_metalink
+from asf_search.export.geojsonseq import results_to_geojsonseq
+from asf_search.export.writers import results_to_file
+from asf_search.WKT.footprints import filter_footprints, get_centroids, get_footprints
 
 
 class ASFSearchResults(UserList):
@@ -38,14 +47,52 @@ class ASFSearchResults(UserList):
     def metalink(self):
         return results_to_metalink(self)
 
-    def json(self):
-        return results_to_json(self)
+    def json(self, compact: bool = False):
+        return results_to_json(self, compact=compact)
+
+    def jsonlite(self, compact: bool = False):
+        return results_to_jsonlite(self, compact=compact)
+
+    def jsonlite2(self, compact: bool = False):
+        return results_to_jsonlite2(self, compact=compact)
+
+    def geojsonseq(self, rfc8142: bool = False):
+        """Streams the results as newline-delimited GeoJSON, see `results_to_geojsonseq()`"""
+        return results_to_geojsonseq(self, rfc8142=rfc8142)
+
+    def geoparquet(self, path: str, compression: str = 'zstd') -> None:
+        """Writes the results to a GeoParquet file, see `results_to_geoparquet()`"""
+        from asf_search.export.geoparquet import results_to_geoparquet
+
+        results_to_geoparquet(self, path, compression=compression)
 
-    def jsonlite(self):
-        return results_to_jsonlite(self)
+    def to_file(
+        self, path: str, format: Optional[str] = None, compact: bool = False, processes: int = 1
+    ) -> None:
+        """Writes the results to a file in any export format, see `results_to_file()`"""
+        results_to_file(self, path, format=format, compact=compact, processes=processes)
+
+    def to_ipc(self, path: str, include_umm: bool = True, compression: Optional[str] = None) -> None:
+        """Saves the results to a versioned Arrow IPC file, see `results_to_ipc()`"""
+        from asf_search.export.ipc import results_to_ipc
 
-    def jsonlite2(self):
-        return results_to_jsonlite2(self)
+        results_to_ipc(self, path, include_umm=include_umm, compression=compression)
+
+    @classmethod
+    def from_ipc(
+        cls,
+        path: str,
+        start: int = 0,
+        stop: Optional[int] = None,
+        session: Optional[ASFSession] = None,
+        memory_map: bool = True,
+    ) -> 'ASFSearchResults':
+        """Loads results saved by `to_ipc()`, see `results_from_ipc()`"""
+        from asf_search.export.ipc import results_from_ipc
+
+        return results_from_ipc(
+            path, start=start, stop=stop, session=session, memory_map=memory_map
+        )
 
     def find_urls(self, extension: str = None, pattern: str = r'.*', directAccess: bool = False) -> List[str]:
         """Returns a flat list of all https or s3 urls from all results matching an extension and/or regex pattern
@@ -99,6 +146,39 @@ class ASFSearchResults(UserList):
             pool.join()
         ASF_LOGGER.info(f'Finished downloading ASFSearchResults of size {len(self)}.')
 
+    def download_bursts(
+        self,
+        path: str,
+        session: ASFSession = None,
+        fileType=FileDownloadType.DEFAULT_FILE,
+        max_in_flight: int = 8,
+        timeout: float = 300,
+    ) -> None:
+        """
+        Downloads every product concurrently, requesting each file up front so on-demand
+        SLC-BURST extractions run side by side. See `asf_search.download_bursts()`
+
+        Parameters
+        ----------
+        path:
+            The directory into which the products should be downloaded.
+        session:
+            The session to use
+            Defaults to the session used to fetch the results, or a new one if none was used.
+        max_in_flight:
+            The most requests (polls and downloads) running at once
+        timeout:
+            Seconds to wait for a file's extraction before giving up on it
+        """
+        download_bursts(
+            self,
+            path=path,
+            session=session,
+            fileType=fileType,
+            max_in_flight=max_in_flight,
+            timeout=timeout,
+        )
+
     def raise_if_incomplete(self) -> None:
         if not self.searchComplete:
             msg = (
@@ -109,6 +189,88 @@ class ASFSearchResults(UserList):
             ASF_LOGGER.error(msg)
             raise ASFSearchError(msg)
 
+    def spatial_filter(
+        self,
+        aoi: Union[str, BaseGeometry],
+        predicate: str = 'intersects',
+        min_overlap: Optional[float] = None,
+        keep_missing: bool = False,
+    ) -> 'ASFSearchResults':
+        """
+        Filters results by their footprints against an area of interest, such as the original
+        unsimplified AOI of a search (CMR is searched with its convex hull or bounding box).
+        Products without footprints are dropped, unless `keep_missing` is set.
+
+        :param aoi: the WKT string or Shapely Geometry to filter against
+        :param predicate: how a product's footprint must relate to the aoi, one of
+            - `intersects`: the footprint and aoi share any area
+            - `covers`: the footprint covers the entire aoi
+            - `covered_by`: the footprint lies entirely inside the aoi
+        :param min_overlap: the minimum fraction of a product's footprint that must lie
+            within the aoi, ex: `0.5`
+        :param keep_missing: keep products without a footprint, which can't be ruled out
+
+        :return: a new ASFSearchResults of the matching products, in their original order
+        """
+        indices = filter_footprints(
+            get_footprints(self.data),
+            aoi,
+            predicate=predicate,
+            min_overlap=min_overlap,
+            keep_missing=keep_missing,
+        )
+
+        filtered = ASFSearchResults([self.data[idx] for idx in indices], opts=self.searchOptions)
+        filtered.searchComplete = self.searchComplete
+        return filtered
+
+    def footprints(self) -> np.ndarray:
+        """
+        Returns each product's footprint as a shapely geometry (`None` without one),
+        built in one vectorized pass and cached on the products. See `asf_search.WKT.footprints`
+        """
+        return get_footprints(self.data)
+
+    def centroids(self) -> np.ndarray:
+        """
+        Returns the centroid of each product's footprint as a shapely Point,
+        the same as `ASFProduct.centroid()` for every product at once
+        """
+        return get_centroids(self.data)
+
+    def bounds(self) -> np.ndarray:
+        """
+        Returns the `(min_lon, min_lat, max_lon, max_lat)` of each product's footprint
+        as an `(N, 4)` float array, `nan` for products without a footprint
+        """
+        return shapely.bounds(self.footprints())
+
+    def areas(self) -> np.ndarray:
+        """
+        Returns the area of each product's footprint in square degrees,
+        `nan` for products without a footprint
+        """
+        return shapely.area(self.footprints())
+
+    def columns(self) -> 'ResultColumns':  # type: ignore # noqa: F821
+        """
+        Builds a typed, column oriented view of the results for vectorized
+        filtering, sorting and grouping. See `ResultColumns`.
+
+        The view is a snapshot, build it once and reuse it rather than
+        calling `columns()` repeatedly.
+        """
+        from asf_search.ResultColumns import ResultColumns
+
+        return ResultColumns(self)
+
+    def to_arrow(self) -> 'pyarrow.Table':  # type: ignore # noqa: F821
+        """
+        Returns the results as a `pyarrow.Table` with one typed column per property
+        and the footprint as WKB `geometry`. Requires the optional `pyarrow` dependency.
+        """
+        return self.columns().to_arrow()
+
     def get_products_by_subclass_type(self) -> dict:
         """
         Organizes results into dictionary by ASFProduct subclass name
@@ -1,16 +1,24 @@
 import platform
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 import requests
+from requests.cookies import create_cookie
+from requests.adapters import HTTPAdapter
 from requests.utils import get_netrc_auth
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import http.cookiejar
 
 from asf_search import ASF_LOGGER, __name__ as asf_name, __version__ as asf_version
+from asf_search.CredentialCache import CredentialCache, get_token_expiration
 from asf_search.exceptions import ASFAuthenticationError
+from asf_search.Throttle import Throttle
 import warnings
 
 
 class ASFSession(requests.Session):
+    credential_cache: Optional[CredentialCache] = None
+    throttle: Union[bool, Throttle] = True
+
     def __init__(
         self,
         edl_host: Optional[str] = None,
@@ -20,6 +28,13 @@ class ASFSession(requests.Session):
         cmr_collections: Optional[str] = None,
         auth_domains: Optional[List[str]] = None,
         auth_cookie_names: Optional[List[str]] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        max_retries: Optional[Union[int, Retry]] = None,
+        keep_alive: bool = True,
+        credential_cache: Optional[Union[str, CredentialCache]] = None,
+        throttle: Union[bool, Throttle] = True,
     ):
         """
         ASFSession is a subclass of `requests.Session`, and is meant to ease
@@ -57,6 +72,31 @@ class ASFSession(requests.Session):
         `auth_cookie_names`:
             the list of cookie names to use when verifying
             with `auth_with_creds()` & `auth_with_cookiejar()`
+        `pool_connections`:
+            the number of hosts (CMR, EDL, download hosts) to keep a connection pool for
+        `pool_maxsize`:
+            the number of connections kept open per host. Raise this when running more
+            concurrent searches or downloads than this with one session (ex: `sharded_search()`)
+        `pool_block`:
+            wait for a free connection instead of opening an extra, unpooled one
+            when all `pool_maxsize` connections to a host are in use
+        `max_retries`:
+            transport level retries, for connections that fail before a request is sent.
+            Either a number of retries, or a `urllib3.util.retry.Retry` for full control.
+            Defaults to 3 connection retries with backoff. Failed responses are not retried here,
+            searches retry those themselves
+        `keep_alive`:
+            keep connections open between requests (the default). With `False`,
+            every request asks the server to close its connection afterwards
+        `credential_cache`:
+            a `CredentialCache` (or the path of its file) to save and reuse credentials
+            from `auth_with_creds()` and `auth_with_token()`, so processes sharing it
+            only log in to Earthdata Login once. Off by default
+        `throttle`:
+            adapts how many searches and downloads run at once to what each service accepts,
+            backing off and retrying when it answers `429`/`503` (see `asf_search.Throttle`).
+            `True` (the default) shares one throttle per host across the process,
+            pass a `Throttle` to use it for every host, or `False` to send requests as they come
 
         More information on Earthdata Login can be found here:
         https://urs.earthdata.nasa.gov/documentation/faq
@@ -88,6 +128,40 @@ class ASFSession(requests.Session):
 
         self.cmr_host = INTERNAL.CMR_HOST if cmr_host is None else cmr_host
 
+        if isinstance(credential_cache, str):
+            credential_cache = CredentialCache(credential_cache)
+        self.credential_cache = credential_cache
+        self.throttle = throttle
+
+        if not keep_alive:
+            self.headers.update({'Connection': 'close'})
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=self._get_transport_retries(max_retries),
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    @staticmethod
+    def _get_transport_retries(max_retries: Optional[Union[int, Retry]]) -> Retry:
+        if isinstance(max_retries, Retry):
+            return max_retries
+
+        # Only retries failed connections, a request that was sent
+        # (possibly a non-idempotent POST, or a streamed download) is never re-sent
+        retries = 3 if max_retries is None else max_retries
+        return Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=0,
+            backoff_factor=0.5,
+            raise_on_status=False,
+        )
+
     def __eq__(self, other):
         return (
             self.auth == other.auth
@@ -114,7 +188,32 @@ class ASFSession(requests.Session):
         ----------
         ASFSession
         """
+        if self.credential_cache is None:
+            return self._auth_with_creds(username, password)
+
+        key = CredentialCache.make_key('creds', self.edl_host, self.asf_auth_host, username)
+        with self.credential_cache.lock():
+            cached = self.credential_cache.get(key, password=password)
+            if cached is not None:
+                ASF_LOGGER.info('Using cached EDL Bearer Token and asf-urs cookie')
+                self._set_cached_cookies(cached['cookies'])
+                self._update_edl_token(token=cached['token'])
+                return self
+
+            self._auth_with_creds(username, password)
+
+            token = self.headers['Authorization'][len('Bearer '):]
+            self.credential_cache.set(
+                key,
+                expires=self._get_credentials_expiration(token),
+                password=password,
+                token=token,
+                cookies=self._serialize_cookies(),
+            )
+
+        return self
 
+    def _auth_with_creds(self, username: str, password: str):
         self.auth = HTTPBasicAuth(username, password)
         token = self._get_urs_access_token()
         self._set_asf_urs_cookie()
@@ -139,6 +238,22 @@ class ASFSession(requests.Session):
         ----------
         ASFSession
         """
+        if self.credential_cache is None:
+            return self._auth_with_token(token)
+
+        key = CredentialCache.make_key('token', self.edl_host, token)
+        with self.credential_cache.lock():
+            if self.credential_cache.get(key) is not None:
+                ASF_LOGGER.info('EDL token was recently validated, skipping validation')
+                self._update_edl_token(token=token)
+                return self
+
+            self._auth_with_token(token)
+            self.credential_cache.set(key, expires=get_token_expiration(token))
+
+        return self
+
+    def _auth_with_token(self, token: str):
         oauth_authorization = (
             f'https://{self.edl_host}/oauth/tokens/user?client_id={self.edl_client_id}'
         )
@@ -209,6 +324,36 @@ class ASFSession(requests.Session):
     def _update_edl_token(self, token: str):
         self.headers.update({'Authorization': 'Bearer {0}'.format(token)})
 
+    def _serialize_cookies(self) -> List[Dict]:
+        return [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain,
+                'path': cookie.path,
+                'expires': cookie.expires,
+                'secure': cookie.secure,
+            }
+            for cookie in self.cookies
+        ]
+
+    def _set_cached_cookies(self, cookies: List[Dict]):
+        for cookie in cookies:
+            self.cookies.set_cookie(create_cookie(**cookie))
+
+    def _get_credentials_expiration(self, token: str) -> Optional[float]:
+        """The earliest expiration of the token and the session's auth cookies"""
+        expirations = [
+            cookie.expires
+            for cookie in self.cookies
+            if cookie.name in self.auth_cookie_names and cookie.expires is not None
+        ]
+        token_expiration = get_token_expiration(token)
+        if token_expiration is not None:
+            expirations.append(token_expiration)
+
+        return min(expirations) if len(expirations) else None
+
     def auth_with_cookiejar(
         self,
         cookies: Union[http.cookiejar.CookieJar, requests.cookies.RequestsCookieJar],
@@ -296,5 +441,7 @@ class ASFSession(requests.Session):
             'cmr_collections': self.cmr_collections,
             'auth_domains': self.auth_domains,
             'auth_cookie_names': self.auth_cookie_names,
+            'credential_cache': self.credential_cache,
+            'throttle': self.throttle,
         }
         return state
@@ -14,6 +14,8 @@ class ASFStackableProduct(ASFProduct):
     ASF ERS-2 Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/ers-2/
     """
 
+    __slots__ = ()
+
     class BaselineCalcType(Enum):
         """
         Defines how asf-search will calculate perpendicular baseline for products of this subclass
@@ -1,20 +1,29 @@
-from typing import Dict
+from typing import Dict, Optional
 from asf_search.exceptions import CMRError
-from asf_search.constants.INTERNAL import CMR_HOST, CMR_COLLECTIONS_PATH
+from asf_search.constants.INTERNAL import CMR_COLLECTIONS_PATH
+from asf_search.ASFSession import ASFSession
 
-import requests
 
-
-def get_campaigns(data) -> Dict:
+def get_campaigns(
+    data, session: Optional[ASFSession] = None, host: Optional[str] = None
+) -> Dict:
     """Queries CMR Collections endpoint for
     collections associated with the given platform
 
     :param data: a dictionary with required keys:
     'include_facets', 'provider', 'platform[]' and optional key: 'instrument[]'
+    :param session: the session to query with, reusing its pooled connections.
+    Defaults to a new `ASFSession`
+    :param host: the CMR host to query, defaults to the session's `cmr_host`
 
     :return: Dictionary containing CMR umm_json response
     """
-    response = requests.post(f'https://{CMR_HOST}{CMR_COLLECTIONS_PATH}', data=data)
+    if session is None:
+        session = ASFSession()
+    if host is None:
+        host = session.cmr_host
+
+    response = session.post(f'https://{host}{CMR_COLLECTIONS_PATH}', data=data)
     if response.status_code != 200:
         raise CMRError(f'CMR_ERROR {response.status_code}: {response.text}')
 
@@ -1,4 +1,11 @@
 from .MissionList import get_campaigns  # noqa: F401
+from .collection_metadata import (  # noqa: F401
+    CollectionMetadataCache,  # noqa: F401
+    get_collection_cache,  # noqa: F401
+    set_collection_cache,  # noqa: F401
+    get_collection_metadata,  # noqa: F401
+    prewarm_collection_metadata,  # noqa: F401
+)
 from .subquery import build_subqueries  # noqa: F401
 from .translate import translate_opts  # noqa: F401
 from .field_map import field_map  # noqa: F401
@@ -0,0 +1,333 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from asf_search import ASF_LOGGER
+from asf_search.ASFSession import ASFSession
+from asf_search.CMR.datasets import collections_by_processing_level
+from asf_search.constants.INTERNAL import CMR_COLLECTIONS_PATH
+from asf_search.exceptions import ASFSearchError, CMRError
+
+# Bump whenever the file layout changes, files from other versions are ignored
+_FORMAT_VERSION = 1
+# The most collections CMR returns in one page
+_PAGE_SIZE = 2000
+# Short names can match several collections (one per version), so fewer are sent per request
+_SHORT_NAMES_PER_REQUEST = 100
+
+
+class CollectionMetadataCache:
+    """
+    Caches CMR collection metadata (the `meta` and `umm` of each collection, and collection
+    queries like the one behind `campaigns()`) in process, and optionally in a directory shared
+    by every process. Entries are kept for `ttl` seconds, the `max_size` most recently used
+    ones are kept in memory.
+
+    `get_searchable_attributes()`, `campaigns()` and `get_collection_metadata()` read through
+    the shared cache (`get_collection_cache()`), so repeated lookups don't query CMR again.
+    To keep metadata across runs, share an on disk cache instead:
+
+    ``` python
+    cache = asf_search.CollectionMetadataCache(path='~/.cache/asf_search/collections')
+    asf_search.set_collection_cache(cache)
+    asf_search.prewarm_collection_metadata()
+    ```
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 24 * 60 * 60,
+        path: Optional[str] = None,
+    ):
+        """
+        :param max_size: the most entries kept in memory, least recently used ones are dropped first
+        :param ttl: how long entries are reused for, in seconds
+        :param path: a directory to also keep entries in, one file each.
+            Defaults to `None`, keeping entries in memory only
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.path = None if path is None else os.path.abspath(os.path.expanduser(path))
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Builds an entry key from its parts (host, lookup type, value)"""
+        return '\0'.join(parts)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the value stored under `key`, or `None` if it is missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        if self.path is None:
+            return None
+
+        entry = self._read(key)
+        if entry is None or entry['expires'] <= now:
+            return None
+
+        self._remember(key, entry['expires'], entry['value'])
+        return entry['value']
+
+    def set(self, key: str, value: Any) -> None:
+        """Stores `value` under `key`, it must be JSON serializable when the cache has a `path`"""
+        expires = time.time() + self.ttl
+        self._remember(key, expires, value)
+
+        if self.path is not None:
+            try:
+                self._write(key, expires, value)
+            except OSError as exc:
+                ASF_LOGGER.warning(
+                    f'Failed to write collection metadata cache "{self.path}": {exc}'
+                )
+
+    def clear(self) -> None:
+        """Drops every entry, including the ones in `path`"""
+        with self._lock:
+            self._entries.clear()
+
+        if self.path is None or not os.path.isdir(self.path):
+            return
+
+        for name in os.listdir(self.path):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.path, name))
+
+    def _remember(self, key: str, expires: float, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f'{hashlib.sha256(key.encode("utf-8")).hexdigest()}.json')
+
+    def _read(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            ASF_LOGGER.warning(f'Ignoring unreadable collection metadata cache entry: {exc}')
+            return None
+
+        # Different keys could share a file name, and files from other versions are ignored
+        if (
+            not isinstance(entry, dict)
+            or entry.get('version') != _FORMAT_VERSION
+            or entry.get('key') != key
+        ):
+            return None
+
+        return entry
+
+    def _write(self, key: str, expires: float, value: Any) -> None:
+        os.makedirs(self.path, exist_ok=True)
+
+        # Written to a temporary file and renamed over the entry,
+        # so readers never see a partially written file
+        fd, temp_path = tempfile.mkstemp(dir=self.path, prefix='.collection-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {'version': _FORMAT_VERSION, 'key': key, 'expires': expires, 'value': value}, f
+                )
+            os.replace(temp_path, self._entry_path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+_collection_cache = CollectionMetadataCache()
+
+
+def get_collection_cache() -> CollectionMetadataCache:
+    """Returns the collection metadata cache shared by every lookup"""
+    return _collection_cache
+
+
+def set_collection_cache(cache: CollectionMetadataCache) -> None:
+    """Replaces the shared collection metadata cache, ex: with one kept on disk"""
+    global _collection_cache
+    _collection_cache = cache
+
+
+def get_collection_metadata(
+    conceptIDs: Optional[Union[str, Sequence[str]]] = None,
+    shortNames: Optional[Union[str, Sequence[str]]] = None,
+    session: Optional[ASFSession] = None,
+    host: Optional[str] = None,
+) -> Dict[str, List[Dict]]:
+    """
+    Returns the CMR collections (each a dictionary of its `meta` and `umm`) for every given
+    concept-id and short name, fetching the ones that aren't cached in as few requests as possible
+
+    ``` python
+    collections = asf.get_collection_metadata(shortNames=['SENTINEL-1A_SLC', 'SENTINEL-1B_SLC'])
+    ```
+
+    :param conceptIDs: collection concept-ids to look up
+    :param shortNames: collection short names to look up, each can match several collection versions
+    :param session: the session to query CMR with, defaults to a new `ASFSession`
+    :param host: the CMR host to query, defaults to the session's `cmr_host`
+
+    :return: each concept-id and short name, mapped to the collections found for it
+        (an empty list if CMR has none)
+    """
+    if session is None:
+        session = ASFSession()
+    if host is None:
+        host = session.cmr_host
+
+    cache = get_collection_cache()
+    found = {}
+    missing_ids = []
+    missing_names = []
+
+    for concept_id in _as_list(conceptIDs):
+        item = cache.get(cache.make_key(host, 'concept-id', concept_id))
+        if item is None:
+            missing_ids.append(concept_id)
+        else:
+            found[concept_id] = [item]
+
+    for short_name in _as_list(shortNames):
+        items = _cached_short_name(cache, host, short_name)
+        if items is None:
+            missing_names.append(short_name)
+        else:
+            found[short_name] = items
+
+    if missing_ids:
+        fetched = {concept_id: [] for concept_id in missing_ids}
+        for item in _fetch_collections(session, host, 'concept-id[]', missing_ids, _PAGE_SIZE):
+            fetched.setdefault(item['meta']['concept-id'], []).append(item)
+        found.update(fetched)
+
+    if missing_names:
+        fetched = {short_name: [] for short_name in missing_names}
+        # CMR matches short names regardless of case
+        requested = {short_name.lower(): short_name for short_name in missing_names}
+        items = _fetch_collections(
+            session, host, 'short_name[]', missing_names, _SHORT_NAMES_PER_REQUEST
+        )
+        for item in items:
+            short_name = requested.get(str(item['umm'].get('ShortName')).lower())
+            if short_name is not None:
+                fetched[short_name].append(item)
+
+        for short_name in missing_names:
+            found[short_name] = fetched[short_name]
+            # Collections that weren't found aren't cached, they may be published later
+            if len(fetched[short_name]):
+                cache.set(
+                    cache.make_key(host, 'short-name', short_name),
+                    [item['meta']['concept-id'] for item in fetched[short_name]],
+                )
+
+    return found
+
+
+def prewarm_collection_metadata(
+    processingLevels: Optional[Iterable[str]] = None,
+    session: Optional[ASFSession] = None,
+    host: Optional[str] = None,
+) -> int:
+    """
+    Fetches the metadata of every collection asf-search knows for the given processing levels
+    (`asf_search.CMR.collections_by_processing_level`, all of them by default), in one request,
+    so later lookups like `get_searchable_attributes(processingLevel='SLC')` are served from cache
+
+    :return: the number of collections now cached
+    """
+    if processingLevels is None:
+        processingLevels = collections_by_processing_level.keys()
+
+    concept_ids = list(
+        dict.fromkeys(
+            concept_id
+            for level in processingLevels
+            for concept_id in collections_by_processing_level.get(level, [])
+        )
+    )
+    collections = get_collection_metadata(conceptIDs=concept_ids, session=session, host=host)
+
+    return sum(1 for items in collections.values() if len(items))
+
+
+def _cached_short_name(
+    cache: CollectionMetadataCache, host: str, short_name: str
+) -> Optional[List[Dict]]:
+    concept_ids = cache.get(cache.make_key(host, 'short-name', short_name))
+    if concept_ids is None:
+        return None
+
+    items = [
+        cache.get(cache.make_key(host, 'concept-id', concept_id)) for concept_id in concept_ids
+    ]
+    # One of its collections was evicted, so the short name is looked up again
+    if any(item is None for item in items):
+        return None
+
+    return items
+
+
+def _fetch_collections(
+    session: ASFSession, host: str, keyword: str, values: List[str], chunk_size: int
+) -> List[Dict]:
+    url = f'https://{host}{CMR_COLLECTIONS_PATH}'
+    cache = get_collection_cache()
+    items = []
+
+    for idx in range(0, len(values), chunk_size):
+        query_data = [(keyword, value) for value in values[idx : idx + chunk_size]]
+        query_data.append(('page_size', str(_PAGE_SIZE)))
+        response = session.post(url=url, data=query_data)
+
+        try:
+            cmr_response = response.json()
+        except Exception as exc:
+            raise ASFSearchError(
+                f'Failed to find collection metadata for {keyword} {values}. '
+                f'original exception: {str(exc)}'
+            )
+
+        if 'errors' in cmr_response:
+            raise CMRError(
+                'CMR responded with an error. '
+                f"Original error(s): {' '.join(cmr_response['errors'])}"
+            )
+
+        for item in cmr_response['items']:
+            cache.set(cache.make_key(host, 'concept-id', item['meta']['concept-id']), item)
+            items.append(item)
+
+    return items
+
+
+def _as_list(values: Optional[Union[str, Sequence[str]]]) -> List[str]:
+    if values is None:
+        return []
+    if isinstance(values, str):
+        return [values]
+
+    return list(dict.fromkeys(values))
+
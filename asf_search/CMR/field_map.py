@@ -1,7 +1,9 @@
+# 'multi': CMR ORs repeated values of the keyword, so a list can be sent in a single request
+# 'ranges': the keyword accepts inclusive 'min,max' integer ranges
 field_map = {
     # API parameter                 CMR keyword                         CMR format strings
-    'absoluteOrbit':                {'key': 'orbit_number',             'fmt': '{0}'},
-    'asfFrame':                     {'key': 'attribute[]',              'fmt': 'int,FRAME_NUMBER,{0}'},
+    'absoluteOrbit':                {'key': 'orbit_number',             'fmt': '{0}', 'ranges': True},
+    'asfFrame':                     {'key': 'attribute[]',              'fmt': 'int,FRAME_NUMBER,{0}', 'ranges': True},
     'maxBaselinePerp':              {'key': 'attribute[]',              'fmt': 'float,INSAR_BASELINE,,{0}'},
     'minBaselinePerp':              {'key': 'attribute[]',              'fmt': 'float,INSAR_BASELINE,{0},'},
     'bbox':                         {'key': 'bounding_box',             'fmt': '{0}'},
@@ -15,27 +17,27 @@ field_map = {
     'minFaradayRotation':           {'key': 'attribute[]',              'fmt': 'float,FARADAY_ROTATION,{0},'},  # noqa F401
     'flightDirection':              {'key': 'attribute[]',              'fmt': 'string,ASCENDING_DESCENDING,{0}'},  # noqa F401
     'flightLine':                   {'key': 'attribute[]',              'fmt': 'string,FLIGHT_LINE,{0}'},
-    'frame':                        {'key': 'attribute[]',              'fmt': 'int,CENTER_ESA_FRAME,{0}'},
-    'granule_list':                 {'key': 'readable_granule_name[]',  'fmt': '{0}'},
+    'frame':                        {'key': 'attribute[]',              'fmt': 'int,CENTER_ESA_FRAME,{0}', 'ranges': True},
+    'granule_list':                 {'key': 'readable_granule_name[]',  'fmt': '{0}', 'multi': True},
     'groupID':                      {'key': 'attribute[]',              'fmt': 'string,GROUP_ID,{0}'},
     'insarStackId':                 {'key': 'attribute[]',              'fmt': 'int,INSAR_STACK_ID,{0}'},
     'linestring':                   {'key': 'line',                     'fmt': '{0}'},
     'lookDirection':                {'key': 'attribute[]',              'fmt': 'string,LOOK_DIRECTION,{0}'},
     'maxInsarStackSize':            {'key': 'attribute[]',              'fmt': 'int,INSAR_STACK_SIZE,,{0}'},
     'minInsarStackSize':            {'key': 'attribute[]',              'fmt': 'int,INSAR_STACK_SIZE,{0},'},
-    'instrument':                   {'key': 'instrument[]',             'fmt': '{0}'},
+    'instrument':                   {'key': 'instrument[]',             'fmt': '{0}', 'multi': True},
     'offNadirAngle':                {'key': 'attribute[]',              'fmt': 'float,OFF_NADIR_ANGLE,{0}'},
-    'platform':                     {'key': 'platform[]',               'fmt': '{0}'},
+    'platform':                     {'key': 'platform[]',               'fmt': '{0}', 'multi': True},
     'polarization':                 {'key': 'attribute[]',              'fmt': 'string,POLARIZATION,{0}'},
     'point':                        {'key': 'point',                    'fmt': '{0}'},
     'polygon':                      {'key': 'polygon',                  'fmt': '{0}'},
     'processingDate':               {'key': 'updated_since',            'fmt': '{0}'},
     'processingLevel':              {'key': 'attribute[]',              'fmt': 'string,PROCESSING_TYPE,{0}'},
-    'product_list':                 {'key': 'granule_ur[]',             'fmt': '{0}'},
+    'product_list':                 {'key': 'granule_ur[]',             'fmt': '{0}', 'multi': True},
     'provider':                     {'key': 'provider',                 'fmt': '{0}'},
-    'relativeOrbit':                {'key': 'attribute[]',              'fmt': 'int,PATH_NUMBER,{0}'},
+    'relativeOrbit':                {'key': 'attribute[]',              'fmt': 'int,PATH_NUMBER,{0}', 'ranges': True},
     'temporal':                     {'key': 'temporal',                 'fmt': '{0}'},
-    'collections':                  {'key': 'echo_collection_id[]',     'fmt': '{0}'},
+    'collections':                  {'key': 'echo_collection_id[]',     'fmt': '{0}', 'multi': True},
     'shortName':                    {'key': 'shortName',                'fmt': '{0}'},
     'temporalBaselineDays':         {'key': 'attribute[]',              'fmt': 'int,TEMPORAL_BASELINE_DAYS,{0}'},  # noqa F401
     'ariaVersion':                  {'key': 'attribute[]',              'fmt': 'string,VERSION,{0}'},
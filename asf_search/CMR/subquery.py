@@ -1,9 +1,10 @@
-from typing import List, Tuple
+from typing import List, Tuple, Union
 import itertools
 from copy import copy
 
 from asf_search.ASFSearchOptions import ASFSearchOptions
 from asf_search.constants import CMR_PAGE_SIZE
+from asf_search.CMR.field_map import field_map
 from asf_search.CMR.datasets import (
     NISAR_PRODUCT_TYPES,
     collections_by_processing_level,
@@ -24,11 +25,6 @@ def build_subqueries(opts: ASFSearchOptions) -> List[ASFSearchOptions]:
     """
     params = dict(opts)
 
-    # Break out two big list offenders into manageable chunks
-    for chunked_key in ['granule_list', 'product_list']:
-        if params.get(chunked_key) is not None:
-            params[chunked_key] = chunk_list(params[chunked_key], CMR_PAGE_SIZE)
-
     list_param_names = [
         'platform',
         'season',
@@ -47,6 +43,16 @@ def build_subqueries(opts: ASFSearchOptions) -> List[ASFSearchOptions]:
         'maxResults',
     ]  # these params exist in opts, but shouldn't be passed on to subqueries at ALL
 
+    for key, value in params.items():
+        field = field_map.get(key, {})
+        if field.get('multi') and key not in list_param_names:
+            # CMR ORs these together, so send them in as few requests as possible,
+            # broken into chunks to keep each request a manageable size
+            params[key] = chunk_list(value, CMR_PAGE_SIZE)
+        elif field.get('ranges'):
+            # Consecutive values and overlapping ranges can be searched as one range
+            params[key] = collapse_ranges(value)
+
     includes_nisar_products = False
     if params.get('processingLevel') is not None:
         for product in params.get('processingLevel', []):
@@ -67,28 +73,41 @@ def build_subqueries(opts: ASFSearchOptions) -> List[ASFSearchOptions]:
             subquery_params[key] = value
 
     sub_queries = cartesian_product(subquery_params)
-    return [_build_subquery(query, opts, list_params) for query in sub_queries]
+
+    # Options shared by every subquery are only validated once, subqueries are copied from this
+    template = ASFSearchOptions(
+        **list_params, provider=opts.provider, host=opts.host, session=opts.session
+    )
+    # The same few values are repeated across the cartesian product, only validate each once
+    validated = {}
+    return [_build_subquery(query, opts, template, validated) for query in sub_queries]
 
 
 def _build_subquery(
-    query: List[Tuple[dict]], opts: ASFSearchOptions, list_params: dict
+    query: List[Tuple[dict]], opts: ASFSearchOptions, template: ASFSearchOptions, validated: dict
 ) -> ASFSearchOptions:
     """
     Composes query dict and list params into new ASFSearchOptions object
 
     param: query: the cartesian search query options
-    param: opts: the search options to pull config options from (provider, host, session)
-    param: list_params: the subquery parameters
+    param: opts: the search options to pull the session from
+    param: template: the validated list params and config options (provider, host)
+    param: validated: cache of already validated (key, value) pairs from the query options
     """
-    q = dict()
-    for p in query:
-        q.update(p)
+    subquery = copy(template)
+    subquery.session = copy(opts.session)
 
-    q['provider'] = opts.provider
-    q['host'] = opts.host
-    q['session'] = copy(opts.session)
+    for p in query:
+        for key, value in p.items():
+            try:
+                subquery._set_validated(key, validated[(key, value)])
+            except KeyError:
+                setattr(subquery, key, value)
+                validated[(key, value)] = getattr(subquery, key)
+            except TypeError:  # unhashable value
+                setattr(subquery, key, value)
 
-    return ASFSearchOptions(**q, **list_params)
+    return subquery
 
 
 def get_keyword_concept_ids(params: dict, use_collection_alias: bool = True, includes_nisar_products: bool = False) -> dict:
@@ -163,6 +182,38 @@ def chunk_list(source: List, n: int) -> List:
     return [source[i * n : (i + 1) * n] for i in range((len(source) + n - 1) // n)]
 
 
+def collapse_ranges(
+    values: List[Union[int, Tuple[int, int]]],
+) -> List[Union[int, Tuple[int, int]]]:
+    """
+    Merges consecutive integers and overlapping or adjacent integer ranges into inclusive ranges,
+    ex: `[1, 2, 3, (5, 8), 9, 12]` -> `[(1, 3), (5, 9), 12]`
+
+    :param values: the integers and (min, max) integer ranges to merge
+    :return List: the fewest single values and (min, max) ranges covering the same values
+    """
+    spans = []
+    for value in values:
+        if isinstance(value, tuple):
+            spans.append(value)
+        else:
+            spans.append((value, value))
+
+    for start, end in spans:
+        # Only well-formed integer ranges can be safely merged
+        if not isinstance(start, int) or not isinstance(end, int) or start > end:
+            return values
+
+    collapsed = []
+    for start, end in sorted(spans):
+        if len(collapsed) and start <= collapsed[-1][1] + 1:
+            collapsed[-1] = (collapsed[-1][0], max(end, collapsed[-1][1]))
+        else:
+            collapsed.append((start, end))
+
+    return [start if start == end else (start, end) for start, end in collapsed]
+
+
 def cartesian_product(params):
     formatted_params = format_query_params(params)
     p = list(itertools.product(*formatted_params))
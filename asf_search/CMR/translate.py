@@ -11,10 +11,7 @@ from .field_map import field_map
 from .datasets import collections_per_platform, NISAR_PRODUCT_TYPES
 import logging
 
-try:
-    from ciso8601 import parse_datetime
-except ImportError:
-    from dateutil.parser import parse as parse_datetime
+from asf_search.dates import parse_datetime
 
 nisar_collections_set = set(collections_per_platform['NISAR'])
 
@@ -87,7 +84,8 @@ def translate_opts(opts: ASFSearchOptions) -> List:
     cmr_opts = []
 
     # user provided umm fields
-    custom_cmr_keywords = dict_opts.pop('cmr_keywords', [])
+    # copied, since the options' own list may be shared with other search options objects
+    custom_cmr_keywords = list(dict_opts.pop('cmr_keywords', []))
 
     granule_list_with_wildcard = False
     for key, val in dict_opts.items():
@@ -0,0 +1,224 @@
+import base64
+from contextlib import contextmanager
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import tempfile
+import time
+from typing import Dict, Iterator, Optional
+
+from asf_search import ASF_LOGGER
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# Bump whenever the file layout changes, files from other versions are ignored
+_FORMAT_VERSION = 1
+_PASSWORD_ITERATIONS = 200_000
+
+
+class CredentialCache:
+    """
+    A local file of EDL bearer tokens and auth cookies, shared by every `ASFSession` (and every
+    process) created with it. Sessions reuse cached credentials instead of logging in again,
+    until they are within `refresh_margin` of expiring.
+
+    ``` python
+    cache = asf_search.CredentialCache()
+    session = asf_search.ASFSession(credential_cache=cache).auth_with_creds(username, password)
+    ```
+
+    The file is only readable by the current user and holds live credentials, treat it like
+    a `.netrc`. Passwords are never stored, only a salted PBKDF2 hash to verify them with.
+    Reads and updates hold an exclusive lock on `<path>.lock`, so when many processes
+    start at once only the first one logs in, the rest wait for and reuse its credentials.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_age: float = 24 * 60 * 60,
+        refresh_margin: float = 60 * 60,
+    ):
+        """
+        :param path: the cache file. Defaults to `asf_search/credentials.json`
+            in `$XDG_CACHE_HOME` (`~/.cache`)
+        :param max_age: the longest credentials are reused for, in seconds,
+            even when the token and cookies expire later
+        :param refresh_margin: log in again once credentials are this close
+            to expiring (in seconds), instead of handing out nearly expired ones
+        """
+        if path is None:
+            cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join('~', '.cache')
+            path = os.path.join(cache_home, 'asf_search', 'credentials.json')
+
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_age = max_age
+        self.refresh_margin = refresh_margin
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Builds an entry key from its parts (hosts, username, token), without storing them"""
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Holds the cache's exclusive lock, so checking for credentials,
+        logging in and saving them happens once across processes
+        """
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+
+        with open(f'{self.path}.lock', 'a+b') as fh:
+            _lock_file(fh)
+            try:
+                yield
+            finally:
+                _unlock_file(fh)
+
+    def get(self, key: str, password: Optional[str] = None) -> Optional[Dict]:
+        """
+        Returns the entry stored under `key`, or `None` if it is missing, due for refresh,
+        or was stored with a different password
+        """
+        entry = self._read().get(key)
+        if entry is None:
+            return None
+
+        if entry['expires'] - self.refresh_margin <= time.time():
+            ASF_LOGGER.info('Cached credentials expire soon, refreshing')
+            return None
+
+        if entry.get('password') is not None:
+            if password is None or not _verify_password(password, entry['password']):
+                return None
+
+        return entry
+
+    def set(
+        self,
+        key: str,
+        expires: Optional[float] = None,
+        password: Optional[str] = None,
+        **values,
+    ) -> None:
+        """
+        Stores an entry under `key`
+
+        :param expires: when the credentials expire (unix time), capped at `max_age` from now
+        :param password: stored as a salted hash, `get()` must be passed the same password
+        :param values: the credentials to store, must be JSON serializable
+        """
+        now = time.time()
+        latest = now + self.max_age
+        entry = {
+            **values,
+            'created': now,
+            'expires': latest if expires is None else min(expires, latest),
+        }
+        if password is not None:
+            entry['password'] = _hash_password(password)
+
+        entries = self._read()
+        entries[key] = entry
+        # Expired entries are dropped whenever the file is written
+        self._write({k: v for k, v in entries.items() if v['expires'] > now})
+
+    def remove(self, key: str) -> None:
+        entries = self._read()
+        if entries.pop(key, None) is not None:
+            self._write(entries)
+
+    def clear(self) -> None:
+        """Deletes every cached credential"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                contents = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            ASF_LOGGER.warning(f'Ignoring unreadable credential cache "{self.path}": {exc}')
+            return {}
+
+        if not isinstance(contents, dict) or contents.get('version') != _FORMAT_VERSION:
+            return {}
+
+        return contents.get('entries', {})
+
+    def _write(self, entries: Dict[str, Dict]) -> None:
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        # Written to a temporary file and renamed over the cache,
+        # so readers never see a partially written file
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.credentials-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': _FORMAT_VERSION, 'entries': entries}, f)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def get_token_expiration(token: str) -> Optional[float]:
+    """
+    Returns when an EDL bearer token expires (unix time), read from the `exp` claim
+    of its JWT payload. The token is not verified, `None` if it can't be read
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        expiration = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+    except (IndexError, ValueError, AttributeError, TypeError):
+        return None
+
+    return float(expiration) if isinstance(expiration, (int, float)) else None
+
+
+def _hash_password(password: str) -> Dict[str, str]:
+    salt = secrets.token_bytes(16)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, _PASSWORD_ITERATIONS)
+    return {'salt': salt.hex(), 'hash': digest.hex(), 'iterations': _PASSWORD_ITERATIONS}
+
+
+def _verify_password(password: str, stored: Dict[str, str]) -> bool:
+    digest = hashlib.pbkdf2_hmac(
+        'sha256', password.encode('utf-8'), bytes.fromhex(stored['salt']), stored['iterations']
+    )
+    return hmac.compare_digest(digest.hex(), stored['hash'])
+
+
+def _lock_file(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        return
+
+    fh.seek(0)
+    # msvcrt.LK_LOCK gives up after 10 seconds, keep waiting like flock() does
+    while True:
+        try:
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        return
+
+    fh.seek(0)
+    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
@@ -21,10 +21,7 @@ except ImportError:
     fsspec = None
     xr = None
 
-try:
-    from ciso8601 import parse_datetime
-except ImportError:
-    from dateutil.parser import parse as parse_datetime
+from .dates import parse_datetime
 
 
 class Pair:
@@ -8,6 +8,8 @@ class AIRSARProduct(ASFProduct):
     ASF Dataset Overview Page: https://asf.alaska.edu/data-sets/sar-data-sets/airsar/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFProduct._base_properties,
         'frameNumber': {
@@ -12,6 +12,8 @@ class ALOS2Product(ASFStackableProduct):
     ASF Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/alos-palsar/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFStackableProduct._base_properties,
         'frameNumber': {
@@ -11,6 +11,8 @@ class ALOSProduct(ASFStackableProduct):
     ASF Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/alos-palsar/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFStackableProduct._base_properties,
         'frameNumber': {
@@ -11,10 +11,18 @@ from asf_search.CMR.translate import try_parse_float
 from asf_search.constants import PRODUCT_TYPE, DATASET, POLARIZATION, BEAMMODE
 from asf_search import ASFSearchResults
 
-try:
-    from asf_enumeration import aria_s1_gunw
-except ImportError:
-    aria_s1_gunw = None
+
+def _get_aria_s1_gunw():
+    """
+    Imports the optional `asf_enumeration.aria_s1_gunw` module on first use
+    (it loads the full ARIA frame table on import). Returns `None` if not installed
+    """
+    try:
+        from asf_enumeration import aria_s1_gunw
+    except ImportError:
+        return None
+
+    return aria_s1_gunw
 
 
 class ARIAS1GUNWProduct(S1Product):
@@ -25,6 +33,8 @@ class ARIAS1GUNWProduct(S1Product):
         https://asf.alaska.edu/data-sets/derived-data-sets/sentinel-1-interferograms/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **S1Product._base_properties,
         'perpendicularBaseline': {
@@ -76,6 +86,7 @@ class ARIAS1GUNWProduct(S1Product):
 
     @staticmethod
     def get_stack_opts_for_frame(frame_id: int, opts: Optional[ASFSearchOptions] = None) -> Optional[ASFSearchOptions]:
+        aria_s1_gunw = _get_aria_s1_gunw()
         if aria_s1_gunw is None:
             warnings.warn("Failed to import asf-enumeration package. \
                           Make sure it's installed in your current environment to perform stacking with the ARIAS1GUNWProduct type")
@@ -144,6 +155,7 @@ class ARIAS1GUNWProduct(S1Product):
     def get_aria_groups_for_frame(frame: str) -> ASFSearchResults:
         """Returns the sentinel1 acquisitions over a given frame that overlap the aria frame with the given aria frame ID,
         filter products from groups that overlap the frame by < 90%"""
+        aria_s1_gunw = _get_aria_s1_gunw()
         if aria_s1_gunw is None:
             raise ImportError(
             'Could not find asf-enumeration package in current python environment. '
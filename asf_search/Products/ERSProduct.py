@@ -12,6 +12,8 @@ class ERSProduct(ASFStackableProduct):
     ASF ERS-2 Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/ers-2/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFStackableProduct._base_properties,
         'frameNumber': {'path': ['AdditionalAttributes', ('Name', 'FRAME_NUMBER'), 'Values', 0]},
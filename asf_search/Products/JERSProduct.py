@@ -8,6 +8,8 @@ class JERSProduct(ASFStackableProduct):
     ASF Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/jers-1/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFStackableProduct._base_properties,
         'browse': {'path': ['RelatedUrls', ('Type', [('GET RELATED VISUALIZATION', 'URL')])]},
@@ -1,16 +1,19 @@
+import numpy as np
+import shapely
 from shapely import unary_union, multipolygons
-from typing import Dict, Tuple, Union
+from typing import Dict, List, Tuple, Union
 from asf_search import ASFSearchOptions, ASFSession, ASFStackableProduct
 from asf_search.CMR.translate import try_parse_frame_coverage, try_parse_bool, try_parse_int
-from shapely.geometry import shape, MultiPolygon
-from shapely.geometry.base import BaseGeometry
-from shapely.ops import transform
+from asf_search.WKT.footprints import unwrap_coordinates
+from shapely.geometry import MultiPolygon, Polygon
 class NISARProduct(ASFStackableProduct):
     """
     Used for NISAR dataset products
 
     ASF Dataset Documentation Page: https://asf.alaska.edu/nisar/
     """
+
+    __slots__ = ()
     _base_properties = {
         **ASFStackableProduct._base_properties,
         'frameNumber': {
@@ -90,13 +93,11 @@ class NISARProduct(ASFStackableProduct):
             # dateline spanning scenes are stored as multiple polygons in CMR, 
             # we need to unwrap and merge them
             if len(polygons) > 1:
-                polygon_shapes = []
-                for polygon in polygons:
-                    coordinates = [[c['Longitude'], c['Latitude']] for c in polygon['Boundary']['Points']]
-                    geometry = self._get_unwrapped({'coordinates': [coordinates], 'type': 'Polygon'})
+                polygon_shapes = self._get_unwrapped([
+                    Polygon([[c['Longitude'], c['Latitude']] for c in polygon['Boundary']['Points']])
+                    for polygon in polygons
+                ])
 
-                    polygon_shapes.append(geometry)
-                
                 geom = unary_union(multipolygons(polygon_shapes))
 
                 # sometimes the dateline spanning polygons don't overlap properly
@@ -113,14 +114,11 @@ class NISARProduct(ASFStackableProduct):
 
         return geometry
 
-    def _get_unwrapped(self, geometry: dict) -> BaseGeometry:
-        def unwrap_shape(x, y, z=None):
-            x = x if x > 0 else x + 360
-            return tuple([x, y])
-        wrapped = shape(geometry)
-        if wrapped.bounds[0] < 0 or wrapped.bounds[2] < 0:
-            unwrapped = transform(unwrap_shape, wrapped)
-        else:
-            unwrapped = wrapped
-
-        return unwrapped
+    def _get_unwrapped(self, polygons: List[Polygon]) -> np.ndarray:
+        """Unwraps polygons west of the prime meridian (adding 360 to longitudes) in one pass"""
+        polygons = np.array(polygons, dtype=object)
+        bounds = shapely.bounds(polygons)
+        west = (bounds[:, 0] < 0) | (bounds[:, 2] < 0)
+        polygons[west] = shapely.transform(polygons[west], unwrap_coordinates)
+
+        return polygons
@@ -9,6 +9,8 @@ class OPERAS1Product(S1Product):
     ASF Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/opera/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **S1Product._base_properties,
         'centerLat': {'path': []},  # Opera products lacks these fields
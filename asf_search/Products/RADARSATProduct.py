@@ -9,6 +9,8 @@ class RADARSATProduct(ASFStackableProduct):
     ASF Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/radarsat-1/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFStackableProduct._base_properties,
         'faradayRotation': {'path': ['AdditionalAttributes', ('Name', 'FARADAY_ROTATION'), 'Values', 0], 'cast': try_parse_float},
@@ -21,6 +21,8 @@ class S1BurstProduct(S1Product):
         https://asf.alaska.edu/datasets/data-sets/derived-data-sets/sentinel-1-bursts/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **S1Product._base_properties,
         'bytes': {'path': ['AdditionalAttributes', ('Name', 'BYTE_LENGTH'),  'Values', 0]},
@@ -15,6 +15,8 @@ class S1Product(ASFStackableProduct):
     ASF Dataset Overview Page: https://asf.alaska.edu/datasets/daac/sentinel-1/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFStackableProduct._base_properties,
         'frameNumber': {
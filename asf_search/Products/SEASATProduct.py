@@ -8,6 +8,8 @@ class SEASATProduct(ASFProduct):
     ASF Dataset Documentation Page: https://asf.alaska.edu/data-sets/sar-data-sets/seasat/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFProduct._base_properties,
         'md5sum': {'path': ['AdditionalAttributes', ('Name', 'MD5SUM'), 'Values', 0]},
@@ -7,6 +7,8 @@ class SIRCProduct(ASFProduct):
     Dataset Documentation Page: https://eospso.nasa.gov/missions/spaceborne-imaging-radar-c
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFProduct._base_properties,
         'groupID': {'path': ['AdditionalAttributes', ('Name', 'GROUP_ID'), 'Values', 0]},
@@ -8,6 +8,8 @@ class SMAPProduct(ASFProduct):
         https://asf.alaska.edu/data-sets/sar-data-sets/soil-moisture-active-passive-smap-mission/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFProduct._base_properties,
         'groupID': {'path': ['AdditionalAttributes', ('Name', 'GROUP_ID'), 'Values', 0]},
@@ -18,6 +18,8 @@ class TROPOProduct(ASFProduct):
         https://asf.alaska.edu/datasets/data-sets/derived-data-sets/sentinel-1-bursts/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFProduct._base_properties,
         'processingLevel': {
@@ -7,6 +7,8 @@ class UAVSARProduct(ASFProduct):
     ASF Dataset Documentation Page: https://asf.alaska.edu/datasets/daac/uavsar/
     """
 
+    __slots__ = ()
+
     _base_properties = {
         **ASFProduct._base_properties,
         'groupID': {'path': ['AdditionalAttributes', ('Name', 'GROUP_ID'), 'Values', 0]},
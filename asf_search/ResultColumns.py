@@ -0,0 +1,313 @@
+from datetime import timezone
+from numbers import Integral, Real
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+import shapely
+
+from asf_search.CMR.translate import (
+    try_parse_bool,
+    try_parse_date,
+    try_parse_float,
+    try_parse_int,
+    try_round_float,
+)
+from asf_search.dates import parse_datetime
+from asf_search.WKT.footprints import get_footprints
+
+# The column type of properties parsed with each `_base_properties` cast,
+# used even when none of the results have a value for them
+_CAST_KINDS = {
+    try_parse_int: 'int',
+    try_round_float: 'int',
+    try_parse_float: 'float',
+    try_parse_bool: 'bool',
+    try_parse_date: 'date',
+}
+
+
+class ResultColumns:
+    """
+    A typed, column oriented view of search results for fast filtering, sorting and grouping.
+    Each product property becomes one numpy array, built once:
+    Column types follow the product classes' `_base_properties` casts where they have one,
+    otherwise the values present:
+        - dates (`startTime`, `stopTime`...) are `datetime64[ms]` in UTC, `NaT` when missing
+        - integer properties (`pathNumber`, `frameNumber`...) are masked `int64` arrays
+        - float properties (`centerLat`, `centerLon`...) are `float64`, `NaN` when missing
+        - everything else is an object array
+        - `geometry` is the WKB of each product's footprint, built on first access
+
+    `filter()`, `sort_by()` and `groupby()` return new views, `to_results()` maps a view
+    back to its products.
+
+    ``` python
+    columns = results.columns()
+    recent = columns.filter(columns['startTime'] > np.datetime64('2023-01-01'), pathNumber=[64, 65])
+    for (path, frame), group in recent.groupby('pathNumber', 'frameNumber').items():
+        stack = group.sort_by('startTime').to_results()
+    ```
+    """
+
+    def __init__(self, results):
+        """
+        :param results: the `ASFSearchResults` to build columns from
+        """
+        self._results = results
+        self.indices = np.arange(len(results))
+        self._kinds = _get_property_kinds(results.data)
+        # Full length columns shared by every view of the same results
+        self._source = _build_columns(results.data, self._kinds)
+        self._columns = self._source
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            if name == 'geometry' and 'geometry' not in self._source:
+                self._source['geometry'] = shapely.to_wkb(get_footprints(self._results.data))
+
+            self._columns[name] = self._source[name][self.indices]
+
+        return self._columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name == 'geometry' or name in self._source
+
+    def keys(self) -> List[str]:
+        """Returns the names of every column"""
+        return [*[key for key in self._source if key != 'geometry'], 'geometry']
+
+    def filter(self, mask: np.ndarray = None, **conditions) -> 'ResultColumns':
+        """
+        Returns the rows matching a boolean mask and/or column values,
+        masked (missing) values never match.
+
+        :param mask: a boolean array with one value per row,
+            ex: `columns['centerLat'] > 60`
+        :param conditions: column values to match, a list matches any of its values,
+            ex: `pathNumber=[64, 65], flightDirection='ASCENDING'`
+        """
+        keep = np.ones(len(self), dtype=bool)
+        if mask is not None:
+            keep &= np.ma.filled(mask, False)
+
+        for name, value in conditions.items():
+            column = self[name]
+            data = np.ma.getdata(column)
+            if isinstance(value, (list, tuple, set)):
+                matches = np.isin(data, list(value))
+            else:
+                matches = data == value
+
+            keep &= matches & _is_present(column)
+
+        return self._take(np.flatnonzero(keep))
+
+    def sort_by(self, *names: str, reverse: bool = False) -> 'ResultColumns':
+        """
+        Returns the rows sorted by one or more columns, rows with missing values sort last.
+        The sort is stable.
+
+        :param names: the columns to sort by, in order of priority
+        :param reverse: sort in descending order
+        """
+        keys = []
+        for name in names:
+            codes, uniques = _factorize(self[name])
+            if reverse:
+                codes = np.where(codes < len(uniques), len(uniques) - 1 - codes, codes)
+            keys.append(codes)
+
+        # `np.lexsort()` sorts by its last key first
+        return self._take(np.lexsort(keys[::-1]) if keys else np.arange(len(self)))
+
+    def groupby(self, *names: str) -> Dict[Union[Any, Tuple], 'ResultColumns']:
+        """
+        Groups rows by the values of one or more columns, in ascending order of their values.
+
+        :param names: the columns to group by
+        :return: a dictionary of each group's value (or tuple of values when grouping by
+            several columns) to a `ResultColumns` of its rows. Missing values are grouped as `None`
+        """
+        if len(self) == 0:
+            return {}
+
+        group_ids = np.zeros(len(self), dtype=np.int64)
+        values = []
+        for name in names:
+            codes, uniques = _factorize(self[name])
+            group_ids = group_ids * (len(uniques) + 1) + codes
+            values.append((codes, uniques.tolist() + [None]))
+
+        _, first_rows, inverse = np.unique(group_ids, return_index=True, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        splits = np.split(order, np.cumsum(np.bincount(inverse))[:-1])
+
+        groups = {}
+        for row, positions in zip(first_rows, splits):
+            key = tuple(uniques[codes[row]] for codes, uniques in values)
+            groups[key[0] if len(names) == 1 else key] = self._take(positions)
+
+        return groups
+
+    def to_results(self):
+        """Returns the products in this view as `ASFSearchResults`, in row order"""
+        results = self._results.__class__(
+            [self._results.data[idx] for idx in self.indices], opts=self._results.searchOptions
+        )
+        results.searchComplete = self._results.searchComplete
+        return results
+
+    def to_arrow(self) -> 'pa.Table':  # type: ignore # noqa: F821
+        """
+        Returns the columns as a `pyarrow.Table`, with dates as UTC `timestamp[ms]`
+        and `geometry` as WKB binary. Requires the optional `pyarrow` dependency.
+        """
+        # pyarrow takes a while to import, so it's only imported once needed
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                'ResultColumns.to_arrow() requires the optional asf-search dependency pyarrow, '
+                'but it could not be found in the current python environment. '
+                'Enable this method by including the appropriate pip or conda install. '
+                'Ex: `python -m pip install asf-search[arrow]`'
+            )
+
+        arrays = {name: _to_arrow_array(self[name], self._kinds.get(name)) for name in self.keys()}
+        return pa.table(arrays)
+
+    def _take(self, positions: np.ndarray) -> 'ResultColumns':
+        # Columns are sliced from the source on first access
+        view = object.__new__(ResultColumns)
+        view._results = self._results
+        view._kinds = self._kinds
+        view._source = self._source
+        view.indices = self.indices[positions]
+        view._columns = {}
+        return view
+
+
+def _get_property_kinds(products: List) -> Dict[str, str]:
+    """Maps properties to their column type (see `_CAST_KINDS`), from the products' classes"""
+    kinds = {}
+    for product_type in {type(product) for product in products}:
+        for name, mapping in getattr(product_type, '_base_properties', {}).items():
+            kind = _CAST_KINDS.get(mapping.get('cast'))
+            if kind is not None:
+                kinds[name] = kind
+
+    return kinds
+
+
+def _build_columns(products: List, kinds: Dict[str, str]) -> Dict[str, np.ndarray]:
+    names = {}
+    for product in products:
+        names.update(dict.fromkeys(product.properties))
+
+    columns = {}
+    for name in names:
+        values = [product.properties.get(name) for product in products]
+        if kinds.get(name) == 'date':
+            columns[name] = _to_datetime64(values)
+        else:
+            columns[name] = _to_typed_array(values, kinds.get(name))
+
+    return columns
+
+
+def _to_datetime64(values: List[str]) -> np.ndarray:
+    # CMR dates are UTC ("...Z"), which numpy can parse in a single pass
+    if all(isinstance(value, str) and value.endswith('Z') for value in values):
+        try:
+            return np.array([value[:-1] for value in values], dtype='datetime64[ms]')
+        except ValueError:
+            pass
+
+    epochs = np.full(len(values), np.iinfo(np.int64).min, dtype=np.int64)
+    for idx, value in enumerate(values):
+        try:
+            date = parse_datetime(value)
+        except (ValueError, TypeError, OverflowError):
+            continue
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+
+        epochs[idx] = round(date.timestamp() * 1000)
+
+    # The minimum int64 is numpy's NaT
+    return epochs.view('datetime64[ms]')
+
+
+def _to_typed_array(values: List[Any], kind: str = None) -> np.ndarray:
+    present = [value for value in values if value is not None]
+
+    if (len(present) or kind == 'int') and all(_is_int(value) for value in present):
+        missing = [value is None for value in values]
+        data = [0 if value is None else value for value in values]
+        return np.ma.MaskedArray(np.array(data, dtype=np.int64), mask=missing)
+
+    if (len(present) or kind == 'float') and all(_is_real(value) for value in present):
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, Integral) and not isinstance(value, bool)
+
+
+def _is_real(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _factorize(column: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encodes a column as integer codes in the sort order of its values.
+    Missing values get the code `len(uniques)`.
+    """
+    present = _is_present(column)
+    column = np.ma.getdata(column)
+
+    uniques, inverse = np.unique(column[present], return_inverse=True)
+    codes = np.full(len(column), len(uniques), dtype=np.int64)
+    codes[present] = inverse
+    return codes, uniques
+
+
+def _is_present(column: np.ndarray) -> np.ndarray:
+    if np.ma.isMaskedArray(column):
+        return ~np.ma.getmaskarray(column)
+    if column.dtype.kind == 'f':
+        return ~np.isnan(column)
+    if column.dtype.kind == 'M':
+        return ~np.isnat(column)
+
+    return np.array([value is not None for value in column], dtype=bool)
+
+
+def _to_arrow_array(
+    column: np.ndarray, kind: str = None
+) -> 'pa.Array':  # type: ignore # noqa: F821
+    import pyarrow as pa
+
+    if np.ma.isMaskedArray(column):
+        return pa.array(column.data, mask=np.ma.getmaskarray(column))
+
+    if column.dtype.kind == 'M':
+        return pa.array(column, type=pa.timestamp('ms', tz='UTC'), from_pandas=True)
+
+    if column.dtype.kind == 'f':
+        return pa.array(column, from_pandas=True)
+
+    values = column.tolist()
+    try:
+        return pa.array(values, type=pa.bool_() if kind == 'bool' else None)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Properties with mixed value types, stored as their string representation
+        return pa.array([None if value is None else str(value) for value in values])
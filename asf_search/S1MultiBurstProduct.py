@@ -10,10 +10,7 @@ from .search import geo_search, search
 from .ASFSearchResults import ASFSearchResults
 from .baseline import get_baseline_from_stack
 
-try:
-    from ciso8601 import parse_datetime
-except ImportError:
-    from dateutil.parser import parse as parse_datetime
+from .dates import parse_datetime
 
 Subswath = Literal["IW1", "IW2", "IW3"]
 
@@ -12,10 +12,7 @@ from .Stack import Stack
 from .ASFSearchOptions import ASFSearchOptions
 from .ASFSearchResults import ASFSearchResults
 
-try:
-    from ciso8601 import parse_datetime
-except ImportError:
-    from dateutil.parser import parse as parse_datetime
+from .dates import parse_datetime
 
 _SBASNETWORK_PLOT_OPT_DEPS = ['plotly', 'networkx', 'pandas']
 try:
@@ -12,10 +12,7 @@ from .ASFSearchOptions import ASFSearchOptions
 from .ASFSearchResults import ASFSearchResults
 from .warnings import PairNotInFullStackWarning
 
-try:
-    from ciso8601 import parse_datetime
-except ImportError:
-    from dateutil.parser import parse as parse_datetime
+from .dates import parse_datetime
 
 DatePair = Tuple[str, str]
 PairInput = Union[Pair, DatePair]
@@ -0,0 +1,304 @@
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from requests import Response
+
+from asf_search import ASF_LOGGER, instrumentation
+
+# Responses that mean the service wants fewer requests, not that the request was bad
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+class Throttle:
+    """
+    An adaptive (AIMD) limit on concurrent requests to one service, shared by every thread
+    sending them. Searches, counts and downloads go through the throttle for their host,
+    so they run at the highest concurrency the service accepts without tuning worker counts.
+
+    Each successful request raises the limit by `1 / limit` (about one more request in flight
+    per round of requests), as long as the limit is actually in use. A `429` or `503` response
+    multiplies it by `backoff`, at most once per round, and is retried after the response's
+    `Retry-After`. Until then, no new requests are sent to the service at all.
+
+    ``` python
+    throttle = asf_search.get_throttle('https://cmr.earthdata.nasa.gov')
+    print(throttle.metrics())
+    ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        max_retries: int = 5,
+        max_wait: float = 60,
+    ):
+        """
+        :param initial_limit: how many requests can be in flight to start with
+        :param min_limit: the fewest in flight requests the limit backs off to
+        :param max_limit: the most in flight requests the limit grows to
+        :param backoff: what the limit is multiplied by when the service throttles a request
+        :param max_retries: how many times a throttled request is retried before
+            its response is returned as is
+        :param max_wait: the longest wait before retrying a request, in seconds,
+            including ones the service asked for with `Retry-After`
+        """
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self._reset()
+
+    def _reset(self) -> None:
+        self._condition = threading.Condition()
+        self._limit = float(self.initial_limit)
+        self._in_flight = 0
+        # No requests are sent before this (`time.monotonic()`), set from `Retry-After`
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._counters = {
+            'requests': 0,
+            'throttled': 0,
+            'retries': 0,
+            'decreases': 0,
+            'wait_time': 0.0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight"""
+        return int(self._limit)
+
+    def request(self, send: Callable[[], Response], stream: bool = False) -> Response:
+        """
+        Sends a request once there is room for it, retrying it while the service throttles it
+
+        :param send: sends the request, ex: `lambda: session.get(url)`
+        :param stream: keep the request's slot until its response is closed,
+            for responses whose body is read afterwards (`stream=True` downloads)
+
+        :return: the first response that isn't a `429`/`503`,
+            or the last one once `max_retries` is used up
+        """
+        attempt = 0
+        while True:
+            started, saturated = self._acquire()
+            try:
+                response = send()
+            except BaseException:
+                self._release()
+                raise
+
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                if stream:
+                    self._release_on_close(response)
+                else:
+                    self._release()
+                self._on_success(saturated)
+                return response
+
+            self._release()
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self._on_throttle(started, retry_after)
+
+            if attempt >= self.max_retries:
+                return response
+
+            response.close()
+            attempt += 1
+            with self._condition:
+                self._counters['retries'] += 1
+            instrumentation.add_retry()
+
+            ASF_LOGGER.warning(
+                f'Throttled by {response.url} (HTTP {response.status_code}), '
+                f'retrying (attempt {attempt}/{self.max_retries}, limit {self.limit})'
+            )
+
+            # With a Retry-After the whole throttle is paused until then, otherwise back off
+            if retry_after is None:
+                time.sleep(min(self.max_wait, 2 ** (attempt - 1)) * random.uniform(0.5, 1))
+
+    def metrics(self) -> Dict:
+        """
+        A snapshot of the throttle: its current `limit`, requests `in_flight`, and counts of
+        `requests` sent, `throttled` responses, `retries`, limit `decreases`,
+        and the seconds requests spent waiting for room (`wait_time`)
+        """
+        with self._condition:
+            return {
+                'limit': self.limit,
+                'in_flight': self._in_flight,
+                'paused_for': max(0.0, self._paused_until - time.monotonic()),
+                **self._counters,
+            }
+
+    def _acquire(self) -> Tuple[float, bool]:
+        """
+        Waits for room to send a request, which holds it until `_release()`
+
+        :return: when it was sent (`time.monotonic()`), and whether it used the last
+            of the limit, which only then is known to be too low
+        """
+        waited_from = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    self._condition.wait(self._paused_until - now)
+                elif self._in_flight >= self.limit:
+                    self._condition.wait()
+                else:
+                    break
+
+            self._in_flight += 1
+            saturated = self._in_flight >= self.limit
+            self._counters['requests'] += 1
+            self._counters['wait_time'] += now - waited_from
+
+        return now, saturated
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def _release_on_close(self, response: Response) -> None:
+        """Holds the request's slot while its body is read, until the response is closed"""
+        close = response.close
+        released = False
+
+        def release_and_close():
+            nonlocal released
+            try:
+                close()
+            finally:
+                # The condition's lock is reentrant, `_release()` takes it again
+                with self._condition:
+                    if not released:
+                        released = True
+                        self._release()
+
+        response.close = release_and_close
+
+    def _on_success(self, saturated: bool) -> None:
+        if not saturated:
+            return
+
+        with self._condition:
+            previous = self.limit
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            if self.limit > previous:
+                self._condition.notify()
+
+    def _on_throttle(self, started: float, retry_after: Optional[float]) -> None:
+        with self._condition:
+            now = time.monotonic()
+            self._counters['throttled'] += 1
+
+            # Requests sent before the last decrease were sent at the old limit,
+            # their throttled responses are part of the same congestion
+            if started >= self._last_decrease:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                self._last_decrease = now
+                self._counters['decreases'] += 1
+                ASF_LOGGER.info(f'Service is throttling requests, limit lowered to {self.limit}')
+
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + min(retry_after, self.max_wait))
+
+    def __getstate__(self):
+        # Worker processes start with a fresh limit, locks can't be pickled
+        return {
+            name: getattr(self, name)
+            for name in [
+                'initial_limit',
+                'min_limit',
+                'max_limit',
+                'backoff',
+                'max_retries',
+                'max_wait',
+            ]
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+
+_throttles: Dict[str, Throttle] = {}
+_throttles_lock = threading.Lock()
+
+
+def get_throttle(url: str) -> Throttle:
+    """
+    Returns the throttle shared by every request to `url`'s host in this process,
+    created with the default settings on first use
+    """
+    host = urlparse(url).netloc
+    with _throttles_lock:
+        if host not in _throttles:
+            _throttles[host] = Throttle()
+
+        return _throttles[host]
+
+
+def get_throttle_metrics() -> Dict[str, Dict]:
+    """Returns each host's `Throttle.metrics()`, for every host requested so far"""
+    with _throttles_lock:
+        throttles = dict(_throttles)
+
+    return {host: throttle.metrics() for host, throttle in throttles.items()}
+
+
+def get_session_throttle(session, url: str) -> Optional[Throttle]:
+    """
+    Returns the throttle requests to `url` go through: `session.throttle` if it's a `Throttle`,
+    none if it's `False`, otherwise the shared throttle for `url`'s host
+    """
+    throttle = getattr(session, 'throttle', True)
+    if throttle is False or throttle is None:
+        return None
+
+    if not isinstance(throttle, Throttle):
+        throttle = get_throttle(url)
+
+    return throttle
+
+
+def throttled_request(
+    session, url: str, send: Callable[[], Response], stream: bool = False
+) -> Response:
+    """
+    Sends a request through the session's throttle (see `get_session_throttle()`).
+    With `stream`, the response must be closed once read, see `Throttle.request()`
+    """
+    throttle = get_session_throttle(session, url)
+    if throttle is None:
+        return send()
+
+    return throttle.request(send, stream=stream)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Reads a `Retry-After` header, either seconds or an HTTP date, as seconds from now"""
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -1,2 +1,3 @@
 from .validate_wkt import validate_wkt  # noqa: F401
 from .RepairEntry import RepairEntry  # noqa: F401
+from .tile_aoi import tile_aoi  # noqa: F401
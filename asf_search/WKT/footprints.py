@@ -0,0 +1,193 @@
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import shapely
+import shapely.affinity
+from shapely import wkt
+from shapely.geometry import shape
+from shapely.geometry.base import BaseGeometry
+
+# STRtree.query() tests `predicate(aoi, footprint)`,
+# these are named for the footprint's relationship to the aoi instead
+_QUERY_PREDICATES = {
+    'intersects': 'intersects',
+    'covers': 'covered_by',
+    'covered_by': 'covers',
+}
+
+
+def get_footprints(products: Iterable) -> np.ndarray:
+    """
+    Builds the footprints of products as an array of shapely geometries.
+
+    Single ring polygons (nearly every CMR footprint) are built in one vectorized pass
+    from their coordinates, anything else is converted individually. Footprints are cached
+    on each product until its `geometry` changes, so later calls only build new ones.
+
+    :param products: the products to get the footprints of, ex: an `ASFSearchResults`
+    :return: a numpy object array of shapely geometries,
+    `None` for products without a footprint
+    """
+    products = list(products)
+    footprints = np.full(len(products), None, dtype=object)
+
+    rings, ring_indices, built = [], [], []
+    for idx, product in enumerate(products):
+        footprint = getattr(product, '_footprint', None)
+        if footprint is not None:
+            footprints[idx] = footprint
+            continue
+
+        geometry_type, coordinates = _get_coordinates(product)
+        if coordinates is None:
+            continue
+
+        if (
+            geometry_type == 'Polygon'
+            and isinstance(coordinates, np.ndarray)
+            and coordinates.ndim == 3
+            and coordinates.shape[0] == 1
+            and coordinates.shape[1] > 3
+        ):
+            rings.append(coordinates[0, :, :2])
+            ring_indices.append(idx)
+        else:
+            try:
+                footprints[idx] = shape(product.geometry)
+            except (ValueError, TypeError, AttributeError, shapely.errors.GEOSException):
+                continue
+        built.append(idx)
+
+    if len(rings):
+        coords = np.concatenate(rings)
+        indices = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+        footprints[ring_indices] = shapely.polygons(shapely.linearrings(coords, indices=indices))
+
+    for idx in built:
+        try:
+            products[idx]._footprint = footprints[idx]
+        except AttributeError:
+            pass
+
+    return footprints
+
+
+def _get_coordinates(product):
+    # `ASFProduct` keeps its coordinates as float64 arrays, anything else is read from `geometry`
+    if hasattr(product, '_coordinates'):
+        return product._geometry_type, product._coordinates
+
+    geometry = product.geometry
+    if not geometry or geometry.get('coordinates') is None:
+        return None, None
+
+    coordinates = geometry['coordinates']
+    try:
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+    except (ValueError, TypeError):
+        pass
+
+    return geometry.get('type'), coordinates
+
+
+def unwrap_footprints(footprints: np.ndarray) -> np.ndarray:
+    """
+    Shifts footprints crossing the antimeridian (spanning more than 180 degrees of longitude)
+    to continuous longitudes, adding 360 to every longitude that isn't positive.
+    Other footprints are returned as they are.
+
+    :param footprints: array of footprint geometries, see `get_footprints()`
+    :return: a new array of the unwrapped footprints
+    """
+    footprints = np.asarray(footprints, dtype=object)
+    unwrapped = footprints.copy()
+
+    bounds = shapely.bounds(footprints)
+    with np.errstate(invalid='ignore'):
+        crossing = bounds[:, 2] - bounds[:, 0] > 180
+
+    if crossing.any():
+        unwrapped[crossing] = shapely.transform(footprints[crossing], unwrap_coordinates)
+
+    return unwrapped
+
+
+def unwrap_coordinates(coordinates: np.ndarray) -> np.ndarray:
+    """Adds 360 to every longitude that isn't positive, for use with `shapely.transform()`"""
+    coordinates = coordinates.copy()
+    coordinates[:, 0] = np.where(coordinates[:, 0] > 0, coordinates[:, 0], coordinates[:, 0] + 360)
+    return coordinates
+
+
+def get_centroids(products: Iterable) -> np.ndarray:
+    """
+    Finds the centroids of products' footprints, in one vectorized pass.
+    A polygon's centroid is that of its exterior ring, footprints crossing the antimeridian
+    are unwrapped first (see `unwrap_footprints()`), so their centroid longitude can exceed 180.
+
+    :param products: the products to get the centroids of, ex: an `ASFSearchResults`
+    :return: a numpy object array of shapely Points, `None` for products without a footprint
+    """
+    footprints = get_footprints(products)
+
+    polygons = shapely.get_type_id(footprints) == shapely.GeometryType.POLYGON
+    outlines = footprints.copy()
+    outlines[polygons] = shapely.polygons(shapely.get_exterior_ring(footprints[polygons]))
+
+    return shapely.centroid(unwrap_footprints(outlines))
+
+
+def filter_footprints(
+    footprints: np.ndarray,
+    aoi: Union[str, BaseGeometry],
+    predicate: str = 'intersects',
+    min_overlap: Optional[float] = None,
+    keep_missing: bool = False,
+) -> np.ndarray:
+    """
+    Finds the footprints matching a spatial predicate against an area of interest,
+    using a shapely `STRtree` over all of the footprints at once. Footprints crossing the
+    antimeridian are unwrapped first (see `unwrap_footprints()`) and also compared
+    against the aoi shifted 360 degrees east.
+
+    :param footprints: array of footprint geometries, see `get_footprints()`
+    :param aoi: the WKT string or Shapely Geometry to filter against
+    :param predicate: how a footprint must relate to the aoi, one of
+        - `intersects`: the footprint and aoi share any area
+        - `covers`: the footprint covers the entire aoi
+        - `covered_by`: the footprint lies entirely inside the aoi
+    :param min_overlap: the minimum fraction of a footprint's area which must lie within the aoi
+    :param keep_missing: also match missing footprints (`None`), which can't be ruled out
+
+    :return: sorted array of the indices of the matching footprints
+    """
+    if predicate not in _QUERY_PREDICATES:
+        raise ValueError(
+            f'Invalid spatial predicate "{predicate}", expected one of {list(_QUERY_PREDICATES)}'
+        )
+
+    if isinstance(aoi, str):
+        aoi = wkt.loads(aoi)
+
+    footprints = unwrap_footprints(footprints)
+    aois = [aoi]
+    with np.errstate(invalid='ignore'):
+        if (shapely.bounds(footprints)[:, 2] > 180).any():
+            aois.append(shapely.affinity.translate(aoi, xoff=360))
+
+    tree = shapely.STRtree(footprints)
+    indices = np.unique(
+        np.concatenate([tree.query(area, predicate=_QUERY_PREDICATES[predicate]) for area in aois])
+    )
+
+    if min_overlap is not None and len(indices):
+        candidates = footprints[indices]
+        aoi = shapely.union_all(aois)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overlap = shapely.area(shapely.intersection(candidates, aoi)) / shapely.area(candidates)
+        indices = indices[overlap >= min_overlap]
+
+    if keep_missing:
+        indices = np.union1d(indices, np.flatnonzero(shapely.is_missing(footprints)))
+
+    return indices
@@ -0,0 +1,86 @@
+from typing import List, Union
+
+from shapely import wkt
+from shapely.geometry import MultiPolygon, Polygon, box
+from shapely.geometry.base import BaseGeometry
+
+
+def tile_aoi(
+    aoi: Union[str, BaseGeometry], max_tiles: int = 16, min_fill: float = 0.8
+) -> List[BaseGeometry]:
+    """
+    Splits a polygonal area of interest into tiles that are each well approximated by
+    their convex hull, which is what CMR is searched with (see `validate_wkt()`).
+
+    Of the tiles covering less than `min_fill` of their convex hull, the one with the most
+    area between it and its convex hull is repeatedly split into quadrants of its bounding
+    box, until every tile covers at least `min_fill` of its convex hull, or splitting again
+    would exceed `max_tiles`.
+
+    :param aoi: the WKT string or Shapely Geometry to tile
+    :param max_tiles: the maximum number of tiles to return
+    :param min_fill: the fraction of its convex hull a tile should cover to stop splitting it
+
+    :return: a list of polygonal geometries covering the area of interest.
+    Non-polygonal geometries are returned as-is, as a single tile.
+    """
+    if isinstance(aoi, str):
+        aoi = wkt.loads(aoi)
+
+    if not isinstance(aoi, (Polygon, MultiPolygon)) or aoi.area == 0:
+        return [aoi]
+
+    tiles = [aoi]
+    while len(tiles) + 3 <= max_tiles:
+        unfilled = [
+            i for i, tile in enumerate(tiles) if tile.area < min_fill * tile.convex_hull.area
+        ]
+        if len(unfilled) == 0:
+            break
+
+        idx = max(unfilled, key=lambda i: _get_wasted_area(tiles[i]))
+        tiles[idx : idx + 1] = _split_quadrants(tiles[idx])
+
+    return tiles
+
+
+def _get_wasted_area(tile: BaseGeometry) -> float:
+    return tile.convex_hull.area - tile.area
+
+
+def _split_quadrants(tile: BaseGeometry) -> List[BaseGeometry]:
+    min_x, min_y, max_x, max_y = tile.bounds
+    mid_x, mid_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+
+    quadrants = [
+        box(min_x, min_y, mid_x, mid_y),
+        box(mid_x, min_y, max_x, mid_y),
+        box(min_x, mid_y, mid_x, max_y),
+        box(mid_x, mid_y, max_x, max_y),
+    ]
+
+    output = []
+    for quadrant in quadrants:
+        part = _get_polygonal(tile.intersection(quadrant))
+        if part is not None:
+            output.append(part)
+
+    return output
+
+
+def _get_polygonal(shape: BaseGeometry) -> Union[BaseGeometry, None]:
+    """Drops any points or lines left over from clipping, which have no area to search"""
+    if isinstance(shape, (Polygon, MultiPolygon)):
+        return None if shape.is_empty else shape
+
+    polygons = []
+    for part in getattr(shape, 'geoms', []):
+        if isinstance(part, Polygon) and not part.is_empty:
+            polygons.append(part)
+        elif isinstance(part, MultiPolygon):
+            polygons.extend(part.geoms)
+
+    if len(polygons) == 0:
+        return None
+
+    return polygons[0] if len(polygons) == 1 else MultiPolygon(polygons)
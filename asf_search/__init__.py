@@ -1,4 +1,5 @@
 from importlib.metadata import PackageNotFoundError, version
+import sys
 
 ## Setup logging now, so it's available if __version__ fails:
 import logging
@@ -28,12 +29,9 @@ ASF_LOGGER = logging.getLogger(__name__)
 # imports us, if they want logging.
 ASF_LOGGER.addHandler(logging.NullHandler())
 
-from .ASFSession import ASFSession  # noqa: F401, E402
-from .ASFProduct import ASFProduct  # noqa: F401 E402
-from .ASFStackableProduct import ASFStackableProduct  # noqa: F401 E402
-from .ASFSearchResults import ASFSearchResults  # noqa: F401 E402
-from .ASFSearchOptions import ASFSearchOptions, validators  # noqa: F401 E402
-from .Products import *  # noqa: F403 F401 E402
+import types  # noqa: E402
+from importlib import import_module  # noqa: E402
+
 from .exceptions import *  # noqa: F403 F401 E402
 from .constants import (  # noqa: F401 E402
     BEAMMODE,  # noqa: F401 E402
@@ -47,18 +45,206 @@ from .constants import (  # noqa: F401 E402
     RANGE_BANDWIDTH,  # noqa: F401 E402,
     PRODUCTION_CONFIGURATION,  # noqa: F401 E402
 )
-from .health import *  # noqa: F403 F401 E402
-from .search import *  # noqa: F403 F401 E402
-from .download import *  # noqa: F403 F401 E402
-from .CMR import *  # noqa: F403 F401 E402
-from .baseline import *  # noqa: F403 F401 E402
-from .WKT import validate_wkt  # noqa: F401 E402
-from .export import *  # noqa: F403 F401 E402
-from .Pair import Pair  # noqa:  F401 E402
-from .Stack import *  # noqa:  F403 F401 E402
-from .SBASNetwork import * # noqa: F403 F401 E402
-from .S1MultiBurstProduct import * # noqa: F403 F401 E402
-from . import utils # noqa: F401, E402
 
 REPORT_ERRORS = True
 """Enables automatic search error reporting to ASF, send any questions to uso@asf.alaska.edu"""
+
+# Everything below is resolved on first attribute access (PEP 562) instead of at import time.
+# Maps each public name to the module it lives in, and the attribute to read from that module
+# (`None` for names that refer to the (sub)module itself)
+_lazy_attributes = {
+    'ASFSession': ('.ASFSession', 'ASFSession'),
+    'CredentialCache': ('.CredentialCache', 'CredentialCache'),
+    'Throttle': ('.Throttle', 'Throttle'),
+    'get_throttle': ('.Throttle', 'get_throttle'),
+    'get_throttle_metrics': ('.Throttle', 'get_throttle_metrics'),
+    'ASFProduct': ('.ASFProduct', 'ASFProduct'),
+    'ASFStackableProduct': ('.ASFStackableProduct', 'ASFStackableProduct'),
+    'ASFSearchResults': ('.ASFSearchResults', 'ASFSearchResults'),
+    'ResultColumns': ('.ResultColumns', 'ResultColumns'),
+    'ASFSearchOptions': ('.ASFSearchOptions', 'ASFSearchOptions'),
+    'validators': ('.ASFSearchOptions', 'validators'),
+    # Products
+    'S1Product': ('.Products', 'S1Product'),
+    'ALOSProduct': ('.Products', 'ALOSProduct'),
+    'RADARSATProduct': ('.Products', 'RADARSATProduct'),
+    'AIRSARProduct': ('.Products', 'AIRSARProduct'),
+    'ERSProduct': ('.Products', 'ERSProduct'),
+    'JERSProduct': ('.Products', 'JERSProduct'),
+    'UAVSARProduct': ('.Products', 'UAVSARProduct'),
+    'SIRCProduct': ('.Products', 'SIRCProduct'),
+    'SEASATProduct': ('.Products', 'SEASATProduct'),
+    'SMAPProduct': ('.Products', 'SMAPProduct'),
+    'S1BurstProduct': ('.Products', 'S1BurstProduct'),
+    'OPERAS1Product': ('.Products', 'OPERAS1Product'),
+    'ARIAS1GUNWProduct': ('.Products', 'ARIAS1GUNWProduct'),
+    'NISARProduct': ('.Products', 'NISARProduct'),
+    'ALOS2Product': ('.Products', 'ALOS2Product'),
+    'TROPOProduct': ('.Products', 'TROPOProduct'),
+    # health
+    'health': ('.health', 'health'),
+    # search
+    'search': ('.search', 'search'),
+    'granule_search': ('.search', 'granule_search'),
+    'product_search': ('.search', 'product_search'),
+    'geo_search': ('.search', 'geo_search'),
+    'stack_from_id': ('.search', 'stack_from_id'),
+    'campaigns': ('.search', 'campaigns'),
+    'search_count': ('.search', 'search_count'),
+    'explain': ('.search', 'explain'),
+    'sharded_search': ('.search', 'sharded_search'),
+    'tiled_search': ('.search', 'tiled_search'),
+    'search_generator': ('.search', 'search_generator'),
+    'preprocess_opts': ('.search', 'preprocess_opts'),
+    'get_searchable_attributes': ('.search', 'get_searchable_attributes'),
+    'flush_error_reports': ('.search', 'flush_error_reports'),
+    # download
+    'download_urls': ('.download', 'download_urls'),
+    'download_url': ('.download', 'download_url'),
+    'remotezip': ('.download', 'remotezip'),
+    'download_bursts': ('.download', 'download_bursts'),
+    'FileDownloadType': ('.download', 'FileDownloadType'),
+    # CMR
+    'get_campaigns': ('.CMR', 'get_campaigns'),
+    'CollectionMetadataCache': ('.CMR', 'CollectionMetadataCache'),
+    'get_collection_cache': ('.CMR', 'get_collection_cache'),
+    'set_collection_cache': ('.CMR', 'set_collection_cache'),
+    'get_collection_metadata': ('.CMR', 'get_collection_metadata'),
+    'prewarm_collection_metadata': ('.CMR', 'prewarm_collection_metadata'),
+    'build_subqueries': ('.CMR', 'build_subqueries'),
+    'translate_opts': ('.CMR', 'translate_opts'),
+    'field_map': ('.CMR', 'field_map'),
+    'dataset_collections': ('.CMR', 'dataset_collections'),
+    'collections_per_platform': ('.CMR', 'collections_per_platform'),
+    'collections_by_processing_level': ('.CMR', 'collections_by_processing_level'),
+    'get_concept_id_alias': ('.CMR', 'get_concept_id_alias'),
+    'get_dataset_concept_ids': ('.CMR', 'get_dataset_concept_ids'),
+    # baseline
+    'calculate_perpendicular_baselines': ('.baseline', 'calculate_perpendicular_baselines'),
+    'calculate_temporal_baselines': ('.baseline', 'calculate_temporal_baselines'),
+    'get_baseline_from_stack': ('.baseline', 'get_baseline_from_stack'),
+    'find_new_reference': ('.baseline', 'find_new_reference'),
+    'check_reference': ('.baseline', 'check_reference'),
+    'offset_perpendicular_baselines': ('.baseline', 'offset_perpendicular_baselines'),
+    'get_granule_position': ('.baseline', 'get_granule_position'),
+    'get_along_beam_vector': ('.baseline', 'get_along_beam_vector'),
+    'get_up_beam_vector': ('.baseline', 'get_up_beam_vector'),
+    'get_paired_granule_baseline': ('.baseline', 'get_paired_granule_baseline'),
+    'get_shared_sv_time': ('.baseline', 'get_shared_sv_time'),
+    'get_pos_at_rel_time': ('.baseline', 'get_pos_at_rel_time'),
+    'get_vel_at_rel_time': ('.baseline', 'get_vel_at_rel_time'),
+    'interpolate': ('.baseline', 'interpolate'),
+    'radius_fix': ('.baseline', 'radius_fix'),
+    'parse_datetime': ('.dates', 'parse_datetime'),
+    # WKT
+    'validate_wkt': ('.WKT', 'validate_wkt'),
+    'tile_aoi': ('.WKT', 'tile_aoi'),
+    # export
+    'ASFSearchResults_to_properties_list': ('.export', 'ASFSearchResults_to_properties_list'),
+    'results_to_csv': ('.export', 'results_to_csv'),
+    'results_to_metalink': ('.export', 'results_to_metalink'),
+    'results_to_kml': ('.export', 'results_to_kml'),
+    'results_to_jsonlite': ('.export', 'results_to_jsonlite'),
+    'results_to_jsonlite2': ('.export', 'results_to_jsonlite2'),
+    'results_to_geojson': ('.export', 'results_to_geojson'),
+    'results_to_json': ('.export', 'results_to_json'),
+    'results_to_geojsonseq': ('.export', 'results_to_geojsonseq'),
+    'results_to_geoparquet': ('.export', 'results_to_geoparquet'),
+    'export_stream': ('.export', 'export_stream'),
+    'results_to_file': ('.export', 'results_to_file'),
+    'encode_pages': ('.export', 'encode_pages'),
+    'results_to_ipc': ('.export', 'results_to_ipc'),
+    'results_from_ipc': ('.export', 'results_from_ipc'),
+    # Pair, Stack, SBASNetwork, S1MultiBurstProduct
+    'Pair': ('.Pair', 'Pair'),
+    'Stack': ('.Stack', 'Stack'),
+    'SceneIDPair': ('.Stack', 'SceneIDPair'),
+    'DatePair': ('.Stack', 'DatePair'),
+    'PairInput': ('.Stack', 'PairInput'),
+    'PairNotInFullStackWarning': ('.warnings', 'PairNotInFullStackWarning'),
+    'get_existing_pair_from_dates': ('.Stack', 'get_existing_pair_from_dates'),
+    'SBASNetwork': ('.SBASNetwork', 'SBASNetwork'),
+    'S1MultiBurstSceneIDPair': ('.SBASNetwork', 'S1MultiBurstSceneIDPair'),
+    'get_n_colors': ('.SBASNetwork', 'get_n_colors'),
+    'build_node_products': ('.SBASNetwork', 'build_node_products'),
+    'add_digraph_nodes': ('.SBASNetwork', 'add_digraph_nodes'),
+    'get_node_positions': ('.SBASNetwork', 'get_node_positions'),
+    'get_pair_lists_date_range': ('.SBASNetwork', 'get_pair_lists_date_range'),
+    'julian_to_month_day': ('.SBASNetwork', 'julian_to_month_day'),
+    'S1MultiBurst': ('.S1MultiBurstProduct', 'S1MultiBurst'),
+    'S1MultiBurstGroup': ('.S1MultiBurstProduct', 'S1MultiBurstGroup'),
+    'S1MultiBurstProduct': ('.S1MultiBurstProduct', 'S1MultiBurstProduct'),
+    'Subswath': ('.S1MultiBurstProduct', 'Subswath'),
+    # subpackages
+    'CMR': ('.CMR', None),
+    'Products': ('.Products', None),
+    'WKT': ('.WKT', None),
+    'baseline': ('.baseline', None),
+    'download': ('.download', None),
+    'export': ('.export', None),
+    'instrumentation': ('.instrumentation', None),
+    'utils': ('.utils', None),
+    # submodules that used to be reachable from the package, ex: `asf_search.baseline_search`
+    'MissionList': ('.CMR.MissionList', None),
+    'datasets': ('.CMR.datasets', None),
+    'subquery': ('.CMR.subquery', None),
+    'translate': ('.CMR.translate', None),
+    'calc': ('.baseline.calc', None),
+    'stack': ('.baseline.stack', None),
+    'file_download_type': ('.download.file_download_type', None),
+    'export_translators': ('.export.export_translators', None),
+    'csv': ('.export.csv', None),
+    'geojson': ('.export.geojson', None),
+    'json': ('.export.json', None),
+    'jsonlite': ('.export.jsonlite', None),
+    'jsonlite2': ('.export.jsonlite2', None),
+    'kml': ('.export.kml', None),
+    'metalink': ('.export.metalink', None),
+    'baseline_search': ('.search.baseline_search', None),
+    'collection_attributes': ('.search.collection_attributes', None),
+    'error_reporting': ('.search.error_reporting', None),
+}
+
+__all__ = sorted(
+    {name for name in globals() if not name.startswith('_')}
+    - {'logging', 'sys', 'types', 'import_module', 'version', 'PackageNotFoundError'}
+    | set(_lazy_attributes)
+)
+
+
+def __getattr__(name: str):
+    # Only names in the table are resolved, anything else (including probes for dunder names
+    # like `__wrapped__`) fails right away without importing any submodules
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module_name, attribute = _lazy_attributes[name]
+    module = import_module(module_name, __name__)
+    # May raise AttributeError while `module` is still initializing (circular imports),
+    # in which case `from asf_search import X` falls back to the submodule, same as before
+    value = module if attribute is None else getattr(module, attribute)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # The import system binds every loaded submodule onto its parent package.
+        # Several public names share their submodule's name (`ASFSession`, `search`, `Pair`...),
+        # so don't let the submodule shadow the class/function it exports
+        if (
+            isinstance(value, types.ModuleType)
+            and value.__name__ == f'{__name__}.{name}'
+            and _lazy_attributes.get(name, (None, None))[1] is not None
+        ):
+            return
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
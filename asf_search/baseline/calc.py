@@ -4,10 +4,7 @@ from typing import List
 
 import numpy as np
 
-try:
-    from ciso8601 import parse_datetime
-except ImportError:
-    from dateutil.parser import parse as parse_datetime
+from asf_search.dates import to_epoch
 
 # WGS84 constants
 a = 6378137
@@ -35,19 +32,17 @@ def calculate_perpendicular_baselines(reference: str, stack: List[ASFProduct]):
                 baselineProperties["noStateVectors"] = True
                 continue
 
-            asc_node_time = parse_datetime(
-                baselineProperties["ascendingNodeTime"]
-            ).timestamp()
+            asc_node_time = to_epoch(baselineProperties["ascendingNodeTime"])
 
-            start = parse_datetime(product.properties["startTime"]).timestamp()
-            end = parse_datetime(product.properties["stopTime"]).timestamp()
+            start = to_epoch(product.properties["startTime"])
+            end = to_epoch(product.properties["stopTime"])
             center = start + ((end - start) / 2)
             baselineProperties["relative_start_time"] = start - asc_node_time
             baselineProperties["relative_center_time"] = center - asc_node_time
             baselineProperties["relative_end_time"] = end - asc_node_time
 
-            t_pre = parse_datetime(positionProperties["prePositionTime"]).timestamp()
-            t_post = parse_datetime(positionProperties["postPositionTime"]).timestamp()
+            t_pre = to_epoch(positionProperties["prePositionTime"])
+            t_post = to_epoch(positionProperties["postPositionTime"])
             product.baseline["relative_sv_pre_time"] = t_pre - asc_node_time
             product.baseline["relative_sv_post_time"] = t_post - asc_node_time
 
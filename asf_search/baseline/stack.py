@@ -3,10 +3,7 @@ from typing import Tuple, List, Union
 import pytz
 from .calc import calculate_perpendicular_baselines
 
-try:
-    from ciso8601 import parse_datetime
-except ImportError:
-    from dateutil.parser import parse as parse_datetime
+from asf_search.dates import parse_datetime
 
 def get_baseline_from_stack(
     reference: ASFProduct, stack: ASFSearchResults
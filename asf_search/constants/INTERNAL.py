@@ -20,3 +20,4 @@ AUTH_DOMAINS = ['asf.alaska.edu', 'earthdata.nasa.gov'] #, 'earthdatacloud.nasa.
 AUTH_COOKIES = ['urs_user_already_logged', 'uat_urs_user_already_logged', 'asf-urs']
 
 ERROR_REPORTING_ENDPOINT = 'search-error-report.asf.alaska.edu'
+ERROR_REPORTING_TIMEOUT = 10
@@ -0,0 +1,100 @@
+"""
+Shared date parsing for asf-search.
+
+Strict ISO-8601 timestamps (everything CMR returns, and most user input) take a fast path through
+`ciso8601` (when installed) or `datetime.fromisoformat()`. Only natural language input like
+"3 weeks ago" goes through `dateparser`, which is slow to import and is only loaded when needed.
+
+Parsed values are memoized, so a timestamp shared by products, pairs, stacks
+and exports is only parsed once.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+import re
+from typing import Dict, Optional
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    _parse_iso8601 = None
+
+_CACHE_SIZE = 65536
+
+# Complete calendar dates, with optional time and UTC offset.
+# Partial dates ("2021-05") are left to dateparser, which fills in missing fields differently
+_ISO_8601_PATTERN = re.compile(
+    r'^\d{4}-\d{2}-\d{2}'
+    r'(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}(?::?\d{2})?)?)?$',
+    re.IGNORECASE,
+)
+
+
+def _fromisoformat(value: str) -> datetime:
+    # datetime.fromisoformat() only accepts a trailing "Z" starting in python 3.11
+    if value[-1] in 'Zz':
+        value = f'{value[:-1]}+00:00'
+
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_iso8601(value: str) -> datetime:
+    """
+    Parses a strict ISO-8601 timestamp. Naive timestamps are returned as naive datetimes.
+
+    :param value: the timestamp to parse, ex: `2021-05-01T12:30:00Z`
+    :raises ValueError: if the value is not an ISO-8601 timestamp
+    """
+    if _ISO_8601_PATTERN.match(value) is None:
+        raise ValueError(f'Not an ISO-8601 timestamp: "{value}"')
+
+    if _parse_iso8601 is not None:
+        return _parse_iso8601(value)
+
+    return _fromisoformat(value)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_datetime(value: str) -> datetime:
+    """
+    Parses a timestamp from CMR or an ASFProduct's properties,
+    falling back to `dateutil` for anything that isn't ISO-8601
+
+    :raises ValueError: if the value can't be parsed
+    """
+    try:
+        return parse_iso8601(value)
+    except ValueError:
+        from dateutil.parser import parse
+
+        return parse(value)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def to_epoch(value: str) -> float:
+    """Returns the POSIX timestamp of a date string, see `parse_datetime()`"""
+    return parse_datetime(value).timestamp()
+
+
+def parse_user_date(value: str, settings: Optional[Dict] = None) -> Optional[datetime]:
+    """
+    Parses user provided date input, which can be either a timestamp
+    or natural language such as "3 weeks ago"
+
+    :param value: the date string to parse
+    :param settings: optional `dateparser` settings, used for natural language input.
+        If `RETURN_AS_TIMEZONE_AWARE` is set, naive ISO-8601 timestamps are returned in UTC
+    :return: the parsed datetime, or `None` if it couldn't be parsed
+    """
+    try:
+        date = parse_iso8601(value.strip())
+    except ValueError:
+        import dateparser
+
+        return dateparser.parse(value, settings=settings)
+
+    if settings is not None and settings.get('RETURN_AS_TIMEZONE_AWARE') and date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return date
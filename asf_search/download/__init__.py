@@ -1,2 +1,3 @@
 from .download import download_urls, download_url, remotezip  # noqa: F401
 from .file_download_type import FileDownloadType  # noqa: F401
+from .burst_download import download_bursts  # noqa: F401
@@ -0,0 +1,192 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import heapq
+import os.path
+import random
+import statistics
+import time
+from typing import Iterable, Optional
+import warnings
+
+from asf_search import ASF_LOGGER, ASFSession, instrumentation
+from asf_search.download.download import _get_response, _is_burst_processing, _write_response
+from asf_search.download.file_download_type import FileDownloadType
+from asf_search.exceptions import ASFDownloadError
+from asf_search.Throttle import parse_retry_after
+
+
+@dataclass
+class _DownloadTask:
+    url: str
+    file_path: str
+    session: ASFSession
+    # When the file was first requested (`time.monotonic()`), and how often it's been polled since
+    requested: Optional[float] = None
+    polls: int = 0
+
+
+def download_bursts(
+    products: Iterable,
+    path: str,
+    session: ASFSession = None,
+    fileType=FileDownloadType.DEFAULT_FILE,
+    max_in_flight: int = 8,
+    timeout: float = 300,
+    poll_interval: float = 1,
+    max_poll_interval: float = 15,
+) -> None:
+    """
+    Downloads many products concurrently, built for on-demand SLC-BURST extraction.
+
+    Burst files are extracted when first requested, answering `202 Accepted` until they're ready
+    (https://sentinel1-burst-docs.asf.alaska.edu/). `download()` waits on each burst in turn,
+    here every file is requested up front so extractions run side by side, pending files are
+    polled with backoff, and each file is streamed to disk as soon as it's ready.
+    Downloading many bursts takes about as long as the slowest extraction, instead of their sum.
+
+    ``` python
+    bursts = asf_search.search(processingLevel='BURST', fullBurstID='064_136231_IW2', maxResults=50)
+    asf_search.download_bursts(bursts, path='./bursts', session=session)
+    ```
+
+    :param products: the products to download, any `ASFProduct` works
+    :param path: the directory to save files to
+    :param session: the session to download with, defaults to each product's own session
+    :param fileType: which of each product's files to download, see `FileDownloadType`
+    :param max_in_flight: the most requests (polls and downloads) running at once
+    :param timeout: seconds to wait for a file's extraction before giving up on it
+    :param poll_interval: seconds before the first poll of a pending file, growing 1.5x per poll
+    :param max_poll_interval: the longest wait between polls of a pending file
+
+    :raises ASFDownloadError: after every other file is downloaded,
+        if any of them failed or timed out
+    """
+    if not os.path.isdir(path):
+        raise ASFDownloadError(f'Error downloading bursts: directory not found: {path}')
+
+    tasks = []
+    for product in products:
+        for url, filename in product._get_download_targets(fileType=fileType):
+            file_path = os.path.join(path, filename)
+            if os.path.isfile(file_path):
+                warnings.warn(f'File already exists, skipping download: {file_path}')
+                continue
+
+            tasks.append(_DownloadTask(url, file_path, product.session if session is None else session))
+
+    ASF_LOGGER.info(f'Downloading {len(tasks)} files with up to {max_in_flight} requests at once')
+
+    # (when the task is due, task index), every file is due immediately to start its extraction
+    scheduled = [(0.0, idx) for idx in range(len(tasks))]
+    extraction_times = []
+    failures = {}
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        running = {}
+        while len(scheduled) or len(running):
+            now = time.monotonic()
+            while len(scheduled) and len(running) < max_in_flight and scheduled[0][0] <= now:
+                _, idx = heapq.heappop(scheduled)
+                task = tasks[idx]
+                if task.requested is None:
+                    task.requested = now
+
+                future = executor.submit(_request_file, task.session, task.url, task.file_path)
+                running[future] = idx
+
+            if not len(running):
+                time.sleep(max(0.0, scheduled[0][0] - now))
+                continue
+
+            # Wake up for the next due poll, unless there's no room to start it anyway
+            wait_timeout = None
+            if len(scheduled) and len(running) < max_in_flight:
+                wait_timeout = max(0.0, scheduled[0][0] - now)
+
+            done, _ = wait(running, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                idx = running.pop(future)
+                task = tasks[idx]
+                now = time.monotonic()
+
+                try:
+                    retry_after = future.result()
+                except Exception as exc:
+                    ASF_LOGGER.error(f'Failed to download {task.url}: {exc}')
+                    failures[task.url] = exc
+                    continue
+
+                elapsed = now - task.requested
+                if retry_after is None:
+                    ASF_LOGGER.info(f'Downloaded {task.file_path} after {elapsed:.1f} seconds')
+                    if task.polls:
+                        extraction_times.append(elapsed)
+                    continue
+
+                if elapsed >= timeout:
+                    failures[task.url] = ASFDownloadError(
+                        f'Timed out after {elapsed:.0f} seconds waiting for {task.url} to be extracted'
+                    )
+                    continue
+
+                task.polls += 1
+                delay = _get_poll_delay(
+                    task,
+                    elapsed,
+                    retry_after,
+                    statistics.median(extraction_times) if len(extraction_times) else None,
+                    poll_interval,
+                    max_poll_interval,
+                )
+                heapq.heappush(scheduled, (now + delay, idx))
+
+    if len(failures):
+        raise ASFDownloadError(
+            f'Failed to download {len(failures)} of {len(tasks)} files: '
+            + '; '.join(f'{url}: {exc}' for url, exc in failures.items())
+        )
+
+
+def _request_file(session: ASFSession, url: str, file_path: str) -> Optional[float]:
+    """
+    Requests a file, streaming it to `file_path` if it's ready.
+
+    :return: `None` once downloaded, otherwise the seconds the server asked
+        to wait before polling again (0 if it didn't say)
+    """
+    with instrumentation.span('download.file', url=url) as event:
+        response = _get_response(session=session, url=url)
+        if event is not None:
+            event.status = response.status_code
+
+        if _is_burst_processing(response):
+            response.close()
+            return parse_retry_after(response.headers.get('Retry-After')) or 0.0
+
+        written = _write_response(response, file_path)
+        if event is not None:
+            event.bytes = written
+
+    return None
+
+
+def _get_poll_delay(
+    task: _DownloadTask,
+    elapsed: float,
+    retry_after: float,
+    typical_extraction: Optional[float],
+    poll_interval: float,
+    max_poll_interval: float,
+) -> float:
+    delay = poll_interval * 1.5 ** (task.polls - 1)
+
+    # No point polling well before files like it have been ready
+    if typical_extraction is not None:
+        delay = max(delay, typical_extraction - elapsed)
+
+    delay = min(max(delay, retry_after), max_poll_interval)
+
+    # Jittered, so files requested together don't keep polling in lockstep
+    return delay * random.uniform(0.9, 1.1)
+
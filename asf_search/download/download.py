@@ -7,7 +7,8 @@ from requests.exceptions import HTTPError
 import warnings
 
 from asf_search.exceptions import ASFAuthenticationError, ASFDownloadError
-from asf_search import ASFSession
+from asf_search import ASFSession, instrumentation
+from asf_search.Throttle import throttled_request
 from tenacity import retry, stop_after_delay, retry_if_result, wait_fixed
 
 try:
@@ -69,11 +70,27 @@ def download_url(url: str, path: str, filename: str = None, session: ASFSession
     if session is None:
         session = ASFSession()
 
-    response = _try_get_response(session=session, url=url)
+    with instrumentation.span('download.file', url=url) as event:
+        response = _try_get_response(session=session, url=url)
+        written = _write_response(response, os.path.join(path, filename))
 
-    with open(os.path.join(path, filename), 'wb') as f:
+        if event is not None:
+            event.status = response.status_code
+            event.bytes = written
+
+
+def _write_response(response: Response, file_path: str) -> int:
+    """
+    Streams a response to `file_path`, returning the number of bytes written.
+    The response is closed afterwards, freeing its throttle slot
+    """
+    written = 0
+    with response, open(file_path, 'wb') as f:
         for chunk in response.iter_content(chunk_size=8192):
             f.write(chunk)
+            written += len(chunk)
+
+    return written
 
 
 def remotezip(url: str, session: ASFSession) -> 'RemoteZip':  # type: ignore # noqa: F821
@@ -115,15 +132,34 @@ def _is_burst_processing(response: Response):
     retry=retry_if_result(_is_burst_processing),
     wait=wait_fixed(1),
     stop=stop_after_delay(90),
+    before_sleep=lambda retry_state: instrumentation.add_retry(),
 )
 def _try_get_response(session: ASFSession, url: str):
-    response = session.get(url, stream=True, hooks={'response': strip_auth_if_aws})
+    response = _get_response(session=session, url=url)
+    if _is_burst_processing(response):
+        response.close()
+
+    return response
+
+
+def _get_response(session: ASFSession, url: str) -> Response:
+    """
+    Requests a file once, raising on errors. Processing bursts return a 202.
+    The response holds a throttle slot until it's closed, ex: by `_write_response()`
+    """
+    response = throttled_request(
+        session,
+        url,
+        lambda: session.get(url, stream=True, hooks={'response': strip_auth_if_aws}),
+        stream=True,
+    )
 
     try:
         response.raise_for_status()
     except HTTPError as e:
-        if 400 <= response.status_code <= 499:
-            raise ASFAuthenticationError(f'HTTP {e.response.status_code}: {e.response.text}')
+        with response:
+            if 400 <= response.status_code <= 499:
+                raise ASFAuthenticationError(f'HTTP {e.response.status_code}: {e.response.text}')
 
         raise e
 
@@ -14,6 +14,10 @@ class ASFSearch5xxError(ASFSearchError):
     """Raise when CMR returns a 5xx error"""
 
 
+class ASFSearchThrottledError(ASFSearch5xxError):
+    """Raise when CMR still throttles a request (`503`) after the session's throttle retried it"""
+
+
 class ASFBaselineError(ASFSearchError):
     """Raise when baseline related errors occur"""
 
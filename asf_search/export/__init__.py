@@ -6,3 +6,8 @@ from .jsonlite import results_to_jsonlite  # noqa: F401
 from .jsonlite2 import results_to_jsonlite2  # noqa: F401
 from .geojson import results_to_geojson  # noqa: F401
 from .json import results_to_json   # noqa: F401
+from .geojsonseq import results_to_geojsonseq  # noqa: F401
+from .geoparquet import results_to_geoparquet  # noqa: F401
+from .writers import export_stream, results_to_file  # noqa: F401
+from .parallel import encode_pages  # noqa: F401
+from .ipc import results_from_ipc, results_to_ipc  # noqa: F401
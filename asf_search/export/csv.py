@@ -1,10 +1,14 @@
 import csv
+import io
 import os
 from types import GeneratorType
 from urllib import parse
 from asf_search import ASF_LOGGER
 
-from asf_search.export.export_translators import ASFSearchResults_to_properties_list
+from asf_search.export.export_translators import (
+    ASFSearchResults_to_properties_list,
+    get_umm_field,
+)
 import inspect
 
 extra_csv_fields = [
@@ -106,7 +110,7 @@ class CSVStreamArray(list):
     def get_additional_output_fields(self, product):
         additional_fields = {}
         for key, path in extra_csv_fields:
-            additional_fields[key] = product.umm_get(product.umm, *path)
+            additional_fields[key] = get_umm_field(product, path)
 
         return additional_fields
 
@@ -130,6 +134,38 @@ class CSVStreamArray(list):
 
         ASF_LOGGER.info('Finished streaming csv results')
 
+    def streamChunks(self):
+        """Streams the csv one page at a time, instead of one row at a time"""
+        yield self.encodeHeader()
+
+        completed = False
+        for page_idx, page in enumerate(self.pages):
+            ASF_LOGGER.info(f'Streaming {len(page)} products from page {page_idx}')
+            completed = page.searchComplete
+
+            yield self.encodePage(page)
+
+        if not completed:
+            ASF_LOGGER.warn('Failed to download all results from CMR')
+
+        ASF_LOGGER.info('Finished streaming csv results')
+
+    def encodeHeader(self) -> str:
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, quoting=csv.QUOTE_ALL, fieldnames=fieldnames).writeheader()
+        return buffer.getvalue()
+
+    def encodePage(self, page) -> str:
+        """Encodes one page of results as csv rows, without the header"""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, quoting=csv.QUOTE_ALL, fieldnames=fieldnames)
+
+        properties_list = ASFSearchResults_to_properties_list(
+            page, self.get_additional_output_fields
+        )
+        writer.writerows([self.getItem(p) for p in properties_list])
+        return buffer.getvalue()
+
     def getItem(self, p):
         if p.get('sizeMB') is None and p.get('platform') == 'NISAR':
             if isinstance(p.get('bytes'), dict):
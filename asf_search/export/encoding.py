@@ -0,0 +1,56 @@
+import json
+from typing import Generator, Iterable, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Without `indent` (and `sort_keys`), `json` encodes with its C accelerated encoder
+_compact_encoder = json.JSONEncoder(separators=(',', ':'))
+
+
+def encode_compact(value) -> str:
+    """
+    Encodes a value as compact JSON, using `orjson` when it's installed.
+    Values `orjson` can't encode (ex: integers wider than 64 bits) fall back to `json`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except (orjson.JSONEncodeError, TypeError):
+            pass
+
+    return _compact_encoder.encode(value)
+
+
+def iterencode_pages(prefix: str, pages: Iterable[List], suffix: str) -> Generator[str, None, None]:
+    """
+    Streams a JSON array of items as compact JSON, one chunk per page of items.
+
+    :param prefix: the JSON before the array's first item, ex: `'{"results":['`
+    :param pages: an iterable of lists of JSON serializable items
+    :param suffix: the JSON after the array's last item, ex: `']}'`
+    """
+    yield prefix
+
+    first = True
+    for page in pages:
+        if len(page) == 0:
+            continue
+
+        # Encoding the page as a list, then dropping its brackets,
+        # keeps the per-item work inside the encoder
+        chunk = encode_compact(page)[1:-1]
+        yield chunk if first else f',{chunk}'
+        first = False
+
+    yield suffix
+
+
+def decode_compact(data: bytes):
+    """Decodes JSON, using `orjson` when it's installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -1,42 +1,155 @@
 from types import FunctionType
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
-from asf_search import ASFSearchResults
+import shapely
+from shapely.geometry import shape
+from shapely.ops import transform
+
+from asf_search.WKT.footprints import get_footprints, unwrap_footprints
+
+# S1 date properties are formatted differently from other platforms
+_S1_PLATFORMS = {'SENTINEL-1', 'SENTINEL-1B', 'SENTINEL-1A', 'SENTINEL-1C', 'SENTINEL-1D'}
 
 
 # ASFProduct.properties don't have every property required of certain output formats,
 # This grabs the missing properties from ASFProduct.umm required by the given format
 def ASFSearchResults_to_properties_list(
-    results: ASFSearchResults, get_additional_fields: FunctionType
-):
+    results: 'ASFSearchResults', get_additional_fields: FunctionType  # type: ignore # noqa: F821
+) -> List[Dict]:
+    """
+    Prepares each product for export, as its properties merged with the format's additional
+    fields, with dates formatted to match SearchAPI output formats.
+
+    Formatted properties and UMM lookups (see `get_umm_field()`) are cached on each product,
+    so exporting the same results to several formats only prepares each product once.
+    """
     property_list = []
 
     for product in results:
+        properties = get_export_properties(product)
         additional_fields = get_additional_fields(product)
-        properties = {**product.properties, **additional_fields}
+        properties = {
+            **properties,
+            **_format_dates(additional_fields, _get_export_cache(product)['is_S1']),
+        }
         property_list.append(properties)
 
+    return property_list
+
+
+def get_umm_field(product, path: Sequence) -> Any:
+    """
+    Reads a value from a product's UMM (see `ASFProduct.umm_get()`),
+    cached on the product for every export format reading the same path
+
+    :param product: the `ASFProduct` to read from
+    :param path: the path to the value, ex: `['AdditionalAttributes', ('Name', 'DOPPLER'), 'Values', 0]`
+    """
+    fields = _get_export_cache(product)['umm_fields']
+    key = tuple(path)
+    if key not in fields:
+        fields[key] = product.umm_get(product.umm, *path)
+
+    return fields[key]
+
+
+def get_export_properties(product) -> Dict:
+    """
+    Returns a product's properties with dates formatted for export.
+    The result is cached on the product until its properties change, and must not be modified.
+    """
+    prepared = _get_export_cache(product)
+    if prepared['source'] != product.properties:
+        platform = product.properties.get('platform')
+        prepared['is_S1'] = platform is not None and platform.upper() in _S1_PLATFORMS
+        prepared['source'] = dict(product.properties)
+        prepared['properties'] = _format_dates(product.properties, prepared['is_S1'])
+
+    return prepared['properties']
+
+
+def _get_export_cache(product) -> Dict:
+    prepared = getattr(product, '_export_cache', None)
+    if prepared is None:
+        prepared = {'source': None, 'properties': None, 'is_S1': False, 'umm_fields': {}}
+        product._export_cache = prepared
+
+    return prepared
+
+
+def _format_dates(properties: Dict, is_S1: bool) -> Dict:
     # Format dates to match format used by SearchAPI output formats
-    for product in property_list:
-        # S1 date properties are formatted differently from other platforms
-        platform = product.get('platform')
-        if platform is None:
-            platform = ''
-        is_S1 = platform.upper() in [
-            'SENTINEL-1',
-            'SENTINEL-1B',
-            'SENTINEL-1A',
-            'SENTINEL-1C',
-            'SENTINEL-1D',
-        ]
-        for key, data in product.items():
-            if ('date' in key.lower() or 'time' in key.lower()) and data is not None:
-                if not is_S1:
-                    # Remove trailing zeroes from miliseconds, add Z
-                    if len(data.split('.')) == 2:
-                        d = len(data.split('.')[0])
-                        data = data[:d] + 'Z'
-                    time = datetime.strptime(data, '%Y-%m-%dT%H:%M:%SZ')
-                    product[key] = time.strftime('%Y-%m-%dT%H:%M:%SZ')
+    if is_S1:
+        return dict(properties)
 
-    return property_list
+    return {
+        key: _format_date(data) if data is not None and _is_date_key(key) else data
+        for key, data in properties.items()
+    }
+
+
+@lru_cache(maxsize=1024)
+def _is_date_key(key: str) -> bool:
+    return 'date' in key.lower() or 'time' in key.lower()
+
+
+@lru_cache(maxsize=65536)
+def _format_date(data: str) -> str:
+    # Remove trailing zeroes from miliseconds, add Z
+    if len(data.split('.')) == 2:
+        d = len(data.split('.')[0])
+        data = data[:d] + 'Z'
+    time = datetime.strptime(data, '%Y-%m-%dT%H:%M:%SZ')
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def unwrap_shape(x, y, z=None):
+    x = x if x > 0 else x + 360
+    return tuple([x, y])
+
+
+def get_page_wkts(products: Sequence) -> List[Tuple[str, str]]:
+    """
+    Returns the WKT of each product's footprint and of the same footprint unwrapped across
+    the antimeridian (see `get_wkts()`), built for every product in one vectorized pass
+    from the footprints cached on the products (see `asf_search.WKT.footprints`)
+    """
+    footprints = get_footprints(products)
+    wrapped = shapely.to_wkt(footprints, rounding_precision=-1)
+    unwrapped = shapely.to_wkt(unwrap_footprints(footprints), rounding_precision=-1)
+
+    return [
+        (wrapped[idx], unwrapped[idx]) if footprints[idx] is not None else get_wkts(product.geometry)
+        for idx, product in enumerate(products)
+    ]
+
+
+def get_wkts(geometry) -> Tuple[str, str]:
+    """
+    Returns the WKT of a geojson geometry, and of the same geometry unwrapped across
+    the antimeridian. Memoized, since every json format needs them for the same footprints.
+    """
+    return _get_wkts(geometry['type'], _freeze(geometry['coordinates']))
+
+
+@lru_cache(maxsize=65536)
+def _get_wkts(geometry_type: str, coordinates: Tuple) -> Tuple[str, str]:
+    wrapped = shape({'type': geometry_type, 'coordinates': coordinates})
+
+    min_lon, max_lon = (wrapped.bounds[0], wrapped.bounds[2])
+
+    if max_lon - min_lon > 180:
+        unwrapped = transform(unwrap_shape, wrapped)
+    else:
+        unwrapped = wrapped
+
+    return wrapped.wkt, unwrapped.wkt
+
+
+def _freeze(coordinates):
+    if isinstance(coordinates, (list, tuple)):
+        return tuple(_freeze(value) for value in coordinates)
+
+    return coordinates
@@ -3,9 +3,14 @@ import json
 from types import GeneratorType
 
 from asf_search import ASF_LOGGER
+from asf_search.export.encoding import iterencode_pages
 
 
-def results_to_geojson(results):
+def results_to_geojson(results, compact: bool = False):
+    """
+    :param compact: encode without indentation or sorted keys, one chunk per page,
+        using `orjson` when installed. The output is the same JSON, several times faster
+    """
     ASF_LOGGER.info('started translating results to geojson format')
 
     if not inspect.isgeneratorfunction(results) and not isinstance(results, GeneratorType):
@@ -13,6 +18,12 @@ def results_to_geojson(results):
 
     streamer = GeoJSONStreamArray(results)
 
+    if compact:
+        yield from iterencode_pages(
+            '{"type":"FeatureCollection","features":[', streamer.streamPages(), ']}'
+        )
+        return
+
     for p in json.JSONEncoder(indent=2, sort_keys=True).iterencode(
         {'type': 'FeatureCollection', 'features': streamer}
     ):
@@ -34,17 +45,24 @@ class GeoJSONStreamArray(list):
         return self.len
 
     def streamDicts(self):
+        for page in self.streamPages():
+            yield from page
+
+    def streamPages(self):
         completed = False
         for page_idx, page in enumerate(self.results):
             ASF_LOGGER.info(f'Streaming {len(page)} products from page {page_idx}')
             completed = page.searchComplete
 
-            yield from [self.getItem(p) for p in page if p is not None]
+            yield self.getPageItems(page)
 
         if not completed:
             ASF_LOGGER.warn('Failed to download all results from CMR')
 
         ASF_LOGGER.info('Finished streaming geojson results')
 
+    def getPageItems(self, page):
+        return [self.getItem(p) for p in page if p is not None]
+
     def getItem(self, p):
         return p.geojson()
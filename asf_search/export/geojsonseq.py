@@ -0,0 +1,54 @@
+import inspect
+from types import GeneratorType
+
+from asf_search import ASF_LOGGER
+from asf_search.export.encoding import encode_compact
+
+# RFC 8142 GeoJSON Text Sequences start every record with an ASCII record separator
+_RECORD_SEPARATOR = '\x1e'
+
+
+def results_to_geojsonseq(results, rfc8142: bool = False):
+    """
+    Streams search results as newline-delimited GeoJSON, one compact `Feature` per line
+    (encoded with `orjson` when installed).
+
+    Unlike `results_to_geojson()` there is no enclosing `FeatureCollection`, so the output
+    can be consumed line by line as it's written, appended to across runs,
+    and split on line boundaries for parallel readers.
+
+    ``` python
+    with open('catalog.geojsonl', 'a') as f:
+        f.writelines(asf_search.results_to_geojsonseq(asf_search.search_generator(**opts)))
+    ```
+
+    :param results: `ASFSearchResults`, or a generator of pages from `search_generator()`
+    :param rfc8142: prefix each feature with the ASCII record separator (`0x1E`), making the
+        output an RFC 8142 GeoJSON Text Sequence (`application/geo+json-seq`)
+        instead of newline-delimited GeoJSON
+
+    :return: a generator of text chunks, one per page, each holding one line per product
+    """
+    ASF_LOGGER.info('started translating results to geojsonseq format')
+
+    if not inspect.isgeneratorfunction(results) and not isinstance(results, GeneratorType):
+        results = [results]
+
+    prefix = _RECORD_SEPARATOR if rfc8142 else ''
+
+    completed = False
+    for page_idx, page in enumerate(results):
+        ASF_LOGGER.info(f'Streaming {len(page)} products from page {page_idx}')
+        completed = page.searchComplete
+
+        yield encode_geojsonseq_page(page, prefix)
+
+    if not completed:
+        ASF_LOGGER.warning('Failed to download all results from CMR')
+
+    ASF_LOGGER.info('Finished streaming geojsonseq results')
+
+
+def encode_geojsonseq_page(page, prefix: str = '') -> str:
+    """Encodes one page of results as newline-delimited GeoJSON"""
+    return ''.join([f'{prefix}{encode_compact(p.geojson())}\n' for p in page if p is not None])
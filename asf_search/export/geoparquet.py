@@ -0,0 +1,195 @@
+import inspect
+import json
+import os
+import tempfile
+from types import GeneratorType
+
+from asf_search import ASF_LOGGER
+from asf_search.ResultColumns import ResultColumns
+
+# https://geoparquet.org/releases/v1.0.0/, no "crs" means OGC:CRS84 (lon/lat)
+_GEOPARQUET_METADATA = {
+    'version': '1.0.0',
+    'primary_column': 'geometry',
+    'columns': {'geometry': {'encoding': 'WKB', 'geometry_types': []}},
+}
+
+
+def results_to_geoparquet(results, path: str, compression: str = 'zstd') -> None:
+    """
+    Writes search results to a GeoParquet file, with product properties as typed columns
+    and footprints as WKB `geometry`. Requires the optional `pyarrow` dependency.
+
+    Pages from `search_generator()` are written as they arrive, one row group per page,
+    so the whole catalog never needs to be held in memory. Column types come from the
+    product classes' property casts (see `ResultColumns`), and are unified across pages:
+    when a later page adds properties or needs a wider type (ex: a column without values
+    so far), the row groups already written are rewritten with the new schema.
+    The file is written to a temporary file next to `path`, and moved there once complete.
+
+    :param results: `ASFSearchResults`, or a generator of pages from `search_generator()`
+    :param path: the file to write
+    :param compression: the parquet compression codec, ex: `zstd`, `snappy`, `none`
+    """
+    # pyarrow takes a while to import, so it's only imported once needed
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            'results_to_geoparquet() requires the optional asf-search dependency pyarrow, '
+            'but it could not be found in the current python environment. '
+            'Enable this method by including the appropriate pip or conda install. '
+            'Ex: `python -m pip install asf-search[arrow]`'
+        )
+
+    ASF_LOGGER.info('started translating results to geoparquet format')
+
+    if not inspect.isgeneratorfunction(results) and not isinstance(results, GeneratorType):
+        results = [results]
+
+    writer = None
+    completed = False
+    try:
+        for page_idx, page in enumerate(results):
+            completed = page.searchComplete
+            if len(page) == 0:
+                continue
+
+            ASF_LOGGER.info(f'Writing {len(page)} products from page {page_idx}')
+            table = ResultColumns(page).to_arrow()
+
+            if writer is None:
+                writer = _open_writer(path, _get_schema(table.schema), compression)
+            else:
+                schema = _unify_schemas(writer.schema, table.schema)
+                if not schema.equals(writer.schema):
+                    writer = _rewrite(writer, path, schema, compression)
+
+            writer.write_table(_align_table(table, writer.schema), row_group_size=len(table))
+
+        if writer is None:
+            # No results, still write a valid (empty) file
+            schema = _get_schema(pa.schema([('geometry', pa.binary())]))
+            writer = _open_writer(path, schema, compression)
+
+        writer.close()
+        os.replace(writer.where, path)
+    except BaseException:
+        if writer is not None:
+            _discard(writer)
+        raise
+
+    if not completed:
+        ASF_LOGGER.warning('Failed to download all results from CMR')
+
+    ASF_LOGGER.info('Finished writing geoparquet results')
+
+
+def _open_writer(
+    path: str, schema: 'pa.Schema', compression: str  # type: ignore # noqa: F821
+) -> 'pq.ParquetWriter':  # type: ignore # noqa: F821
+    """Opens a writer to a new temporary file next to `path`, see `ParquetWriter.where`"""
+    import pyarrow.parquet as pq
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix='.geoparquet-', suffix='.tmp'
+    )
+    os.close(fd)
+    return pq.ParquetWriter(temp_path, schema, compression=compression)
+
+
+def _rewrite(
+    writer: 'pq.ParquetWriter',  # type: ignore # noqa: F821
+    path: str,
+    schema: 'pa.Schema',  # type: ignore # noqa: F821
+    compression: str,
+) -> 'pq.ParquetWriter':  # type: ignore # noqa: F821
+    """Copies the row groups written so far to a new file with `schema`, one at a time"""
+    import pyarrow.parquet as pq
+
+    ASF_LOGGER.info('Page properties changed, rewriting geoparquet row groups with a new schema')
+    writer.close()
+
+    rewritten = _open_writer(path, schema, compression)
+    try:
+        with pq.ParquetFile(writer.where) as written:
+            for idx in range(written.num_row_groups):
+                table = written.read_row_group(idx)
+                rewritten.write_table(_align_table(table, schema), row_group_size=len(table))
+    except BaseException:
+        _discard(rewritten)
+        raise
+    finally:
+        _discard(writer)
+
+    return rewritten
+
+
+def _discard(writer: 'pq.ParquetWriter') -> None:  # type: ignore # noqa: F821
+    """Closes a writer and deletes its file"""
+    writer.close()
+    if os.path.exists(writer.where):
+        os.remove(writer.where)
+
+
+def _get_schema(schema: 'pa.Schema') -> 'pa.Schema':  # type: ignore # noqa: F821
+    import pyarrow as pa
+
+    # Keeps `geometry` as the last column, after properties added by later pages
+    fields = [field for field in schema if field.name != 'geometry']
+    fields.append(pa.field('geometry', pa.binary()))
+
+    return pa.schema(fields, metadata={'geo': json.dumps(_GEOPARQUET_METADATA)})
+
+
+def _unify_schemas(
+    schema: 'pa.Schema', other: 'pa.Schema'  # type: ignore # noqa: F821
+) -> 'pa.Schema':  # type: ignore # noqa: F821
+    """
+    Merges the file's schema with a page's, widening types where they differ
+    (ex: `null` or `int64` to `float64`). Types that can't be merged are stored as strings
+    """
+    import pyarrow as pa
+
+    types = {field.name: field.type for field in schema}
+    for field in other:
+        current = types.get(field.name)
+        if current is None or current == field.type:
+            types[field.name] = field.type
+            continue
+
+        try:
+            unified = pa.unify_schemas(
+                [pa.schema([field.with_type(current)]), pa.schema([field])],
+                promote_options='permissive',
+            )
+            types[field.name] = unified.field(0).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            types[field.name] = pa.string()
+
+    return _get_schema(pa.schema(list(types.items())))
+
+
+def _align_table(table: 'pa.Table', schema: 'pa.Schema') -> 'pa.Table':  # type: ignore # noqa: F821
+    """Matches a page's columns to the file's schema, which includes all of them"""
+    import pyarrow as pa
+
+    columns = []
+    for field in schema:
+        if field.name not in table.column_names:
+            columns.append(pa.nulls(table.num_rows, type=field.type))
+            continue
+
+        column = table.column(field.name)
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                values = column.to_pylist()
+                column = pa.array(
+                    [None if value is None else str(value) for value in values], type=field.type
+                )
+
+        columns.append(column)
+
+    return pa.Table.from_arrays(columns, schema=schema)
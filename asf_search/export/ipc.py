@@ -0,0 +1,208 @@
+import json
+from typing import Dict, List, Optional
+
+from asf_search import ASF_LOGGER, ASFSearchOptions, ASFSession
+from asf_search.export.encoding import decode_compact, encode_compact
+
+# Stored in the schema metadata, bump `FORMAT_VERSION` whenever the layout changes
+FORMAT_NAME = 'asf_search.ASFSearchResults'
+FORMAT_VERSION = 1
+
+# Each product's dictionaries are stored as compact JSON
+_JSON_COLUMNS = ['properties', 'geometry', 'meta', 'baseline', 'umm']
+
+
+def results_to_ipc(
+    results, path: str, include_umm: bool = True, compression: Optional[str] = None
+) -> None:
+    """
+    Saves search results to a versioned Arrow IPC file, one row per product.
+    Unlike `geojson()`, products keep their subclass, `meta`, `baseline` state vectors and
+    (by default) `umm`, and are restored without re-translating the UMM or pickling
+    their `ASFSession`. Requires the optional `pyarrow` dependency.
+
+    Uncompressed files can be memory mapped by `results_from_ipc()`, so several processes
+    can share one large file and each decode only the products it needs.
+
+    :param results: the `ASFSearchResults` to save
+    :param path: the file to write
+    :param include_umm: store each product's `umm`. Without it, files are several times smaller,
+        but restored products can't use methods that read the UMM (ex: `find_urls()`, exports)
+    :param compression: the IPC buffer compression, `lz4` or `zstd`. Compressed files are
+        smaller, but have to be decompressed when read
+    """
+    pa = _import_pyarrow('results_to_ipc()')
+
+    columns = {name: [] for name in ['type', *_JSON_COLUMNS]}
+    for product in results:
+        columns['type'].append(product.get_classname())
+        columns['properties'].append(encode_compact(product.properties).encode('utf-8'))
+        columns['geometry'].append(encode_compact(product.geometry).encode('utf-8'))
+        columns['meta'].append(_encode_optional(product.meta))
+        columns['baseline'].append(_encode_optional(product.baseline))
+        columns['umm'].append(_encode_optional(product.umm) if include_umm else None)
+
+    metadata = {
+        'format': FORMAT_NAME,
+        'version': str(FORMAT_VERSION),
+        'searchComplete': json.dumps(results.searchComplete),
+        'searchOptions': json.dumps(_get_saved_options(results.searchOptions)),
+    }
+
+    arrays = [pa.array(columns['type'], type=pa.string()).dictionary_encode()]
+    arrays.extend(pa.array(columns[name], type=pa.binary()) for name in _JSON_COLUMNS)
+    table = pa.Table.from_arrays(arrays, names=['type', *_JSON_COLUMNS], metadata=metadata)
+
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+    ASF_LOGGER.info(f'Saved {len(table)} products to "{path}"')
+
+
+def results_from_ipc(
+    path: str,
+    start: int = 0,
+    stop: Optional[int] = None,
+    session: Optional[ASFSession] = None,
+    memory_map: bool = True,
+):
+    """
+    Loads search results saved by `results_to_ipc()`, restoring each product as its
+    original `ASFProduct` subclass. Requires the optional `pyarrow` dependency.
+
+    :param path: the file to read
+    :param start: the index of the first product to load
+    :param stop: the index after the last product to load, defaults to the end of the file.
+        With `start`, lets worker processes load only their share of a large file
+    :param session: the session for the loaded products, defaults to a new `ASFSession`
+    :param memory_map: memory map the file instead of reading it, so only the pages
+        holding the requested products are read and the OS shares them between processes
+
+    :return: `ASFSearchResults` with the saved `searchOptions` and `searchComplete`
+    """
+    pa = _import_pyarrow('results_from_ipc()')
+    # Imported here, `ASFProduct` and `ASFSearchResults` import the export formats
+    from asf_search.ASFProduct import ASFProduct
+    from asf_search.ASFSearchResults import ASFSearchResults
+
+    source = pa.memory_map(path, 'r') if memory_map else pa.OSFile(path, 'rb')
+    with source:
+        table = pa.ipc.open_file(source).read_all()
+        metadata = _read_metadata(table.schema, path)
+
+        if stop is None or stop > len(table):
+            stop = len(table)
+        start = min(max(start, 0), stop)
+        table = table.slice(start, stop - start)
+
+        columns = {name: _decode_column(table.column(name).to_pylist()) for name in _JSON_COLUMNS}
+        types = table.column('type').to_pylist()
+
+    if session is None:
+        session = ASFSession()
+
+    product_types = _get_product_types(ASFProduct)
+    products = []
+    for idx, type_name in enumerate(types):
+        product_type = product_types.get(type_name)
+        if product_type is None:
+            ASF_LOGGER.warning(f'Unknown product type "{type_name}", loading as ASFProduct')
+            product_type = ASFProduct
+
+        # Skips `__init__()`, the saved properties are already translated
+        product = product_type.__new__(product_type)
+        product.properties = columns['properties'][idx]
+        product.geometry = columns['geometry'][idx]
+        product.meta = columns['meta'][idx]
+        product.baseline = columns['baseline'][idx]
+        product.umm = columns['umm'][idx]
+        product.session = session
+        products.append(product)
+
+    opts = json.loads(metadata[b'searchOptions'])
+    results = ASFSearchResults(
+        products, opts=ASFSearchOptions(**opts, session=session) if opts is not None else None
+    )
+    results.searchComplete = json.loads(metadata[b'searchComplete'])
+
+    return results
+
+
+def _get_saved_options(opts: Optional[ASFSearchOptions]) -> Optional[Dict]:
+    if opts is None:
+        return None
+
+    saved = {}
+    for key, value in dict(opts).items():
+        # The session (and its credentials) is never written to disk,
+        # loaded results use the session passed to `results_from_ipc()`
+        if key == 'session':
+            continue
+
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            ASF_LOGGER.warning(f'Not saving search option "{key}", it is not JSON serializable')
+            continue
+
+        saved[key] = value
+
+    return saved
+
+
+def _read_metadata(schema, path: str) -> Dict[bytes, bytes]:
+    metadata = schema.metadata or {}
+    if metadata.get(b'format') != FORMAT_NAME.encode('utf-8'):
+        raise ValueError(f'"{path}" was not written by results_to_ipc()')
+
+    version = int(metadata[b'version'])
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f'"{path}" uses version {version} of the results format, but this version of '
+            f'asf-search only reads up to version {FORMAT_VERSION}. Upgrade asf-search to read it'
+        )
+
+    return metadata
+
+
+def _get_product_types(base) -> Dict[str, type]:
+    """Every loaded `ASFProduct` subclass by name, including ones defined outside asf-search"""
+    import asf_search.Products  # noqa: F401 registers the built in subclasses
+
+    product_types = {}
+    pending = [base]
+    while len(pending):
+        product_type = pending.pop()
+        product_types.setdefault(product_type.get_classname(), product_type)
+        pending.extend(product_type.__subclasses__())
+
+    return product_types
+
+
+def _encode_optional(value) -> Optional[bytes]:
+    return None if value is None else encode_compact(value).encode('utf-8')
+
+
+def _decode_column(values: List[Optional[bytes]]) -> List:
+    # Decoded as one JSON array instead of once per product,
+    # so the restored dictionaries share one copy of each key
+    return decode_compact(
+        b'[' + b','.join(b'null' if value is None else value for value in values) + b']'
+    )
+
+
+def _import_pyarrow(method: str):
+    """Imports pyarrow once it's needed, it takes a while to import"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            f'{method} requires the optional asf-search dependency pyarrow, '
+            'but it could not be found in the current python environment. '
+            'Enable this method by including the appropriate pip or conda install. '
+            'Ex: `python -m pip install asf-search[arrow]`'
+        )
+
+    return pyarrow
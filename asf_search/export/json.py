@@ -2,12 +2,16 @@ import inspect
 import json
 import re
 from types import GeneratorType
-from typing import Tuple
-from shapely.geometry import shape
-from shapely.ops import transform
 
 from asf_search import ASF_LOGGER
-from asf_search.export.export_translators import ASFSearchResults_to_properties_list
+from asf_search.export.export_translators import (
+    ASFSearchResults_to_properties_list,
+    get_umm_field,
+    get_page_wkts,
+    get_wkts,
+    unwrap_shape,  # noqa: F401
+)
+from asf_search.export.encoding import iterencode_pages
 
 extra_json_fields = [
     (
@@ -69,9 +73,16 @@ extra_json_fields = [
 ]
 
 
-def results_to_json(results):
+def results_to_json(results, compact: bool = False):
+    """
+    :param compact: encode without indentation or sorted keys, one chunk per page,
+        using `orjson` when installed. The output is the same JSON, several times faster
+    """
     ASF_LOGGER.info('started translating results to json format')
-    if len(results) == 0:
+    if not isinstance(results, GeneratorType) and len(results) == 0:
+        if compact:
+            yield '[[]]'
+            return
         yield from json.JSONEncoder(indent=2, sort_keys=True).iterencode([[]])
         return
 
@@ -80,23 +91,14 @@ def results_to_json(results):
 
     streamer = JsonStreamArray(results)
 
+    if compact:
+        yield from iterencode_pages('[[', streamer.streamPages(), ']]')
+        return
+
     for p in json.JSONEncoder(indent=2, sort_keys=True).iterencode([streamer]):
         yield p
 
 
-def get_wkts(geometry) -> Tuple[str, str]:
-    wrapped = shape(geometry)
-
-    min_lon, max_lon = (wrapped.bounds[0], wrapped.bounds[2])
-
-    if max_lon - min_lon > 180:
-        unwrapped = transform(unwrap_shape, wrapped)
-    else:
-        unwrapped = wrapped
-
-    return wrapped.wkt, unwrapped.wkt
-
-
 class JsonStreamArray(list):
     def __init__(self, results):
         self.results = results
@@ -116,7 +118,7 @@ class JsonStreamArray(list):
 
         additional_fields = {}
         for key, path in extra_json_fields:
-            additional_fields[key] = product.umm_get(product.umm, *path)
+            additional_fields[key] = get_umm_field(product, path)
 
         platform = product.properties.get('platform')
         if platform is None:
@@ -128,16 +130,16 @@ class JsonStreamArray(list):
             'ERS-1',
             'ERS-2',
         ]:
-            insarGrouping = product.umm_get(
-                product.umm,
-                *['AdditionalAttributes', ('Name', 'INSAR_STACK_ID'), 'Values', 0],
+            insarGrouping = get_umm_field(
+                product,
+                ['AdditionalAttributes', ('Name', 'INSAR_STACK_ID'), 'Values', 0],
             )
 
             if insarGrouping not in [None, 0, '0', 'NA', 'NULL']:
                 additional_fields['canInsar'] = True
-                additional_fields['insarStackSize'] = product.umm_get(
-                    product.umm,
-                    *[
+                additional_fields['insarStackSize'] = get_umm_field(
+                    product,
+                    [
                         'AdditionalAttributes',
                         ('Name', 'INSAR_STACK_SIZE'),
                         'Values',
@@ -154,24 +156,32 @@ class JsonStreamArray(list):
         return additional_fields
 
     def streamDicts(self):
+        for page in self.streamPages():
+            yield from page
+
+    def streamPages(self):
         completed = False
         for page_idx, page in enumerate(self.results):
             ASF_LOGGER.info(f'Streaming {len(page)} products from page {page_idx}')
             completed = page.searchComplete
 
-            yield from [
-                self.getItem(p)
-                for p in ASFSearchResults_to_properties_list(
-                    page, self.get_additional_output_fields
-                )
-                if p is not None
-            ]
+            yield self.getPageItems(page)
 
         if not completed:
             ASF_LOGGER.warn('Failed to download all results from CMR')
 
         ASF_LOGGER.info(f'Finished streaming {self.getOutputType()} results')
 
+    def getPageItems(self, page):
+        properties_list = ASFSearchResults_to_properties_list(
+            page, self.get_additional_output_fields
+        )
+        # Every footprint's WKTs are built at once, instead of per product in `getItem()`
+        for p, wkts in zip(properties_list, get_page_wkts(page)):
+            p['wkts'] = wkts
+
+        return [self.getItem(p) for p in properties_list if p is not None]
+
     def getItem(self, p):
         for i in p.keys():
             if p[i] == 'NA' or p[i] == '':
@@ -215,7 +225,11 @@ class JsonStreamArray(list):
         except TypeError:
             pass
 
-        wrapped, unwrapped = get_wkts(p['geometry'])
+        # Built for the whole page by `getPageItems()`
+        if 'wkts' in p:
+            wrapped, unwrapped = p['wkts']
+        else:
+            wrapped, unwrapped = get_wkts(p['geometry'])
 
         result = {
             'absoluteOrbit': p.get('orbit'),  #
@@ -325,8 +339,3 @@ class JsonStreamArray(list):
 
     def getOutputType(self) -> str:
         return 'json'
-
-
-def unwrap_shape(x, y, z=None):
-    x = x if x > 0 else x + 360
-    return tuple([x, y])
@@ -2,12 +2,16 @@ import inspect
 import json
 import re
 from types import GeneratorType
-from typing import Tuple
-from shapely.geometry import shape
-from shapely.ops import transform
 
 from asf_search import ASF_LOGGER
-from asf_search.export.export_translators import ASFSearchResults_to_properties_list
+from asf_search.export.export_translators import (
+    ASFSearchResults_to_properties_list,
+    get_umm_field,
+    get_page_wkts,
+    get_wkts,
+    unwrap_shape,  # noqa: F401
+)
+from asf_search.export.encoding import iterencode_pages
 from asf_search.constants import PRODUCT_TYPE
 _MB = 1048576
 
@@ -26,9 +30,16 @@ extra_jsonlite_fields = [
     ("missionName", ["AdditionalAttributes", ("Name", "MISSION_NAME"), "Values", 0]),
 ]
 
-def results_to_jsonlite(results):
+def results_to_jsonlite(results, compact: bool = False):
+    """
+    :param compact: encode without indentation or sorted keys, one chunk per page,
+        using `orjson` when installed. The output is the same JSON, several times faster
+    """
     ASF_LOGGER.info('started translating results to jsonlite format')
-    if len(results) == 0:
+    if not isinstance(results, GeneratorType) and len(results) == 0:
+        if compact:
+            yield '{"results":[]}'
+            return
         yield from json.JSONEncoder(indent=2, sort_keys=True).iterencode({'results': []})
         return
 
@@ -36,30 +47,17 @@ def results_to_jsonlite(results):
         results = [results]
 
     streamer = JSONLiteStreamArray(results)
+
+    if compact:
+        yield from iterencode_pages('{"results":[', streamer.streamPages(), ']}')
+        return
+
     jsondata = {"results": streamer}
 
     for p in json.JSONEncoder(indent=2, sort_keys=True).iterencode(jsondata):
         yield p
 
 
-def unwrap_shape(x, y, z=None):
-    x = x if x > 0 else x + 360
-    return tuple([x, y])
-
-
-def get_wkts(geometry) -> Tuple[str, str]:
-    wrapped = shape(geometry)
-
-    min_lon, max_lon = (wrapped.bounds[0], wrapped.bounds[2])
-
-    if max_lon - min_lon > 180:
-        unwrapped = transform(unwrap_shape, wrapped)
-    else:
-        unwrapped = wrapped
-
-    return wrapped.wkt, unwrapped.wkt
-
-
 class JSONLiteStreamArray(list):
     def __init__(self, results):
         self.results = results
@@ -79,7 +77,7 @@ class JSONLiteStreamArray(list):
 
         additional_fields = {}
         for key, path in extra_jsonlite_fields:
-            additional_fields[key] = product.umm_get(product.umm, *path)
+            additional_fields[key] = get_umm_field(product, path)
 
         platform = product.properties.get("platform")
         if platform is None:
@@ -91,16 +89,16 @@ class JSONLiteStreamArray(list):
             "ERS-1",
             "ERS-2",
         ]:
-            insarGrouping = product.umm_get(
-                product.umm,
-                *["AdditionalAttributes", ("Name", "INSAR_STACK_ID"), "Values", 0],
+            insarGrouping = get_umm_field(
+                product,
+                ["AdditionalAttributes", ("Name", "INSAR_STACK_ID"), "Values", 0],
             )
 
             if insarGrouping not in [None, 0, "0", "NA", "NULL"]:
                 additional_fields["canInsar"] = True
-                additional_fields["insarStackSize"] = product.umm_get(
-                    product.umm,
-                    *[
+                additional_fields["insarStackSize"] = get_umm_field(
+                    product,
+                    [
                         "AdditionalAttributes",
                         ("Name", "INSAR_STACK_SIZE"),
                         "Values",
@@ -117,24 +115,32 @@ class JSONLiteStreamArray(list):
         return additional_fields
 
     def streamDicts(self):
+        for page in self.streamPages():
+            yield from page
+
+    def streamPages(self):
         completed = False
         for page_idx, page in enumerate(self.results):
             ASF_LOGGER.info(f"Streaming {len(page)} products from page {page_idx}")
             completed = page.searchComplete
 
-            yield from [
-                self.getItem(p)
-                for p in ASFSearchResults_to_properties_list(
-                    page, self.get_additional_output_fields
-                )
-                if p is not None
-            ]
+            yield self.getPageItems(page)
 
         if not completed:
             ASF_LOGGER.warn("Failed to download all results from CMR")
 
         ASF_LOGGER.info(f"Finished streaming {self.getOutputType()} results")
 
+    def getPageItems(self, page):
+        properties_list = ASFSearchResults_to_properties_list(
+            page, self.get_additional_output_fields
+        )
+        # Every footprint's WKTs are built at once, instead of per product in `getItem()`
+        for p, wkts in zip(properties_list, get_page_wkts(page)):
+            p["wkts"] = wkts
+
+        return [self.getItem(p) for p in properties_list if p is not None]
+
     def getItem(self, p):
         for i in p.keys():
             if p[i] == "NA" or p[i] == "":
@@ -178,7 +184,11 @@ class JSONLiteStreamArray(list):
         except TypeError:
             pass
 
-        wrapped, unwrapped = get_wkts(p["geometry"])
+        # Built for the whole page by `getPageItems()`
+        if "wkts" in p:
+            wrapped, unwrapped = p["wkts"]
+        else:
+            wrapped, unwrapped = get_wkts(p["geometry"])
         result = {
             "beamMode": p["beamModeType"],
             "browse": [] if p.get("browse") is None else p.get("browse"),
@@ -4,11 +4,19 @@ from types import GeneratorType
 
 from asf_search import ASF_LOGGER
 from .jsonlite import JSONLiteStreamArray
+from .encoding import iterencode_pages
 
-def results_to_jsonlite2(results):
+def results_to_jsonlite2(results, compact: bool = False):
+    """
+    :param compact: encode without indentation or sorted keys, one chunk per page,
+        using `orjson` when installed. The output is the same JSON, several times faster
+    """
     ASF_LOGGER.info('started translating results to jsonlite2 format')
     
-    if len(results) == 0:
+    if not isinstance(results, GeneratorType) and len(results) == 0:
+            if compact:
+                yield '{"results":[]}'
+                return
             yield from json.JSONEncoder(indent=2, sort_keys=True).iterencode({'results': []})
             return
         
@@ -17,6 +25,10 @@ def results_to_jsonlite2(results):
 
     streamer = JSONLite2StreamArray(results)
 
+    if compact:
+        yield from iterencode_pages('{"results":[', streamer.streamPages(), ']}')
+        return
+
     for p in json.JSONEncoder(sort_keys=True, separators=(",", ":")).iterencode(
         {"results": streamer}
     ):
@@ -3,7 +3,8 @@ from types import GeneratorType
 from typing import Dict
 from asf_search import ASF_LOGGER
 from asf_search.export.metalink import MetalinkStreamArray
-import xml.etree.ElementTree as ETree
+from asf_search.export.export_translators import get_umm_field
+from asf_search.export.xml_templates import element
 
 extra_kml_fields = [
     (
@@ -75,103 +76,60 @@ class KMLStreamArray(MetalinkStreamArray):
         return "kml"
 
     def get_additional_fields(self, product):
-        umm = product.umm
         additional_fields = {}
         for key, path in extra_kml_fields:
-            additional_fields[key] = product.umm_get(umm, *path)
+            additional_fields[key] = get_umm_field(product, path)
         return additional_fields
 
     def getItem(self, p):
-        placemark = ETree.Element("Placemark")
-        name = ETree.Element("name")
-        name.text = p.get("sceneName")
-        placemark.append(name)
-
-        description = ETree.Element("description")
-        description.text = """&lt;![CDATA["""
-        placemark.append(description)
-
-        h1 = ETree.Element("h1")
-        h1.text = (
-            f"{p.get('platform')} ({p.get('configurationName')}), acquired {p.get('sceneDate')}"
-        )
-        h2 = ETree.Element("h2")
-        h2.text = p.get("url", "")
-        description.append(h1)
-        description.append(h2)
+        # Indented as `MetalinkStreamArray.indent(placemark, 3)` would
+        def i(level):
+            return '\n' + level * '  '
 
-        div = ETree.Element(
-            "div", attrib={"style": "position:absolute;left:20px;top:200px"}
+        metadata = ''.join(
+            f"{i(7)}{element('li', text + str(value))}"
+            for text, value in self.metadata_fields(p).items()
         )
-        description.append(div)
-
-        h3 = ETree.Element("h3")
-        h3.text = "Metadata"
-        div.append(h3)
-
-        ul = ETree.Element("ul")
-        div.append(ul)
-
-        for text, value in self.metadata_fields(p).items():
-            li = ETree.Element("li")
-            li.text = text + str(value)
-            ul.append(li)
+        div_children = f"{i(6)}{element('h3', 'Metadata')}{i(6)}"
+        div_children += f"{element('ul', children=metadata + i(6))}{i(5)}"
 
         if p.get('platform') == 'NISAR':
-            h3.text = "Files"
-            div.append(h3)
-            ul_files = ETree.Element("ul")
-            div.append(ul_files)
-            for url in p.get('additionalUrls'):
-                li = ETree.Element("li")
-                li.text = url
-                ul_files.append(li)
-
-        d = ETree.Element(
-            "div", attrib={"style": "position:absolute;left:300px;top:250px"}
+            # The same <h3> element is appended twice, both read "Files"
+            files = ''.join(f"{i(7)}{element('li', url)}" for url in p.get('additionalUrls'))
+            div_children = f"{i(6)}{element('h3', 'Files')}{i(6)}"
+            div_children += f"{element('ul', children=metadata + i(6))}{i(6)}"
+            div_children += f"{element('h3', 'Files')}{i(6)}"
+            div_children += f"{element('ul', children=files + i(6) if files else '')}{i(5)}"
+
+        div = element(
+            'div', attrib={'style': 'position:absolute;left:20px;top:200px'}, children=div_children
         )
-        description.append(d)
 
-        a = ETree.Element("a")
         if p.get("browse") is not None and len(p.get("browse")):
-            a.set("href", p.get("browse")[0])
-        else:
-            a.set("href", "")
-
-        d.append(a)
-
-        img = ETree.Element("img")
-        if p.get("thumbnailUrl") is not None:
-            img.set("src", p.get("thumbnailUrl"))
+            href = p.get("browse")[0]
         else:
-            img.set("src", "None")
-        a.append(img)
-
-        styleUrl = ETree.Element("styleUrl")
-        styleUrl.text = "#yellowLineGreenPoly"
-        placemark.append(styleUrl)
-
-        polygon = ETree.Element("Polygon")
-        placemark.append(polygon)
-
-        extrude = ETree.Element("extrude")
-        extrude.text = "1"
-        polygon.append(extrude)
-
-        altitudeMode = ETree.Element("altitudeMode")
-        altitudeMode.text = "relativeToGround"
-        polygon.append(altitudeMode)
-
-        outerBondaryIs = ETree.Element("outerBoundaryIs")
-        polygon.append(outerBondaryIs)
-
-        linearRing = ETree.Element("LinearRing")
-        outerBondaryIs.append(linearRing)
+            href = ""
+
+        src = p.get("thumbnailUrl") if p.get("thumbnailUrl") is not None else "None"
+        img = element('img', attrib={'src': src})
+        a = element('a', attrib={'href': href}, children=f'{i(7)}{img}{i(6)}')
+        d = element(
+            'div', attrib={'style': 'position:absolute;left:300px;top:250px'},
+            children=f'{i(6)}{a}{i(5)}',
+        )
 
-        coordinates = ETree.Element("coordinates")
+        h1 = f"{p.get('platform')} ({p.get('configurationName')}), acquired {p.get('sceneDate')}"
+        description = (
+            '<description>&lt;![CDATA['
+            f"{element('h1', h1)}{i(5)}"
+            f"{element('h2', p.get('url', ''))}{i(5)}"
+            f'{div}{i(5)}{d}{i(4)}'
+            '</description>'
+        )
 
+        coordinates = None
         if p.get("shape") is not None:
-            coordinates.text = (
+            coordinates = (
                 "\n"
                 + (14 * " ")
                 + ("\n" + (14 * " ")).join(
@@ -180,12 +138,28 @@ class KMLStreamArray(MetalinkStreamArray):
                 + "\n"
                 + (14 * " ")
             )
-        linearRing.append(coordinates)
 
-        self.indent(placemark, 3)
+        linear_ring = element(
+            'LinearRing', children=f"{i(7)}{element('coordinates', coordinates)}{i(6)}"
+        )
+        polygon = element(
+            'Polygon',
+            children=(
+                f"{i(5)}{element('extrude', '1')}"
+                f"{i(5)}{element('altitudeMode', 'relativeToGround')}"
+                f"{i(5)}{element('outerBoundaryIs', children=i(6) + linear_ring + i(5))}{i(4)}"
+            ),
+        )
+
+        placemark = (
+            f"<Placemark>{i(4)}{element('name', p.get('sceneName'))}"
+            f"{i(4)}{description}"
+            f"{i(4)}{element('styleUrl', '#yellowLineGreenPoly')}"
+            f"{i(4)}{polygon}{i(3)}</Placemark>{i(3)}"
+        )
 
         # for CDATA section, manually replace &amp; escape character with &
-        return ETree.tostring(placemark, encoding="unicode").replace("&amp;", "&")
+        return placemark.replace("&amp;", "&")
 
     # Helper method for getting additional fields in <ul> tag
     def metadata_fields(self, item: Dict):
@@ -2,10 +2,10 @@ import inspect
 import os
 from types import GeneratorType
 from urllib import parse
-import xml.etree.ElementTree as ETree
 
 from asf_search import ASF_LOGGER
 from asf_search.export.export_translators import ASFSearchResults_to_properties_list
+from asf_search.export.xml_templates import element
 
 
 def results_to_metalink(results):
@@ -47,8 +47,7 @@ class MetalinkStreamArray(list):
             ASF_LOGGER.info(f'Streaming {len(page)} products from page {page_idx}')
             completed = page.searchComplete
 
-            properties_list = ASFSearchResults_to_properties_list(page, self.get_additional_fields)
-            yield from [self.getItem(p) for p in properties_list]
+            yield from self.getPageItems(page)
 
         if not completed:
             ASF_LOGGER.warn('Failed to download all results from CMR')
@@ -57,49 +56,50 @@ class MetalinkStreamArray(list):
 
         ASF_LOGGER.info(f'Finished streaming {self.getOutputType()} results')
 
+    def getPageItems(self, page):
+        properties_list = ASFSearchResults_to_properties_list(page, self.get_additional_fields)
+        return [self.getItem(p) for p in properties_list]
+
+    def encodePage(self, page) -> str:
+        """Encodes one page of results, without the header or footer"""
+        return ''.join(self.getPageItems(page))
+
     def getOutputType(self) -> str:
         return 'metalink'
 
     def getItem(self, p):
-        file = ETree.Element('file', attrib={'name': p['fileName']})
-        resources = ETree.Element('resources')
-
-        url = ETree.Element('url', attrib={'type': 'http'})
-        url.text = p['url']
-        resources.append(url)
-        file.append(resources)
+        resources = element('resources', children=element('url', p['url'], {'type': 'http'}))
 
+        verification = ''
         if p.get('md5sum') and p.get('md5sum') != 'NA':
-            verification = ETree.Element('verification')
             if isinstance(p.get('md5sum'), dict):
                 a = parse.urlparse(p['url'])
                 file_name = os.path.basename(a.path)
                 md5_entry = p['md5sum'].get(file_name)
-                h = ETree.Element('hash', {'type': 'md5'})
+                hashes = ''
                 if md5_entry is not None:
-                    h.text=md5_entry
-                    verification.append(h)
+                    hashes = element('hash', md5_entry, {'type': 'md5'})
             else:
-                h = ETree.Element('hash', {'type': 'md5'})
-                h.text = p['md5sum']
-                verification.append(h)
-            file.append(verification)
+                hashes = element('hash', p['md5sum'], {'type': 'md5'})
+            verification = element('verification', children=hashes)
 
+        size = ''
         if p['bytes'] and p['bytes'] != 'NA':
-            size = ETree.Element('size')
             if isinstance(p.get('bytes'), dict):
                 a = parse.urlparse(p['url'])
                 file_name = os.path.basename(a.path)
                 bytes_entry = p['bytes'].get(file_name)
                 if bytes_entry is not None:
-                    size.text=str(bytes_entry['bytes'])
+                    size = element('size', str(bytes_entry['bytes']))
                 else:
-                    size.text = str(p['bytes'])
+                    size = element('size', str(p['bytes']))
             else:
-                size.text = str(p['bytes'])
-            file.append(size)
+                size = element('size', str(p['bytes']))
 
-        return '\n' + (8 * ' ') + ETree.tostring(file, encoding='unicode')
+        file = element(
+            'file', attrib={'name': p['fileName']}, children=resources + verification + size
+        )
+        return '\n' + (8 * ' ') + file
 
     def indent(self, elem, level=0):
         # Only Python 3.9+ has a built-in indent function for element tree.
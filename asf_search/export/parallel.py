@@ -0,0 +1,200 @@
+import inspect
+import os
+from collections import deque
+import multiprocessing
+from multiprocessing import Pool
+from types import GeneratorType
+from typing import Generator, Optional
+
+from asf_search import ASF_LOGGER
+from asf_search.export.csv import CSVStreamArray
+from asf_search.export.encoding import encode_compact
+from asf_search.export.geojson import GeoJSONStreamArray
+from asf_search.export.geojsonseq import encode_geojsonseq_page
+from asf_search.export.json import JsonStreamArray
+from asf_search.export.jsonlite import JSONLiteStreamArray
+from asf_search.export.jsonlite2 import JSONLite2StreamArray
+from asf_search.export.kml import KMLStreamArray
+from asf_search.export.metalink import MetalinkStreamArray
+
+# Products per task when splitting a single `ASFSearchResults` across processes
+DEFAULT_PAGE_SIZE = 1000
+
+_JSON_STREAMERS = {
+    'json': JsonStreamArray,
+    'jsonlite': JSONLiteStreamArray,
+    'jsonlite2': JSONLite2StreamArray,
+    'geojson': GeoJSONStreamArray,
+}
+
+# The text around each format's pages, and between non-empty pages
+_JSON_FRAMES = {
+    'json': ('[[', ']]'),
+    'jsonlite': ('{"results":[', ']}'),
+    'jsonlite2': ('{"results":[', ']}'),
+    'geojson': ('{"type":"FeatureCollection","features":[', ']}'),
+}
+
+
+def encode_pages(
+    results,
+    format: str,
+    processes: Optional[int] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Generator[bytes, None, None]:
+    """
+    Encodes search results in a pool of processes, one page per task, yielding
+    utf-8 encoded chunks in their original order (the header, each page, then the footer).
+    Pages are encoded independently, so large exports scale with the number of processes.
+
+    json formats (`json`, `jsonlite`, `jsonlite2`, `geojson`) are encoded as compact JSON,
+    the same as `results_to_json(compact=True)`. Other formats match their serial output.
+
+    :param results: `ASFSearchResults`, or a generator of pages from `search_generator()`.
+        `ASFSearchResults` are split into pages of `page_size` products
+    :param format: one of `csv`, `kml`, `metalink`, `json`, `jsonlite`, `jsonlite2`,
+        `geojson` or `geojsonseq`
+    :param processes: the number of processes to encode with, defaults to `os.cpu_count()`.
+        With 1, pages are encoded in the current process
+    :param page_size: the number of products per task when splitting `ASFSearchResults`
+    """
+    header, footer, separator = _get_frame(format)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    ASF_LOGGER.info(f'Started encoding results to {format} format with {processes} processes')
+
+    yield header.encode('utf-8')
+
+    first = True
+    completed = False
+    for complete, chunk in _map_pages(results, format, processes, page_size):
+        completed = complete
+        if not len(chunk):
+            continue
+
+        if not first:
+            yield separator
+        yield chunk
+        first = False
+
+    if not completed:
+        ASF_LOGGER.warning('Failed to download all results from CMR')
+
+    yield footer.encode('utf-8')
+
+    ASF_LOGGER.info(f'Finished encoding {format} results')
+
+
+def _get_frame(format: str):
+    if format == 'csv':
+        return CSVStreamArray([]).encodeHeader(), '', b''
+    if format == 'kml':
+        streamer = KMLStreamArray([])
+        return streamer.header, streamer.footer, b''
+    if format == 'metalink':
+        streamer = MetalinkStreamArray([])
+        return streamer.header, streamer.footer, b''
+    if format in _JSON_FRAMES:
+        return (*_JSON_FRAMES[format], b',')
+    if format == 'geojsonseq':
+        return '', '', b''
+
+    raise ValueError(f'Unsupported export format "{format}"')
+
+
+def _split_pages(results, page_size: int):
+    if inspect.isgeneratorfunction(results) or isinstance(results, GeneratorType):
+        yield from results
+        return
+
+    if len(results) == 0:
+        yield results
+        return
+
+    for idx in range(0, len(results), page_size):
+        page = results[idx:idx + page_size]
+        page.searchComplete = results.searchComplete
+        yield page
+
+
+def _map_pages(results, format: str, processes: int, page_size: int):
+    """Yields each page's `(searchComplete, encoded chunk)`, in order"""
+    if processes == 1:
+        for page in _split_pages(results, page_size):
+            yield page.searchComplete, _encode_page((format, page))
+        return
+
+    if _is_shareable(results):
+        # Forked workers inherit the results, so each task is only a range of indices
+        # instead of a pickled copy of its products
+        pool = Pool(processes=processes, initializer=_share_results, initargs=(results,))
+        tasks = (
+            (
+                results.searchComplete,
+                _encode_range,
+                (format, idx, min(idx + page_size, len(results))),
+            )
+            for idx in range(0, len(results), page_size)
+        )
+    else:
+        pool = Pool(processes=processes)
+        tasks = (
+            (page.searchComplete, _encode_page, (format, page))
+            for page in _split_pages(results, page_size)
+        )
+
+    with pool:
+        # Bounded, so a fast `search_generator()` doesn't queue up every page in memory
+        pending = deque()
+        for complete, func, args in tasks:
+            pending.append((complete, pool.apply_async(func, (args,))))
+
+            if len(pending) >= processes * 2:
+                complete, result = pending.popleft()
+                yield complete, result.get()
+
+        while len(pending):
+            complete, result = pending.popleft()
+            yield complete, result.get()
+
+
+def _is_shareable(results) -> bool:
+    if inspect.isgeneratorfunction(results) or isinstance(results, GeneratorType):
+        return False
+
+    return len(results) > 0 and multiprocessing.get_start_method() == 'fork'
+
+
+# The results being encoded, set in each forked worker by `_share_results()`
+_shared_results = None
+
+
+def _share_results(results) -> None:
+    global _shared_results
+    _shared_results = results
+
+
+def _encode_range(args) -> bytes:
+    format, start, stop = args
+    return _encode_page((format, _shared_results[start:stop]))
+
+
+def _encode_page(args) -> bytes:
+    format, page = args
+
+    if format == 'csv':
+        text = CSVStreamArray([]).encodePage(page)
+    elif format == 'kml':
+        text = KMLStreamArray([]).encodePage(page)
+    elif format == 'metalink':
+        text = MetalinkStreamArray([]).encodePage(page)
+    elif format == 'geojsonseq':
+        text = encode_geojsonseq_page(page)
+    else:
+        items = _JSON_STREAMERS[format]([]).getPageItems(page)
+        # Encoding the page as a list, then dropping its brackets, see `iterencode_pages()`
+        text = encode_compact(items)[1:-1] if len(items) else ''
+
+    return text.encode('utf-8')
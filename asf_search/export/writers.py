@@ -0,0 +1,185 @@
+import io
+import os
+import time
+from typing import IO, Iterable, Optional
+
+from asf_search import ASF_LOGGER, instrumentation
+from asf_search.export.csv import results_to_csv
+from asf_search.export.geojson import results_to_geojson
+from asf_search.export.geojsonseq import results_to_geojsonseq
+from asf_search.export.geoparquet import results_to_geoparquet
+from asf_search.export.json import results_to_json
+from asf_search.export.jsonlite import results_to_jsonlite
+from asf_search.export.jsonlite2 import results_to_jsonlite2
+from asf_search.export.kml import results_to_kml
+from asf_search.export.metalink import results_to_metalink
+from asf_search.export.parallel import encode_pages
+
+# Characters collected before each `write()`
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+TEXT_FORMATS = ['csv', 'kml', 'metalink', 'json', 'jsonlite', 'jsonlite2', 'geojson', 'geojsonseq']
+
+# Used by `results_to_file()` when no format is given
+_EXTENSION_FORMATS = {
+    '.csv': 'csv',
+    '.kml': 'kml',
+    '.metalink': 'metalink',
+    '.geojson': 'geojson',
+    '.geojsonl': 'geojsonseq',
+    '.geojsons': 'geojsonseq',
+    '.ndjson': 'geojsonseq',
+    '.parquet': 'geoparquet',
+    '.geoparquet': 'geoparquet',
+}
+
+
+def export_stream(
+    results,
+    fh: IO[str],
+    format: str,
+    compact: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    processes: int = 1,
+) -> None:
+    """
+    Writes search results to an open file in one of the text export formats,
+    collecting output into large buffers so the file sees a few big `write()` calls
+    instead of one per row or element.
+
+    ``` python
+    with open('results.kml', 'w', newline='') as f:
+        asf_search.export_stream(asf_search.search_generator(**opts), f, 'kml')
+    ```
+
+    :param results: `ASFSearchResults`, or a generator of pages from `search_generator()`
+    :param fh: the file to write to. Text files should be opened with `newline=''`
+        so csv line endings are kept, binary files are written utf-8 encoded
+    :param format: one of `csv`, `kml`, `metalink`, `json`, `jsonlite`, `jsonlite2`,
+        `geojson` or `geojsonseq`
+    :param compact: for the json formats, see `results_to_json(compact=True)`
+    :param buffer_size: the number of characters to collect before each write
+    :param processes: the number of processes to encode pages with, see `encode_pages()`.
+        With more than 1, json formats are always written as compact JSON
+    """
+    is_text = isinstance(fh, io.TextIOBase)
+
+    if processes == 1:
+        chunks = _get_chunks(results, format, compact)
+        empty = ''
+        if not is_text:
+            chunks = (chunk.encode('utf-8') for chunk in chunks if chunk)
+            empty = b''
+    else:
+        _validate_format(format)
+        chunks = encode_pages(results, format, processes=processes)
+        empty = b''
+        if is_text:
+            chunks = (chunk.decode('utf-8') for chunk in chunks)
+            empty = ''
+
+    buffer = []
+    buffered = 0
+    started = (time.time(), time.perf_counter())
+    for chunk in chunks:
+        if not chunk:
+            continue
+
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= buffer_size:
+            _write_buffer(fh, empty.join(buffer), format, started)
+            buffer.clear()
+            buffered = 0
+            started = (time.time(), time.perf_counter())
+
+    if len(buffer):
+        _write_buffer(fh, empty.join(buffer), format, started)
+
+
+def _write_buffer(fh, data, format: str, started) -> None:
+    fh.write(data)
+    # Measured from the end of the previous write, covering encoding this buffer as well
+    instrumentation.emit(
+        'export.chunk',
+        start=started[0],
+        duration=time.perf_counter() - started[1],
+        bytes=len(data),
+        attributes={'format': format},
+    )
+
+
+def results_to_file(
+    results,
+    path: str,
+    format: Optional[str] = None,
+    compact: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    processes: int = 1,
+) -> None:
+    """
+    Writes search results to a file, see `export_stream()`.
+
+    :param results: `ASFSearchResults`, or a generator of pages from `search_generator()`
+    :param path: the file to write
+    :param format: any format supported by `export_stream()`, or `geoparquet`.
+        Defaults to the format matching the file's extension
+        (`.csv`, `.kml`, `.metalink`, `.geojson`, `.geojsonl`/`.ndjson` or `.parquet`)
+    :param compact: for the json formats, see `results_to_json(compact=True)`
+    :param buffer_size: the number of characters to collect before each write
+    :param processes: the number of processes to encode pages with, see `encode_pages()`
+    """
+    if format is None:
+        extension = os.path.splitext(path)[1].lower()
+        format = _EXTENSION_FORMATS.get(extension)
+        if format is None:
+            raise ValueError(
+                f'Could not determine export format from file extension "{extension}", '
+                f'pass one of {[*TEXT_FORMATS, "geoparquet"]} as `format`'
+            )
+
+    ASF_LOGGER.info(f'Writing results to "{path}" in {format} format')
+
+    if format == 'geoparquet':
+        results_to_geoparquet(results, path)
+        return
+
+    # Checked before opening, so an invalid format doesn't leave an empty file behind
+    _validate_format(format)
+
+    if processes == 1:
+        with open(path, 'w', encoding='utf-8', newline='') as fh:
+            export_stream(results, fh, format, compact=compact, buffer_size=buffer_size)
+        return
+
+    # Pages are already encoded to bytes by their worker processes
+    with open(path, 'wb') as fh:
+        export_stream(
+            results, fh, format, compact=compact, buffer_size=buffer_size, processes=processes
+        )
+
+
+def _validate_format(format: str) -> None:
+    if format not in TEXT_FORMATS:
+        raise ValueError(f'Unsupported export format "{format}", expected one of {TEXT_FORMATS}')
+
+
+def _get_chunks(results, format: str, compact: bool) -> Iterable[str]:
+    _validate_format(format)
+
+    if format == 'csv':
+        return results_to_csv(results).streamChunks()
+    if format == 'kml':
+        return results_to_kml(results)
+    if format == 'metalink':
+        return results_to_metalink(results)
+    if format == 'json':
+        return results_to_json(results, compact=compact)
+    if format == 'jsonlite':
+        return results_to_jsonlite(results, compact=compact)
+    if format == 'jsonlite2':
+        return results_to_jsonlite2(results, compact=compact)
+    if format == 'geojson':
+        return results_to_geojson(results, compact=compact)
+
+    return results_to_geojsonseq(results)
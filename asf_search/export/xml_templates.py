@@ -0,0 +1,54 @@
+from typing import Dict, Optional
+
+# String templates for the xml formats (kml, metalink), producing the same output
+# `xml.etree.ElementTree.tostring()` would without building an element tree per product
+
+
+def escape_text(text: str) -> str:
+    """Escapes element text the same as `ElementTree`"""
+    if not isinstance(text, str):
+        raise TypeError(f'cannot serialize {text!r} (type {type(text).__name__})')
+
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+
+def escape_attrib(text: str) -> str:
+    """Escapes an attribute value the same as `ElementTree`"""
+    text = escape_text(text)
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    if '\r' in text:
+        text = text.replace('\r', '&#13;')
+    if '\n' in text:
+        text = text.replace('\n', '&#10;')
+    if '\t' in text:
+        text = text.replace('\t', '&#09;')
+    return text
+
+
+def element(
+    tag: str, text: Optional[str] = None, attrib: Optional[Dict[str, str]] = None, children: str = ''
+) -> str:
+    """
+    Renders an element, empty elements are self closing
+
+    :param tag: the element's tag
+    :param text: the element's text, escaped with `escape_text()`. Empty text is left out
+    :param attrib: the element's attributes, escaped with `escape_attrib()`
+    :param children: the element's already rendered children (and their tails)
+    """
+    attributes = ''
+    if attrib:
+        attributes = ''.join(f' {key}="{escape_attrib(value)}"' for key, value in attrib.items())
+
+    # Like ElementTree, empty text is the same as none
+    if not text and not children:
+        return f'<{tag}{attributes} />'
+
+    return f'<{tag}{attributes}>{escape_text(text) if text else ""}{children}</{tag}>'
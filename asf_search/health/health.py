@@ -1,11 +1,11 @@
-from typing import Dict
-import requests
+from typing import Dict, Optional
 import json
 
 import asf_search.constants
+from asf_search.ASFSession import ASFSession
 
 
-def health(host: str = None) -> Dict:
+def health(host: str = None, session: Optional[ASFSession] = None) -> Dict:
     """
     Checks basic connectivity to and health of the ASF SearchAPI.
 
@@ -14,6 +14,8 @@ def health(host: str = None) -> Dict:
     param host:
         SearchAPI host, defaults to Production SearchAPI.
         This option is intended for dev/test purposes.
+    param session:
+        The session to query with, defaults to a new `ASFSession`.
 
     Returns
     -------
@@ -22,4 +24,7 @@ def health(host: str = None) -> Dict:
 
     if host is None:
         host = asf_search.INTERNAL.CMR_HOST
-    return json.loads(requests.get(f'https://{host}{asf_search.INTERNAL.CMR_HEALTH_PATH}').text)
+    if session is None:
+        session = ASFSession()
+
+    return json.loads(session.get(f'https://{host}{asf_search.INTERNAL.CMR_HEALTH_PATH}').text)
@@ -0,0 +1,303 @@
+"""
+Structured events for searches, exports and downloads, for aggregating where time goes
+without parsing logs.
+
+``` python
+def on_event(event: asf_search.instrumentation.Event):
+    print(event.name, event.duration, event.status, event.bytes, event.items)
+
+asf_search.instrumentation.register(on_event)
+```
+
+Events are emitted once each operation finishes:
+- `search.subquery`: one subquery of a search, with the pages and `items` it returned.
+    Its duration is wall time, including time the caller spends between pages
+- `search.page`: fetching and building one page of products, parent of the three below
+- `search.request`: one CMR request (also made by `search_count()`), with its HTTP `status`,
+    response `bytes` and throttled `retries`
+- `search.decode`: decoding the response JSON
+- `search.subclass`: building each item's `ASFProduct` subclass
+- `export.chunk`: encoding and writing one buffer of `export_stream()` output
+- `download.file`: one file request, with its HTTP `status`, `bytes` written and `retries`.
+    `download_bursts()` emits one per request, `202` while the burst is being extracted
+
+With no callbacks registered nothing is measured. Callbacks run on the thread that finished
+the operation, so they should be quick and thread safe. Exceptions they raise are logged and
+otherwise ignored. `PrometheusMetrics` and `OpenTelemetrySpans` adapt events for those libraries.
+"""
+
+from contextlib import contextmanager
+import contextvars
+from dataclasses import dataclass, field
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from asf_search import ASF_LOGGER
+
+
+@dataclass
+class Event:
+    """One finished operation, see the module docstring for which are emitted"""
+
+    name: str
+    # When it started (unix time), and how long it took in seconds
+    start: float
+    duration: float
+    status: Optional[int] = None
+    bytes: Optional[int] = None
+    items: Optional[int] = None
+    retries: int = 0
+    # The exception that ended it, if any
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    # Unique within the process, `parent_id` is the span this one ran inside of
+    span_id: int = 0
+    parent_id: Optional[int] = None
+
+
+_callbacks: List[Callable[[Event], None]] = []
+_lock = threading.Lock()
+_span_ids = itertools.count(1)
+_current_span: contextvars.ContextVar[Optional[Event]] = contextvars.ContextVar(
+    'asf_search_span', default=None
+)
+
+
+def register(callback: Callable[[Event], None]) -> Callable[[Event], None]:
+    """
+    Calls `callback` with every `Event` emitted from now on.
+    Returns the callback, so it can be used as a decorator
+    """
+    with _lock:
+        if callback not in _callbacks:
+            _callbacks.append(callback)
+
+    return callback
+
+
+def unregister(callback: Callable[[Event], None]) -> None:
+    """Stops calling a callback passed to `register()`"""
+    with _lock:
+        if callback in _callbacks:
+            _callbacks.remove(callback)
+
+
+def enabled() -> bool:
+    """Whether any callbacks are registered, events are only measured when they are"""
+    return len(_callbacks) > 0
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Event]]:
+    """
+    Measures the enclosed block, emitting an `Event` when it exits. Yields the event so the block
+    can fill in `status`, `bytes`, `items` and `attributes`, or `None` when nothing is registered
+
+    Spans opened inside the block (on the same thread) are its children.
+    Don't `yield` from a generator inside a span, the caller would run inside it too
+    """
+    if not enabled():
+        yield None
+        return
+
+    parent = _current_span.get()
+    event = Event(
+        name=name,
+        start=time.time(),
+        duration=0.0,
+        attributes=attributes,
+        span_id=next(_span_ids),
+        parent_id=None if parent is None else parent.span_id,
+    )
+
+    token = _current_span.set(event)
+    perf = time.perf_counter()
+    try:
+        yield event
+    except BaseException as exc:
+        event.error = f'{type(exc).__name__}: {exc}'
+        raise
+    finally:
+        event.duration = time.perf_counter() - perf
+        _current_span.reset(token)
+        _emit(event)
+
+
+def emit(name: str, start: float, duration: float, **fields) -> None:
+    """
+    Emits an `Event` for an operation measured by the caller, ex: one spanning generator yields
+
+    :param start: when it started (unix time)
+    :param duration: how long it took, in seconds
+    :param fields: any other `Event` fields
+    """
+    if not enabled():
+        return
+
+    parent = _current_span.get()
+    _emit(
+        Event(
+            name=name,
+            start=start,
+            duration=duration,
+            span_id=next(_span_ids),
+            parent_id=None if parent is None else parent.span_id,
+            **fields,
+        )
+    )
+
+
+def add_retry() -> None:
+    """Counts a retry against the innermost open span, if there is one"""
+    event = _current_span.get()
+    if event is not None:
+        event.retries += 1
+
+
+def _emit(event: Event) -> None:
+    for callback in list(_callbacks):
+        try:
+            callback(event)
+        except Exception as exc:
+            ASF_LOGGER.warning(f'Instrumentation callback {callback} failed: {exc}')
+
+
+class PrometheusMetrics:
+    """
+    Records events as Prometheus metrics, labelled by event name
+    (and HTTP status, for the event count). Requires `prometheus-client`.
+
+    ``` python
+    asf_search.instrumentation.register(asf_search.instrumentation.PrometheusMetrics())
+    ```
+
+    - `asf_search_events_total`: events, by `event` and `status`
+    - `asf_search_event_errors_total`: events that ended in an exception
+    - `asf_search_event_duration_seconds`: a histogram of event durations
+    - `asf_search_event_bytes_total`, `asf_search_event_items_total`
+        and `asf_search_event_retries_total`
+    """
+
+    def __init__(self, registry=None, namespace: str = 'asf_search'):
+        """
+        :param registry: the `prometheus_client.CollectorRegistry` to register the metrics with,
+            defaults to the global registry
+        :param namespace: prefixed to each metric name
+        """
+        try:
+            import prometheus_client
+        except ImportError as exc:
+            raise ImportError(
+                'PrometheusMetrics requires the optional dependency prometheus-client, '
+                'but it could not be found in the current python environment. '
+                'Ex: `python -m pip install asf-search[instrumentation]`'
+            ) from exc
+
+        kwargs = {'namespace': namespace}
+        if registry is not None:
+            kwargs['registry'] = registry
+
+        self.events = prometheus_client.Counter(
+            'events_total', 'Instrumented operations', ['event', 'status'], **kwargs
+        )
+        self.errors = prometheus_client.Counter(
+            'event_errors_total', 'Operations that raised', ['event'], **kwargs
+        )
+        self.duration = prometheus_client.Histogram(
+            'event_duration_seconds', 'Operation durations', ['event'], **kwargs
+        )
+        self.bytes = prometheus_client.Counter(
+            'event_bytes_total', 'Bytes read or written', ['event'], **kwargs
+        )
+        self.items = prometheus_client.Counter(
+            'event_items_total', 'Items (products) handled', ['event'], **kwargs
+        )
+        self.retries = prometheus_client.Counter(
+            'event_retries_total', 'Retried requests', ['event'], **kwargs
+        )
+
+    def __call__(self, event: Event) -> None:
+        status = '' if event.status is None else str(event.status)
+        self.events.labels(event=event.name, status=status).inc()
+        self.duration.labels(event=event.name).observe(event.duration)
+
+        if event.error is not None:
+            self.errors.labels(event=event.name).inc()
+        if event.bytes:
+            self.bytes.labels(event=event.name).inc(event.bytes)
+        if event.items:
+            self.items.labels(event=event.name).inc(event.items)
+        if event.retries:
+            self.retries.labels(event=event.name).inc(event.retries)
+
+
+class OpenTelemetrySpans:
+    """
+    Records events as OpenTelemetry spans, nested the same way as the events.
+    Top level spans are children of the span current when the callback runs.
+    Requires `opentelemetry-api` (and an SDK to export them).
+
+    ``` python
+    asf_search.instrumentation.register(asf_search.instrumentation.OpenTelemetrySpans())
+    ```
+    """
+
+    def __init__(self, tracer=None):
+        """
+        :param tracer: the `opentelemetry.trace.Tracer` to create spans with,
+            defaults to the global tracer provider's `asf_search` tracer
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError(
+                'OpenTelemetrySpans requires the optional dependency opentelemetry-api, '
+                'but it could not be found in the current python environment. '
+                'Ex: `python -m pip install asf-search[instrumentation]`'
+            ) from exc
+
+        self._trace = trace
+        self.tracer = trace.get_tracer('asf_search') if tracer is None else tracer
+        self._lock = threading.Lock()
+        # Children finish before their parent, so they're held until it does
+        self._pending: Dict[int, List[Event]] = {}
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            if event.parent_id is not None:
+                self._pending.setdefault(event.parent_id, []).append(event)
+                return
+
+        self._record(event, context=None)
+
+    def _record(self, event: Event, context) -> None:
+        attributes = {
+            f'asf_search.{name}': value
+            for name, value in [
+                ('status', event.status),
+                ('bytes', event.bytes),
+                ('items', event.items),
+                ('retries', event.retries),
+                *event.attributes.items(),
+            ]
+            if isinstance(value, (str, bool, int, float))
+        }
+
+        otel_span = self.tracer.start_span(
+            event.name,
+            context=context,
+            attributes=attributes,
+            start_time=int(event.start * 1e9),
+        )
+        if event.error is not None:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, event.error))
+
+        with self._lock:
+            children = self._pending.pop(event.span_id, [])
+        child_context = self._trace.set_span_in_context(otel_span)
+        for child in children:
+            self._record(child, context=child_context)
+
+        otel_span.end(end_time=int((event.start + event.duration) * 1e9))
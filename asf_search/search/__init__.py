@@ -7,3 +7,7 @@ from .campaigns import campaigns  # noqa: F401
 from .search_count import search_count  # noqa: F401
 from .search_generator import search_generator, preprocess_opts  # noqa: F401
 from .collection_attributes import get_searchable_attributes  # noqa: F401
+from .explain import explain  # noqa: F401
+from .sharded_search import sharded_search  # noqa: F401
+from .tiled_search import tiled_search  # noqa: F401
+from .error_reporting import flush_error_reports  # noqa: F401
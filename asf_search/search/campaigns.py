@@ -1,14 +1,25 @@
-from typing import Dict, List, Union
+import json
+from typing import Dict, List, Optional, Union
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.ASFSession import ASFSession
 from asf_search.CMR.MissionList import get_campaigns
+from asf_search.CMR.collection_metadata import get_collection_cache
 
 
-def campaigns(platform: str) -> List[str]:
+def campaigns(
+    platform: str,
+    session: Optional[ASFSession] = None,
+    opts: Optional[ASFSearchOptions] = None,
+) -> List[str]:
     """
     Returns a list of campaign names for the given platform,
     each name being usable as a campaign for asf_search.search() and asf_search.geo_search()
 
     :param platform: The name of the platform to gather campaign names for.
     Platforms currently supported include UAVSAR, AIRSAR, and SENTINEL-1 INTERFEROGRAM (BETA)
+    :param session: the session to query CMR with, defaults to a new `ASFSession`
+    :param opts: search options to take the CMR `host` from, defaults to the session's `cmr_host`.
+    Responses are cached (see `asf_search.CollectionMetadataCache`), so asking again is free
 
     :return: A list of campaign names for the given platform
     """
@@ -26,7 +37,17 @@ def campaigns(platform: str) -> List[str]:
         else:
             data['platform[]'] = platform
 
-    missions = get_campaigns(data)
+    if session is None:
+        session = ASFSession()
+    host = session.cmr_host if opts is None else opts.host
+
+    cache = get_collection_cache()
+    key = cache.make_key(host, 'query', json.dumps(sorted(data.items())))
+    missions = cache.get(key)
+    if missions is None:
+        missions = get_campaigns(data, session=session, host=host)
+        cache.set(key, missions)
+
     mission_names = _get_project_names(missions)
 
     return mission_names
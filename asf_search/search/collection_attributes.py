@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.CMR.collection_metadata import get_collection_metadata
 from asf_search.CMR.datasets import collections_by_processing_level
 from asf_search.ASFSession import ASFSession
 
-from asf_search.exceptions import ASFSearchError, CMRError
+from asf_search.exceptions import CMRError
 
 
 @dataclass(frozen=True)
@@ -19,77 +21,95 @@ class AdditionalAttribute:
 
 
 def get_searchable_attributes(
-    shortName: Optional[str] = None,
-    conceptID: Optional[str] = None,
-    processingLevel: Optional[str] = None,
+    shortName: Optional[Union[str, Sequence[str]]] = None,
+    conceptID: Optional[Union[str, Sequence[str]]] = None,
+    processingLevel: Optional[Union[str, Sequence[str]]] = None,
     session: ASFSession = ASFSession(),
+    opts: Optional[ASFSearchOptions] = None,
 ) -> dict[str, AdditionalAttribute]:
     """Using a provided processingLevel, collection shortName, or conceptID query CMR's `/collections` endpoint and
-    return a dictionary of additional attributes mapping the attribute's name to the additional attribute entry in CMR
+    return a dictionary of additional attributes mapping the attribute's name to the additional attribute entry in CMR.
+    Several values can be given at once, their collections are fetched in one request
+    and their attributes merged.
+
+    Collection metadata is cached (see `asf_search.CollectionMetadataCache`), so looking up
+    the same collections again doesn't query CMR. `asf_search.prewarm_collection_metadata()`
+    caches every known collection at once
 
     ``` python
     from pprint import pp
     SLCRcord = asf.get_searchable_attributes(processingLevel='SLC')
     pp(SLCRcord.additionalAttributes)
     ```
+
+    :param opts: search options to take the CMR `host` from, defaults to the session's `cmr_host`
     """
-    query_data = None
-    method = None
+    conceptIDs = None
+    shortNames = None
 
     if shortName is not None:
         method = {'type': 'shortName', 'value': shortName}
-        query_data = [('shortName', shortName)]
+        shortNames = shortName
     elif conceptID is not None:
-        query_data = [('concept-id', conceptID)]
         method = {'type': 'conceptID', 'value': conceptID}
+        conceptIDs = conceptID
     elif processingLevel is not None:
         method = {'type': 'processingLevel', 'value': processingLevel}
-        query_data = _get_concept_ids_for_processing_level(processingLevel)
+        conceptIDs = _get_concept_ids_for_processing_level(processingLevel)
     else:
         raise ValueError(
             'Error: `get_collection_searchable_attributes()` expects `shortName`, `conceptID`, or `processingLevel`'
         )
 
-    cmr_response = _query_cmr(session=session, query_data=query_data, method=method)
+    host = session.cmr_host if opts is None else opts.host
+    try:
+        collections = get_collection_metadata(
+            conceptIDs=conceptIDs, shortNames=shortNames, session=session, host=host
+        )
+    except CMRError as exc:
+        raise ValueError(str(exc)) from exc
 
-    if 'errors' in cmr_response:
-        raise ValueError(f"CMR responded with an error. Original error(s): {' '.join(cmr_response['errors'])}")
-    if len(cmr_response['items']) == 0:
+    items = [item for found in collections.values() for item in found]
+    if len(items) == 0:
         raise ValueError(
             f'Error: no collections found in CMR for given parameter `{method["type"]}`: "{method["value"]}" '
         )
 
     additionalAttributes = {}
-
-    for entry in cmr_response['items']:
-        umm = entry['umm']
-        attributes = umm.get('AdditionalAttributes')
-        if attributes is not None:
-            for attribute in attributes:
-                additionalAttributes[attribute.get('Name')] = AdditionalAttribute(
-                    name=attribute.get('Name'),
-                    description=attribute.get('Description'),
-                    data_type=attribute.get('DataType'),
-                )
+    for item in items:
+        additionalAttributes.update(_get_additional_attributes(item))
 
     return additionalAttributes
 
 
-def _get_concept_ids_for_processing_level(processing_level: str):
-    collections = collections_by_processing_level.get(processing_level)
-    if collections is None:
-        raise ValueError(f'asf-search is missing concept-id aliases for processing level "{processing_level}". Please use `shortName` or `conceptID')
-    return [('concept-id[]', collection) for collection in collections]
+# Each collection revision's attributes, built once since collections are shared through the cache
+_attributes_by_revision: Dict[Tuple[str, Any], Dict[str, AdditionalAttribute]] = {}
 
 
-def _query_cmr(session: ASFSession, query_data: list[tuple[str, str]], method: dict) -> dict:
-    url = 'https://cmr.earthdata.nasa.gov/search/collections.umm_json'
+def _get_additional_attributes(item: Dict) -> Dict[str, AdditionalAttribute]:
+    key = (item['meta'].get('concept-id'), item['meta'].get('revision-id'))
+    attributes = _attributes_by_revision.get(key)
+    if attributes is None:
+        attributes = {}
+        for attribute in item['umm'].get('AdditionalAttributes') or []:
+            attributes[attribute.get('Name')] = AdditionalAttribute(
+                name=attribute.get('Name'),
+                description=attribute.get('Description'),
+                data_type=attribute.get('DataType'),
+            )
+        _attributes_by_revision[key] = attributes
 
-    response = session.post(url=url, data=query_data)
+    return attributes
 
-    try:
-        return response.json()
-    except Exception as exc:
-        raise ASFSearchError(
-            f'Failed to find collection attributes for {method["type"]} "{method["value"]}". original exception: {str(exc)}'
-        )
+
+def _get_concept_ids_for_processing_level(processing_level: Union[str, Sequence[str]]) -> List[str]:
+    levels = [processing_level] if isinstance(processing_level, str) else processing_level
+
+    concept_ids = []
+    for level in levels:
+        collections = collections_by_processing_level.get(level)
+        if collections is None:
+            raise ValueError(f'asf-search is missing concept-id aliases for processing level "{level}". Please use `shortName` or `conceptID')
+        concept_ids.extend(collections)
+
+    return concept_ids
@@ -1,11 +1,28 @@
-from asf_search import ASF_LOGGER, ASFSearchOptions
+import atexit
+from collections import OrderedDict
+import os
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from asf_search import ASF_LOGGER, ASFSearchOptions, ASFSession
 from asf_search import INTERNAL
 import requests
 
+# The most distinct reports remembered for deduplication
+_MAX_REMEMBERED = 1000
 
 
 def report_search_error(search_options: ASFSearchOptions, message: str):
-    """Reports CMR Errors automatically to ASF"""
+    """
+    Reports CMR Errors automatically to ASF.
+
+    Reports are queued and sent by a background thread, so searches never wait on them.
+    Repeats of the same error are only reported once, reports made close together are
+    sent in one request, and reports are dropped if too many are waiting to be sent.
+    Queued reports are flushed when the interpreter exits, see `flush_error_reports()`
+    """
 
     from asf_search import REPORT_ERRORS
 
@@ -25,26 +42,207 @@ def report_search_error(search_options: ASFSearchOptions, message: str):
     message = f'Error Message: {str(message)}\nUser Agent: {user_agent} \
     \nSearch Options: {{\n{search_options_list}\n}}'
 
-    response = requests.post(
-        f'https://{INTERNAL.ERROR_REPORTING_ENDPOINT}',
-        data={'Message': f'This error message and info was automatically generated:\n\n{message}'},
-    )
+    _reporter.submit(message)
 
-    try:
-        response.raise_for_status()
-    except requests.exceptions.HTTPError:
-        ASF_LOGGER.error(
-            'asf-search failed to automatically report an error,'
-            'if you have any questions email uso@asf.alaska.edu'
-            f"\nError Text: HTTP {response.status_code}: {response.json()['errors']}"
-        )
-        return
-    if response.status_code == 200:
-        ASF_LOGGER.error(
-            (
-                'The asf-search module ecountered an error with CMR,'
-                'and the following message was automatically reported to ASF:'
-                '\n\n"\nmessage\n"'
-                'If you have any questions email uso@asf.alaska.edu'
+
+def flush_error_reports(timeout: Optional[float] = None) -> bool:
+    """
+    Waits for queued search error reports to be sent
+
+    :param timeout: the most seconds to wait, forever if `None`
+
+    :return: whether every queued report was sent (or failed to send) in time
+    """
+    return _reporter.flush(timeout)
+
+
+class ErrorReporter:
+    """
+    Sends search error reports from a background thread, deduplicated and batched.
+    `report_search_error()` uses one shared instance, others can target a different `url`
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        max_queued: int = 100,
+        batch_size: int = 20,
+        batch_window: float = 1.0,
+        timeout: float = INTERNAL.ERROR_REPORTING_TIMEOUT,
+        dedupe_window: float = 60 * 60,
+    ):
+        """
+        :param url: where reports are posted, defaults to
+            `https://{asf_search.constants.INTERNAL.ERROR_REPORTING_ENDPOINT}`
+        :param max_queued: the most reports waiting to be sent, further reports are dropped
+        :param batch_size: the most reports sent in one request
+        :param batch_window: how long to wait for more reports before sending a batch, in seconds
+        :param timeout: the request timeout when sending a batch, in seconds
+        :param dedupe_window: how long a report is remembered, in seconds.
+            Identical reports within it are not sent again
+        """
+        self.url = url
+        self.max_queued = max_queued
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.timeout = timeout
+        self.dedupe_window = dedupe_window
+        self._reset()
+
+    def _reset(self) -> None:
+        self._queue = queue.Queue(maxsize=self.max_queued)
+        self._lock = threading.Lock()
+        self._flushing = threading.Event()
+        self._thread = None
+        # Only used by the worker thread, created with it
+        self._session = None
+        # message -> when it was last queued (`time.monotonic()`), oldest first
+        self._seen = OrderedDict()
+        self.dropped = 0
+
+    def submit(self, message: str) -> bool:
+        """
+        Queues a report without waiting for it to be sent
+
+        :return: whether it was queued, `False` for duplicates and when the queue is full
+        """
+        now = time.monotonic()
+        with self._lock:
+            while len(self._seen) and next(iter(self._seen.values())) < now - self.dedupe_window:
+                self._seen.popitem(last=False)
+
+            if message in self._seen:
+                ASF_LOGGER.debug('Search error was already reported, skipping')
+                return False
+
+            try:
+                self._queue.put_nowait(message)
+            except queue.Full:
+                self.dropped += 1
+                ASF_LOGGER.warning(
+                    'Too many search errors waiting to be reported, dropping this report'
+                )
+                return False
+
+            self._seen[message] = now
+            if len(self._seen) > _MAX_REMEMBERED:
+                self._seen.popitem(last=False)
+            self._start()
+
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sends queued reports without waiting out the batch window
+
+        :param timeout: the most seconds to wait, forever if `None`
+
+        :return: whether every queued report was sent (or failed to send) in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._flushing.set()
+        try:
+            with self._queue.all_tasks_done:
+                while self._queue.unfinished_tasks:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._queue.all_tasks_done.wait(remaining)
+            return True
+        finally:
+            self._flushing.clear()
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name='asf_search-error-reporter', daemon=True
             )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self._send(batch)
+            except Exception as exc:
+                ASF_LOGGER.error(
+                    'asf-search failed to automatically report an error,'
+                    'if you have any questions email uso@asf.alaska.edu'
+                    f'\nError Text: {exc}'
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _next_batch(self) -> List[str]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_window
+
+        while len(batch) < self.batch_size:
+            remaining = 0 if self._flushing.is_set() else deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    # Short waits, so a flush doesn't wait out the whole window
+                    batch.append(self._queue.get(timeout=min(remaining, 0.1)))
+            except queue.Empty:
+                if remaining <= 0:
+                    break
+
+        return batch
+
+    def _send(self, messages: List[str]) -> None:
+        if len(messages) == 1:
+            body = f'This error message and info was automatically generated:\n\n{messages[0]}'
+        else:
+            body = f'These {len(messages)} error messages and info were automatically generated:'
+            body += ''.join(f'\n\n---\n\n{message}' for message in messages)
+
+        response = self._get_session().post(
+            self.url or f'https://{INTERNAL.ERROR_REPORTING_ENDPOINT}',
+            data={'Message': body},
+            timeout=self.timeout,
         )
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            ASF_LOGGER.error(
+                'asf-search failed to automatically report an error,'
+                'if you have any questions email uso@asf.alaska.edu'
+                f'\nError Text: HTTP {response.status_code}: {response.text}'
+            )
+            return
+        if response.status_code == 200:
+            ASF_LOGGER.error(
+                (
+                    'The asf-search module ecountered an error with CMR,'
+                    'and the following message was automatically reported to ASF:'
+                    f'\n\n"\n{body}\n"'
+                    'If you have any questions email uso@asf.alaska.edu'
+                )
+            )
+
+    def _get_session(self) -> requests.Session:
+        # Reports are never sent through a search's session, so none of its
+        # credentials (EDL token, auth cookies) go along with them
+        if self._session is None:
+            session = requests.Session()
+            defaults = ASFSession().headers
+            session.headers.update(
+                {'User-Agent': defaults['User-Agent'], 'Client-Id': defaults['Client-Id']}
+            )
+            self._session = session
+
+        return self._session
+
+
+_reporter = ErrorReporter()
+
+# Give queued reports a few seconds to go out before exiting
+atexit.register(_reporter.flush, INTERNAL.ERROR_REPORTING_TIMEOUT)
+
+if hasattr(os, 'register_at_fork'):
+    # The worker thread doesn't survive a fork, children start with an empty queue
+    os.register_at_fork(after_in_child=_reporter._reset)
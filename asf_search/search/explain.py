@@ -0,0 +1,58 @@
+from copy import copy
+
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.CMR.subquery import build_subqueries
+from asf_search.CMR import translate_opts
+from asf_search.search.search_generator import preprocess_opts
+from asf_search import INTERNAL
+
+MAX_EXPLAINED_VALUES = 5
+
+
+def explain(opts: ASFSearchOptions = None, **kwargs) -> str:
+    """
+    Describes the CMR requests a search would make, without sending them.
+    Useful for checking how many round trips a large search will take.
+
+    ``` python
+    print(asf_search.explain(platform='SENTINEL-1', relativeOrbit=list(range(1, 176))))
+    ```
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+    kwargs:
+        Any search parameters accepted by `asf_search.search()`.
+        Search parameters specified outside `opts` will override in event of a conflict.
+
+    Returns
+    -------
+    A human readable summary of each planned CMR request and its parameters
+    """
+    opts = ASFSearchOptions() if opts is None else copy(opts)
+
+    # Anything passed in as kwargs has priority over anything in opts:
+    kw_opts = ASFSearchOptions(**dict((k, v) for k, v in kwargs.items() if v is not None))
+    opts.merge_args(**dict(kw_opts))
+
+    preprocess_opts(opts)
+
+    url = '/'.join(s.strip('/') for s in [f'https://{opts.host}', f'{INTERNAL.CMR_GRANULE_PATH}'])
+    queries = build_subqueries(opts)
+
+    lines = [f'{len(queries)} CMR request(s) to {url}']
+    for query_idx, query in enumerate(queries):
+        lines.append(f'Request {query_idx + 1}:')
+
+        # Repeated keys (collections, granule names, attributes) are listed once
+        grouped = {}
+        for key, value in translate_opts(query):
+            grouped.setdefault(key, []).append(str(value))
+
+        for key, values in grouped.items():
+            if len(values) > MAX_EXPLAINED_VALUES:
+                values = [*values[:MAX_EXPLAINED_VALUES], f'... ({len(values)} values)']
+            lines.append(f'    {key}: {" | ".join(values)}')
+
+    return '\n'.join(lines)
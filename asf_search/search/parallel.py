@@ -0,0 +1,62 @@
+from copy import copy
+from typing import List
+
+from asf_search import ASF_LOGGER, ASFSearchResults
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.ASFSession import ASFSession
+
+
+def get_isolated_session(session: ASFSession) -> ASFSession:
+    """
+    Returns a copy of the session with its own headers, sharing auth, cookies and connection pools.
+    `search_generator()` keeps its `CMR-Search-After` cursor in the session headers,
+    so searches running at the same time each need their own.
+    """
+    isolated = copy(session)
+    isolated.headers = copy(session.headers)
+    return isolated
+
+
+def merge_results(
+    results_list: List[ASFSearchResults], opts: ASFSearchOptions
+) -> ASFSearchResults:
+    """
+    Merges the results of searches run in parallel, dropping products found by more than one
+    search and sorting them the same as `search()`
+
+    :param results_list: the results of each search
+    :param opts: the search options of the combined search
+
+    :return: the combined `ASFSearchResults`
+    """
+    results = ASFSearchResults([], opts=opts)
+    results.searchComplete = all(partial.searchComplete for partial in results_list)
+
+    seen = set()
+    for partial in results_list:
+        for product in partial:
+            product_id = get_product_id(product)
+            if product_id not in seen:
+                seen.add(product_id)
+                results.append(product)
+
+    if not results.searchComplete:
+        ASF_LOGGER.error(
+            'Results may be incomplete due to a search error. '
+            'See ASF_LOGGER logging for more details.'
+        )
+
+    try:
+        results.sort(key=lambda p: p.get_sort_keys(), reverse=True)
+    except TypeError as exc:
+        ASF_LOGGER.warning(f'Failed to sort final results, leaving results unsorted. Reason: {exc}')
+
+    return results
+
+
+def get_product_id(product):
+    """Returns the CMR granule concept-id of a product, or its sort keys if it doesn't have one"""
+    if product.meta is not None and product.meta.get('concept-id') is not None:
+        return product.meta['concept-id']
+
+    return product.get_sort_keys()
@@ -6,14 +6,14 @@ from requests import ReadTimeout, Response
 from tenacity import (
     retry,
     retry_if_exception_type,
+    retry_if_not_exception_type,
     stop_after_attempt,
     wait_exponential,
     wait_fixed,
 )
 import datetime
-import dateparser
 
-from asf_search import ASF_LOGGER
+from asf_search import ASF_LOGGER, instrumentation
 
 from asf_search.ASFSearchResults import ASFSearchResults
 from asf_search.ASFSearchOptions import ASFSearchOptions
@@ -21,16 +21,19 @@ from asf_search.CMR import build_subqueries, translate_opts
 from asf_search.CMR.datasets import dataset_collections
 
 from asf_search.ASFSession import ASFSession
+from asf_search.Throttle import THROTTLE_STATUS_CODES, get_session_throttle, throttled_request
 from asf_search.ASFProduct import ASFProduct
 from asf_search.exceptions import (
     ASFSearch4xxError,
     ASFSearch5xxError,
     ASFSearchError,
+    ASFSearchThrottledError,
     CMRIncompleteError,
 )
 from asf_search.constants import INTERNAL
 from asf_search.WKT.validate_wkt import validate_wkt
 from asf_search.search.error_reporting import report_search_error
+from asf_search.dates import parse_user_date
 import asf_search.Products as ASFProductType
 
 
@@ -241,6 +244,7 @@ def search_generator(
 
     for subquery_idx, query in enumerate(queries):
         ASF_LOGGER.info(f'SUBQUERY {subquery_idx + 1}: Beginning subquery with opts: {query}')
+        subquery_start = (time.time(), time.perf_counter())
 
         ASF_LOGGER.debug(f'TRANSLATION: Translating subquery:\n{query}')
         translated_opts = translate_opts(query)
@@ -290,6 +294,13 @@ def search_generator(
             yield last_page
 
             if last_page.searchComplete:
+                instrumentation.emit(
+                    'search.subquery',
+                    start=subquery_start[0],
+                    duration=time.perf_counter() - subquery_start[1],
+                    items=subquery_count,
+                    attributes={'subquery': subquery_idx, 'pages': page_number},
+                )
                 if total == maxResults:  # the user has as many results as they wanted
                     ASF_LOGGER.info(f'SEARCH COMPLETE: MaxResults ({maxResults}) reached')
                     opts.session.headers.pop('CMR-Search-After', None)
@@ -319,12 +330,26 @@ def query_cmr(
     translated_opts: Dict,
     sub_query_count: int,
 ):
-    response = get_page(session=session, url=url, translated_opts=translated_opts)
-
-    perf = time.time()
-    items = [as_ASFProduct(f, session=session) for f in response.json()['items']]
-    ASF_LOGGER.debug(f'Product Subclassing Time {time.time() - perf}')
-    hits: int = response.json()['hits']  # total count of products given search opts
+    with instrumentation.span('search.page', url=url) as page_event:
+        response = get_page(session=session, url=url, translated_opts=translated_opts)
+
+        with instrumentation.span('search.decode') as event:
+            page = response.json()
+            if event is not None:
+                event.bytes = len(response.content)
+                event.items = len(page['items'])
+
+        perf = time.time()
+        with instrumentation.span('search.subclass', items=len(page['items'])) as event:
+            items = [as_ASFProduct(f, session=session) for f in page['items']]
+            if event is not None:
+                event.items = len(items)
+        ASF_LOGGER.debug(f'Product Subclassing Time {time.time() - perf}')
+        hits: int = page['hits']  # total count of products given search opts
+
+        if page_event is not None:
+            page_event.status = response.status_code
+            page_event.items = len(items)
     # 9-10 per process
     # 3.9-5 per process
     # sometimes CMR returns results with the wrong page size
@@ -355,9 +380,14 @@ def process_page(
     return last_page
 
 
+# Throttled requests were already retried by the session's throttle (`Throttle.max_retries`),
+# they aren't retried again here for each of its attempts
 @retry(
     reraise=True,
-    retry=retry_if_exception_type(ASFSearch5xxError),
+    retry=(
+        retry_if_exception_type(ASFSearch5xxError)
+        & retry_if_not_exception_type(ASFSearchThrottledError)
+    ),
     wait=wait_exponential(
         multiplier=1, min=3, max=10
     ),  # Wait 2^x * 1 starting with 3 seconds, max 10 seconds between retries
@@ -367,19 +397,30 @@ def get_page(session: ASFSession, url: str, translated_opts: List) -> Response:
     from asf_search.constants.INTERNAL import CMR_TIMEOUT
 
     perf = time.time()
-    try:
-        response = session.post(url=url, data=translated_opts, timeout=CMR_TIMEOUT)
-        response.raise_for_status()
-    except HTTPError as exc:
-        error_message = f'HTTP {response.status_code}: {response.json()["errors"]}'
-        if 400 <= response.status_code <= 499:
-            raise ASFSearch4xxError(error_message) from exc
-        if 500 <= response.status_code <= 599:
-            raise ASFSearch5xxError(error_message) from exc
-    except ReadTimeout as exc:
-        raise ASFSearchError(
-            f'Connection Error (Timeout): CMR took too long to respond. Set asf constant "asf_search.constants.INTERNAL.CMR_TIMEOUT" to increase. ({url=}, timeout={CMR_TIMEOUT})'
-        ) from exc
+    with instrumentation.span('search.request', url=url) as event:
+        try:
+            response = throttled_request(
+                session,
+                url,
+                lambda: session.post(url=url, data=translated_opts, timeout=CMR_TIMEOUT),
+            )
+            if event is not None:
+                event.status = response.status_code
+                event.bytes = len(response.content)
+            response.raise_for_status()
+        except HTTPError as exc:
+            error_message = f'HTTP {response.status_code}: {response.json()["errors"]}'
+            if 400 <= response.status_code <= 499:
+                raise ASFSearch4xxError(error_message) from exc
+            if 500 <= response.status_code <= 599:
+                throttle = get_session_throttle(session, url)
+                if throttle is not None and response.status_code in THROTTLE_STATUS_CODES:
+                    raise ASFSearchThrottledError(error_message) from exc
+                raise ASFSearch5xxError(error_message) from exc
+        except ReadTimeout as exc:
+            raise ASFSearchError(
+                f'Connection Error (Timeout): CMR took too long to respond. Set asf constant "asf_search.constants.INTERNAL.CMR_TIMEOUT" to increase. ({url=}, timeout={CMR_TIMEOUT})'
+            ) from exc
 
     ASF_LOGGER.info(f'Query Time Elapsed {time.time() - perf}')
     return response
@@ -411,9 +452,9 @@ def wrap_wkt(opts: ASFSearchOptions):
 
 def set_default_dates(opts: ASFSearchOptions):
     if opts.start is not None and isinstance(opts.start, str):
-        opts.start = dateparser.parse(opts.start, settings={'RETURN_AS_TIMEZONE_AWARE': True})
+        opts.start = parse_user_date(opts.start, settings={'RETURN_AS_TIMEZONE_AWARE': True})
     if opts.end is not None and isinstance(opts.end, str):
-        opts.end = dateparser.parse(opts.end, settings={'RETURN_AS_TIMEZONE_AWARE': True})
+        opts.end = parse_user_date(opts.end, settings={'RETURN_AS_TIMEZONE_AWARE': True})
     # If both are used, make sure they're in the right order:
     if opts.start is not None and opts.end is not None:
         if opts.start > opts.end:
@@ -0,0 +1,145 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+from asf_search import ASF_LOGGER, ASFSearchResults
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.constants import INTERNAL
+from asf_search.dates import parse_iso8601
+from asf_search.search.search import search
+from asf_search.search.search_count import search_count
+from asf_search.search.search_generator import search_generator, set_default_dates
+from asf_search.search.parallel import get_isolated_session, merge_results
+
+# Used when no start date is given, matches the default CMR temporal range in `translate_opts()`
+DEFAULT_START = datetime(1978, 1, 1, tzinfo=timezone.utc)
+
+
+def sharded_search(
+    opts: ASFSearchOptions = None,
+    shards: int = 8,
+    max_workers: int = None,
+    **kwargs,
+) -> ASFSearchResults:
+    """
+    Performs a search by splitting the `start`/`end` temporal range into shards
+    with roughly equal hit counts, paging through each shard in parallel.
+
+    CMR pages a single query sequentially (each page needs the previous page's cursor),
+    each shard has its own cursor, so very large searches finish several times faster.
+    Results are de-duplicated and returned in the same order as `search()`.
+
+    ``` python
+    results = asf_search.sharded_search(platform='SENTINEL-1', processingLevel='SLC',
+                                        intersectsWith=wkt, shards=16)
+    ```
+
+    Parameters
+    ----------
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+    shards:
+        The maximum number of temporal shards to split the search into
+    max_workers:
+        The number of shards to page through at once, defaults to `shards`
+    kwargs:
+        Any search parameters accepted by `asf_search.search()`.
+        Search parameters specified outside `opts` will override in event of a conflict.
+
+    Returns
+    -------
+    `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct)
+    """
+    opts = ASFSearchOptions() if opts is None else copy(opts)
+
+    # Anything passed in as kwargs has priority over anything in opts:
+    kw_opts = ASFSearchOptions(**dict((k, v) for k, v in kwargs.items() if v is not None))
+    opts.merge_args(**dict(kw_opts))
+
+    if opts.maxResults is not None:
+        # The first n results in sort order could come from any shard
+        ASF_LOGGER.info('SHARDED SEARCH: maxResults is set, falling back to search()')
+        return search(opts=opts)
+
+    intervals = get_temporal_shards(opts, shards)
+    if len(intervals) <= 1:
+        ASF_LOGGER.info('SHARDED SEARCH: search too small to shard, falling back to search()')
+        return search(opts=opts)
+
+    ASF_LOGGER.info(f'SHARDED SEARCH: searching {len(intervals)} shards: {intervals}')
+
+    shard_opts = []
+    for start, end, _ in intervals:
+        shard = copy(opts)
+        shard.start = start
+        shard.end = end
+        shard.session = get_isolated_session(opts.session)
+        shard_opts.append(shard)
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(shard_opts)) as executor:
+        shard_results = list(executor.map(_search_shard, shard_opts))
+
+    # Products spanning a shard boundary are returned by both shards
+    return merge_results(shard_results, opts)
+
+
+def get_temporal_shards(
+    opts: ASFSearchOptions, shards: int
+) -> List[Tuple[datetime, datetime, int]]:
+    """
+    Splits the search's temporal range into at most `shards` intervals of roughly equal hit counts,
+    by repeatedly halving the interval with the most hits. Intervals without any hits are dropped.
+    Intervals share their boundaries, products at a boundary are counted (and searched) in both.
+
+    :param opts: the search options to shard
+    :param shards: the maximum number of intervals to return
+
+    :return: a chronological list of (start, end, hit count) tuples
+    """
+    bounds = copy(opts)
+    set_default_dates(bounds)
+
+    start = DEFAULT_START if bounds.start is None else parse_iso8601(bounds.start)
+    end = datetime.now(timezone.utc) if bounds.end is None else parse_iso8601(bounds.end)
+
+    total = _count_interval(opts, start, end)
+    intervals = [(start, end, total)] if total else []
+
+    # Each split costs two count requests, give up on pathological distributions
+    for _ in range(shards * 4):
+        if len(intervals) == 0 or len(intervals) >= shards:
+            break
+
+        idx = max(range(len(intervals)), key=lambda i: intervals[i][2])
+        lo, hi, count = intervals[idx]
+        if count <= INTERNAL.CMR_PAGE_SIZE or hi - lo < timedelta(seconds=2):
+            break
+
+        mid = (lo + (hi - lo) / 2).replace(microsecond=0)
+        # CMR temporal ranges include both ends, so products at `mid` are in both halves
+        halves = [
+            (lo, mid, _count_interval(opts, lo, mid)),
+            (mid, hi, _count_interval(opts, mid, hi)),
+        ]
+        intervals[idx : idx + 1] = [half for half in halves if half[2] > 0]
+
+    return intervals
+
+
+def _count_interval(opts: ASFSearchOptions, start: datetime, end: datetime) -> int:
+    interval = copy(opts)
+    interval.start = start
+    interval.end = end
+    return search_count(opts=interval)
+
+
+def _search_shard(opts: ASFSearchOptions) -> ASFSearchResults:
+    results = ASFSearchResults([], opts=opts)
+    # A shard without any results has nothing left to search
+    results.searchComplete = True
+    for page in search_generator(opts=opts):
+        results.extend(page)
+        results.searchComplete = page.searchComplete
+
+    return results
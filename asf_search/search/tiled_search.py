@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from typing import Union
+
+from shapely import wkt
+from shapely.geometry.base import BaseGeometry
+
+from asf_search import ASF_LOGGER, ASFSearchResults
+from asf_search.ASFSearchOptions import ASFSearchOptions
+from asf_search.WKT.tile_aoi import tile_aoi
+from asf_search.search.search import search
+from asf_search.search.parallel import get_isolated_session, merge_results
+
+
+def tiled_search(
+    intersectsWith: Union[str, BaseGeometry],
+    opts: ASFSearchOptions = None,
+    max_tiles: int = 16,
+    min_fill: float = 0.8,
+    max_workers: int = None,
+    exact: bool = False,
+    **kwargs,
+) -> ASFSearchResults:
+    """
+    Performs a search over a large or irregular area of interest by splitting it into tiles
+    (see `asf_search.tile_aoi()`) and searching each tile in parallel.
+
+    CMR is searched with the convex hull of the area of interest (see `validate_wkt()`),
+    which for a country or coastline covers far more area than the shape itself.
+    Searching tighter tiles returns fewer products outside the real area.
+
+    ``` python
+    results = asf_search.tiled_search(country_wkt, platform='SENTINEL-1', exact=True)
+    ```
+
+    Parameters
+    ----------
+    intersectsWith:
+        The area of interest to search, as a WKT string or Shapely Geometry
+    opts:
+        An ASFSearchOptions object describing the search parameters to be used.
+    max_tiles:
+        The maximum number of tiles to split the area of interest into
+    min_fill:
+        The fraction of its convex hull a tile should cover before it stops being split
+    max_workers:
+        The number of tiles to search at once, defaults to the number of tiles
+    exact:
+        Only return products whose footprints intersect the original area of interest
+        (unwrapping footprints that cross the antimeridian), and products without a footprint
+    kwargs:
+        Any search parameters accepted by `asf_search.search()`.
+        Search parameters specified outside `opts` will override in event of a conflict.
+
+    Returns
+    -------
+    `asf_search.ASFSearchResults` (list of search results of subclass ASFProduct)
+    """
+    aoi = wkt.loads(intersectsWith) if isinstance(intersectsWith, str) else intersectsWith
+
+    opts = ASFSearchOptions() if opts is None else copy(opts)
+
+    # Anything passed in as kwargs has priority over anything in opts:
+    kw_opts = ASFSearchOptions(**dict((k, v) for k, v in kwargs.items() if v is not None))
+    opts.merge_args(**dict(kw_opts), intersectsWith=aoi.wkt)
+
+    tiles = tile_aoi(aoi, max_tiles=max_tiles, min_fill=min_fill)
+
+    if opts.maxResults is not None or len(tiles) == 1:
+        # The first n results in sort order could come from any tile
+        ASF_LOGGER.info('TILED SEARCH: searching area of interest as a single tile')
+        results = search(opts=opts)
+    else:
+        ASF_LOGGER.info(f'TILED SEARCH: searching {len(tiles)} tiles')
+
+        tile_opts = []
+        for tile in tiles:
+            tile_search = copy(opts)
+            tile_search.intersectsWith = tile.wkt
+            tile_search.session = get_isolated_session(opts.session)
+            tile_opts.append(tile_search)
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(tile_opts)) as executor:
+            tile_results = list(executor.map(lambda tile: search(opts=tile), tile_opts))
+
+        # Products overlapping more than one tile are returned by each of them
+        results = merge_results(tile_results, opts)
+
+    if exact:
+        # Products without a footprint can't be ruled out, so they're kept
+        results = results.spatial_filter(aoi, keep_missing=True)
+
+    return results
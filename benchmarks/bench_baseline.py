@@ -0,0 +1,39 @@
+import pytest
+
+from asf_search import (
+    SBASNetwork,
+    Stack,
+    calculate_perpendicular_baselines,
+    get_baseline_from_stack,
+)
+
+# Building every pair of the stack takes seconds, so these get a fixed number of rounds
+ROUNDS = 3
+
+
+@pytest.mark.benchmark(group='baseline')
+def bench_calculate_perpendicular_baselines(benchmark, s1_stack):
+    reference = s1_stack[0].properties['sceneName']
+
+    stack = benchmark(calculate_perpendicular_baselines, reference, list(s1_stack))
+    assert len(stack) == len(s1_stack)
+
+
+@pytest.mark.benchmark(group='baseline')
+def bench_get_baseline_from_stack(benchmark, s1_stack):
+    stack, warnings = benchmark(get_baseline_from_stack, s1_stack[0], s1_stack)
+    assert len(stack) == len(s1_stack)
+
+
+@pytest.mark.benchmark(group='baseline')
+def bench_stack_from_search_results(benchmark, s1_stack):
+    stack = benchmark.pedantic(Stack.from_search_results, (s1_stack,), rounds=ROUNDS, iterations=1)
+    assert len(stack.full_stack)
+
+
+@pytest.mark.benchmark(group='baseline')
+def bench_sbas_network_from_search_results(benchmark, s1_stack):
+    network = benchmark.pedantic(
+        SBASNetwork.from_search_results, (s1_stack,), rounds=ROUNDS, iterations=1
+    )
+    assert len(network.full_stack)
@@ -0,0 +1,70 @@
+import os
+import tempfile
+
+import pytest
+
+from asf_search import ASFSearchResults, ASFSession, download_bursts, download_urls, remotezip
+from asf_search.search.search_generator import as_ASFProduct
+
+from resources import load_resource
+
+ROUNDS = 5
+
+
+def _fresh_directory():
+    # Existing files are skipped, so every round downloads into a new directory
+    return tempfile.mkdtemp(prefix='asf_search_benchmark_')
+
+
+@pytest.mark.benchmark(group='download')
+def bench_download_urls(benchmark, download_server, download_files):
+    urls = [f'{download_server.url}/{name}' for name in download_files if name.startswith('file_')]
+    session = ASFSession()
+
+    def download(path):
+        download_urls(urls, path, session=session)
+        return path
+
+    path = benchmark.pedantic(
+        download, setup=lambda: ((_fresh_directory(),), {}), rounds=ROUNDS, iterations=1
+    )
+    assert len(os.listdir(path)) == len(urls)
+
+
+@pytest.mark.benchmark(group='download')
+@pytest.mark.parametrize('extraction_time', [0.0, 0.5])
+def bench_download_bursts(benchmark, download_server, extraction_time):
+    session = ASFSession()
+    items = load_resource('SLC_BURST_stack.yml')[:16]
+    products = ASFSearchResults([as_ASFProduct(item, session) for item in items])
+    for idx, product in enumerate(products):
+        product.properties['url'] = f'{download_server.url}/bursts/{idx}/3.tiff'
+
+    def setup():
+        download_server.extraction_time = extraction_time
+        download_server.reset_extractions()
+        return (_fresh_directory(),), {}
+
+    def download(path):
+        download_bursts(products, path, max_in_flight=8, poll_interval=0.1)
+        return path
+
+    try:
+        path = benchmark.pedantic(download, setup=setup, rounds=ROUNDS, iterations=1)
+    finally:
+        download_server.extraction_time = 0.0
+
+    assert len(os.listdir(path)) == len(products)
+
+
+@pytest.mark.benchmark(group='download')
+def bench_remotezip_listing(benchmark, download_server):
+    pytest.importorskip('remotezip')
+    session = ASFSession()
+    url = f'{download_server.url}/archive.zip'
+
+    def list_members():
+        with remotezip(url, session) as archive:
+            return archive.namelist()
+
+    assert len(benchmark(list_members)) == 100
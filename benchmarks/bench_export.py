@@ -0,0 +1,134 @@
+import io
+
+import pytest
+
+from asf_search import ASFSearchResults, ASFSession
+from asf_search.export.parallel import encode_pages
+from asf_search.export.writers import TEXT_FORMATS, export_stream
+from asf_search.search.search_generator import as_ASFProduct
+
+# Results are rebuilt before each round, so the export preparation cached on products
+# (`ASFSearchResults_to_properties_list()`) is measured every time
+ROUNDS = 5
+
+
+@pytest.mark.benchmark(group='export')
+@pytest.mark.parametrize('format', TEXT_FORMATS)
+def bench_export(benchmark, make_results, format):
+    def setup():
+        results = make_results()
+        if format == 'kml':
+            # The KML writer requires `processingLevel`, which ALOS-2 products don't set
+            results = ASFSearchResults(
+                [product for product in results if 'processingLevel' in product.properties]
+            )
+        return (results,), {}
+
+    def export(results):
+        fh = io.StringIO(newline='')
+        export_stream(results, fh, format)
+        return fh.tell()
+
+    written = benchmark.pedantic(export, setup=setup, rounds=ROUNDS, iterations=1)
+    assert written > 0
+
+
+@pytest.mark.benchmark(group='export')
+@pytest.mark.parametrize('format', ['json', 'jsonlite', 'jsonlite2', 'geojson'])
+def bench_export_compact(benchmark, make_results, format):
+    def export(results):
+        fh = io.StringIO(newline='')
+        export_stream(results, fh, format, compact=True)
+        return fh.tell()
+
+    written = benchmark.pedantic(
+        export, setup=lambda: ((make_results(),), {}), rounds=ROUNDS, iterations=1
+    )
+    assert written > 0
+
+
+@pytest.mark.benchmark(group='export')
+def bench_export_geoparquet(benchmark, make_results, tmp_path):
+    pytest.importorskip('pyarrow')
+
+    def export(results):
+        results.geoparquet(str(tmp_path / 'results.parquet'))
+
+    benchmark.pedantic(export, setup=lambda: ((make_results(),), {}), rounds=ROUNDS, iterations=1)
+
+
+@pytest.mark.benchmark(group='export')
+def bench_export_ipc(benchmark, make_results, tmp_path):
+    pytest.importorskip('pyarrow')
+
+    def export(results):
+        results.to_ipc(str(tmp_path / 'results.arrow'))
+
+    benchmark.pedantic(export, setup=lambda: ((make_results(),), {}), rounds=ROUNDS, iterations=1)
+
+
+@pytest.mark.benchmark(group='parallel_export')
+@pytest.mark.parametrize('format', ['csv', 'kml', 'json'])
+@pytest.mark.parametrize('processes', [1, 4])
+def bench_export_parallel(benchmark, make_results, format, processes):
+    def setup():
+        results = make_results(2000)
+        if format == 'kml':
+            results = ASFSearchResults(
+                [product for product in results if 'processingLevel' in product.properties]
+            )
+        return (results,), {}
+
+    def export(results):
+        return sum(
+            len(chunk)
+            for chunk in encode_pages(results, format, processes=processes, page_size=250)
+        )
+
+    written = benchmark.pedantic(export, setup=setup, rounds=ROUNDS, iterations=1)
+    assert written > 0
+
+
+@pytest.mark.benchmark(group='ipc')
+@pytest.mark.parametrize('method', ['from_ipc', 'rebuild'])
+def bench_ipc_load(benchmark, make_results, tmp_path, method):
+    pytest.importorskip('pyarrow')
+    results = make_results()
+    path = str(tmp_path / 'results.arrow')
+    results.to_ipc(path)
+
+    def load():
+        if method == 'from_ipc':
+            return ASFSearchResults.from_ipc(path)
+        # Translating each product's UMM again, what loading from IPC replaces
+        session = ASFSession()
+        return [as_ASFProduct({'meta': p.meta, 'umm': p.umm}, session) for p in results]
+
+    assert len(benchmark(load)) == len(results)
+
+
+@pytest.mark.benchmark(group='writes')
+@pytest.mark.parametrize('format', ['csv', 'kml', 'metalink'])
+@pytest.mark.parametrize('method', ['export_stream', 'chunks'])
+def bench_file_writes(benchmark, make_results, tmp_path, format, method):
+    results = make_results(2000)
+    if format == 'kml':
+        results = ASFSearchResults(
+            [product for product in results if 'processingLevel' in product.properties]
+        )
+    # Prepares (and caches) each product's export properties, so only writing is compared
+    ''.join(chunk for chunk in results.csv() if chunk)
+    path = str(tmp_path / f'results.{format}')
+
+    def write():
+        with open(path, 'w', newline='') as fh:
+            if method == 'export_stream':
+                export_stream(results, fh, format)
+            else:
+                # Each streamed chunk written as it comes, what `export_stream()` replaces
+                for chunk in getattr(results, format)():
+                    if chunk:
+                        fh.write(chunk)
+            return fh.tell()
+
+    assert benchmark(write) > 0
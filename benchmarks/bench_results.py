@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from asf_search import ASFProduct, ASFSearchResults
+
+# A large search's worth of products, to triage by path and frame
+TRIAGE_PRODUCTS = 100000
+
+
+@pytest.fixture(scope='module')
+def triage_results() -> ASFSearchResults:
+    """Products with random paths, frames and start times, and no footprints"""
+    rng = np.random.default_rng(0)
+    paths = rng.integers(1, 176, TRIAGE_PRODUCTS).tolist()
+    frames = rng.integers(1, 500, TRIAGE_PRODUCTS).tolist()
+    days = rng.integers(0, 3000, TRIAGE_PRODUCTS)
+    dates = (np.datetime64('2016-01-01T00:00:00') + days * np.timedelta64(1, 'D')).astype(str)
+
+    products = []
+    for path, frame, date in zip(paths, frames, dates):
+        product = ASFProduct()
+        product.properties = {'pathNumber': path, 'frameNumber': frame, 'startTime': f'{date}Z'}
+        product.geometry = {'coordinates': None, 'type': 'Polygon'}
+        products.append(product)
+
+    return ASFSearchResults(products)
+
+
+@pytest.mark.benchmark(group='columns')
+def bench_columns_build(benchmark, triage_results):
+    columns = benchmark(triage_results.columns)
+    assert len(columns) == TRIAGE_PRODUCTS
+
+
+@pytest.mark.benchmark(group='columns')
+@pytest.mark.parametrize('method', ['columns', 'loop'])
+def bench_columns_triage(benchmark, triage_results, method):
+    paths = range(1, 60)
+
+    def columns(results):
+        selected = results.filter(pathNumber=list(paths)).sort_by('frameNumber')
+        return selected.groupby('pathNumber')
+
+    # The same triage over product dictionaries, what `ResultColumns` replaces
+    def loop(results):
+        groups = {}
+        selected = [p for p in results if p.properties['pathNumber'] in paths]
+        for product in sorted(selected, key=lambda p: p.properties['frameNumber']):
+            groups.setdefault(product.properties['pathNumber'], []).append(product)
+        return groups
+
+    if method == 'columns':
+        groups = benchmark(columns, triage_results.columns())
+    else:
+        groups = benchmark(loop, triage_results)
+
+    assert len(groups) == len(paths)
@@ -0,0 +1,98 @@
+from copy import copy
+
+import pytest
+
+from asf_search import ASFSearchOptions, ASFSession, search_count, search_generator
+from asf_search.CMR.subquery import build_subqueries
+from asf_search.search.search_generator import as_ASFProduct
+
+
+def _count_results(opts: ASFSearchOptions) -> int:
+    return sum(len(page) for page in search_generator(opts=copy(opts)))
+
+
+@pytest.mark.benchmark(group='search')
+def bench_search_generator(benchmark, cmr):
+    opts = ASFSearchOptions(host=cmr.host, session=cmr.session(), platform='SENTINEL-1')
+
+    assert benchmark(_count_results, opts) == len(cmr.items)
+
+
+@pytest.mark.benchmark(group='search')
+@pytest.mark.parametrize('latency', [0.01, 0.05])
+def bench_search_generator_latency(benchmark, cmr, latency):
+    cmr.latency = latency
+    opts = ASFSearchOptions(host=cmr.host, session=cmr.session(), platform='SENTINEL-1')
+
+    assert benchmark(_count_results, opts) == len(cmr.items)
+
+
+@pytest.mark.benchmark(group='search')
+def bench_search_generator_throttled(benchmark, cmr):
+    # Every 5th page is throttled (503, Retry-After: 0) and retried
+    cmr.fail_every = 5
+    opts = ASFSearchOptions(host=cmr.host, session=cmr.session(), platform='SENTINEL-1')
+
+    assert benchmark(_count_results, opts) == len(cmr.items)
+
+
+@pytest.mark.benchmark(group='search')
+def bench_search_count(benchmark, cmr):
+    opts = ASFSearchOptions(host=cmr.host, session=cmr.session(), platform='SENTINEL-1')
+
+    assert benchmark(search_count, opts=opts) == len(cmr.items)
+
+
+def _fan_out_opts() -> ASFSearchOptions:
+    """Options that fan out into thousands of subqueries"""
+    return ASFSearchOptions(
+        platform='SENTINEL-1',
+        beamMode=['IW', 'EW', 'SM'],
+        polarization=['VV', 'VV+VH', 'HH', 'HH+HV'],
+        relativeOrbit=list(range(1, 176, 2)),
+        granule_list=[f'S1A_IW_SLC__1SDV_{idx}' for idx in range(2000)],
+    )
+
+
+@pytest.mark.benchmark(group='subqueries')
+def bench_build_subqueries(benchmark):
+    opts = _fan_out_opts()
+
+    assert len(benchmark(build_subqueries, opts)) > 1000
+
+
+@pytest.mark.benchmark(group='subqueries')
+def bench_copy_subqueries(benchmark):
+    subqueries = build_subqueries(_fan_out_opts())
+
+    copies = benchmark(lambda: [dict(copy(subquery)) for subquery in subqueries])
+    assert len(copies) == len(subqueries)
+
+
+@pytest.mark.benchmark(group='parsing')
+def bench_as_ASFProduct(benchmark, cmr_items):
+    session = ASFSession()
+    items = cmr_items[:1000]
+
+    products = benchmark(lambda: [as_ASFProduct(item, session) for item in items])
+    assert len(products) == len(items)
+
+
+@pytest.mark.benchmark(group='parsing')
+@pytest.mark.parametrize(
+    'resource',
+    [
+        'SLC_BURST_stack.yml',
+        'ARIAS1GUNW_stack.yml',
+        'ALOS_2_stack.yml',
+        'RADARSAT_stack.yml',
+        'OPERA_Products.yml',
+        'S1A_IW_SLC__1SSV_20160528T141908_20160528T141938_011460_011746_335C_stack.yml',
+    ],
+)
+def bench_as_ASFProduct_by_type(benchmark, resource_items, resource):
+    session = ASFSession()
+    items = resource_items[resource]
+
+    products = benchmark(lambda: [as_ASFProduct(item, session) for item in items])
+    assert len(products) == len(items)
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from shapely import wkt
+from shapely.geometry import shape
+
+from asf_search import ASFProduct, ASFSearchResults, validate_wkt
+
+from resources import load_resource
+
+WKTS = {
+    'point': 'POINT(-147.7 64.8)',
+    'polygon': 'POLYGON((-148 64, -147 64, -147 65, -148 65, -148 64))',
+    # Clockwise, so it's reversed
+    'clockwise': 'POLYGON((-148 64, -148 65, -147 65, -147 64, -148 64))',
+    # Crosses the antimeridian, so it's wrapped
+    'antimeridian': 'POLYGON((179 60, 181 60, 181 61, 179 61, 179 60))',
+    'multipolygon': (
+        'MULTIPOLYGON(((-148 64, -147 64, -147 65, -148 65, -148 64)),'
+        '((-146 64, -145 64, -145 65, -146 65, -146 64)))'
+    ),
+    'linestring': 'LINESTRING(-148 64, -147 64.5, -146 64, -145 64.5)',
+}
+
+
+@pytest.mark.benchmark(group='wkt')
+@pytest.mark.parametrize('shape', list(WKTS))
+def bench_validate_wkt(benchmark, shape):
+    wrapped, unwrapped, repairs = benchmark(validate_wkt, WKTS[shape])
+    assert wrapped.is_valid
+
+
+@pytest.mark.benchmark(group='wkt')
+def bench_validate_wkt_many_points(benchmark):
+    wkt = load_resource('Shovel_Creek_many_points.yml')['wkt']
+
+    wrapped, unwrapped, repairs = benchmark(validate_wkt, wkt)
+    assert wrapped.is_valid
+
+
+@pytest.mark.benchmark(group='footprints')
+@pytest.mark.parametrize('operation', ['footprints', 'centroids', 'bounds', 'areas'])
+def bench_footprint_operations(benchmark, make_results, operation):
+    # Footprints are cached on products, so every round starts from fresh results
+    def run(results):
+        return getattr(results, operation)()
+
+    values = benchmark.pedantic(
+        run, setup=lambda: ((make_results(),), {}), rounds=5, iterations=1
+    )
+    assert len(values) == 1000
+
+
+# An L shaped area of interest, whose convex hull covers much more than the shape itself
+SPATIAL_FILTER_AOI = 'POLYGON((0 0, 10 0, 10 2, 2 2, 2 10, 0 10, 0 0))'
+
+
+def _scattered_boxes(count: int = 50000) -> ASFSearchResults:
+    """Unit box footprints scattered over and around `SPATIAL_FILTER_AOI`"""
+    products = []
+    for x, y in np.random.default_rng(0).uniform(-10, 20, size=(count, 2)).tolist():
+        product = ASFProduct()
+        product.geometry = {
+            'type': 'Polygon',
+            'coordinates': [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]],
+        }
+        products.append(product)
+
+    return ASFSearchResults(products)
+
+
+def _loop_spatial_filter(results: ASFSearchResults, min_overlap: float) -> list:
+    """`spatial_filter()` one product at a time, what it replaces"""
+    aoi = wkt.loads(SPATIAL_FILTER_AOI)
+    filtered = []
+    for product in results:
+        footprint = shape(product.geometry)
+        if not footprint.intersects(aoi):
+            continue
+        if footprint.intersection(aoi).area >= min_overlap * footprint.area:
+            filtered.append(product)
+
+    return filtered
+
+
+@pytest.mark.benchmark(group='spatial_filter')
+@pytest.mark.parametrize('method', ['spatial_filter', 'loop'])
+def bench_spatial_filter(benchmark, method):
+    # Footprints are cached on products, so every round starts from fresh results
+    def run(results):
+        if method == 'loop':
+            return _loop_spatial_filter(results, 0.25)
+        return results.spatial_filter(SPATIAL_FILTER_AOI, min_overlap=0.25)
+
+    filtered = benchmark.pedantic(
+        run, setup=lambda: ((_scattered_boxes(),), {}), rounds=5, iterations=1
+    )
+    assert 0 < len(filtered) < 50000
@@ -0,0 +1,97 @@
+import glob
+import io
+import os
+import random
+import zipfile
+
+import pytest
+
+from asf_search import ASFSearchResults, ASFSession
+from asf_search.search.search_generator import as_ASFProduct
+
+from resources import RESOURCES, S1_STACK, load_resource
+from servers import FakeCMR, FakeDownloads
+
+# The number of items the fake CMR serves, a typical large search
+CMR_ITEMS = 5000
+
+
+@pytest.fixture(scope='session')
+def resource_items():
+    """The UMM items of every recorded product list, by resource file name"""
+    items = {}
+    for path in sorted(glob.glob(os.path.join(RESOURCES, '*.yml'))):
+        contents = load_resource(os.path.basename(path))
+        if isinstance(contents, list) and len(contents) and 'umm' in contents[0]:
+            items[os.path.basename(path)] = [
+                {'umm': item['umm'], 'meta': item['meta']} for item in contents
+            ]
+
+    return items
+
+
+@pytest.fixture(scope='session')
+def cmr_items(resource_items):
+    """The recorded items of every platform, repeated up to `CMR_ITEMS` with unique concept-ids"""
+    recorded = [item for items in resource_items.values() for item in items]
+    return [
+        {
+            'umm': recorded[idx % len(recorded)]['umm'],
+            'meta': {**recorded[idx % len(recorded)]['meta'], 'concept-id': f'G{idx}-BENCHMARK'},
+        }
+        for idx in range(CMR_ITEMS)
+    ]
+
+
+@pytest.fixture(scope='session')
+def fake_cmr(cmr_items):
+    with FakeCMR(cmr_items) as cmr:
+        yield cmr
+
+
+@pytest.fixture
+def cmr(fake_cmr):
+    """The shared fake CMR, with latency and failure injection reset after each benchmark"""
+    yield fake_cmr
+    fake_cmr.latency = 0.0
+    fake_cmr.fail_every = None
+
+
+@pytest.fixture(scope='session')
+def make_results(cmr_items):
+    """Builds fresh results each call, so cached export preparation doesn't carry over"""
+
+    def make_results(count: int = 1000) -> ASFSearchResults:
+        session = ASFSession()
+        return ASFSearchResults([as_ASFProduct(item, session) for item in cmr_items[:count]])
+
+    return make_results
+
+
+@pytest.fixture(scope='session')
+def s1_stack():
+    session = ASFSession()
+    return ASFSearchResults([as_ASFProduct(item, session) for item in load_resource(S1_STACK)])
+
+
+@pytest.fixture(scope='session')
+def download_files():
+    rng = random.Random(0)
+    files = {f'file_{idx}.zip': rng.randbytes(1 << 20) for idx in range(16)}
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zf:
+        for idx in range(100):
+            zf.writestr(f'product/measurement/band_{idx}.tiff', rng.randbytes(64 << 10))
+    files['archive.zip'] = archive.getvalue()
+
+    for idx in range(16):
+        files[f'{idx}/3.tiff'] = rng.randbytes(256 << 10)
+
+    return files
+
+
+@pytest.fixture(scope='session')
+def download_server(download_files):
+    with FakeDownloads(download_files) as server:
+        yield server
@@ -0,0 +1,17 @@
+import os
+
+import yaml
+
+RESOURCES = os.path.join(os.path.dirname(__file__), '..', 'tests', 'yml_tests', 'Resources')
+
+# A Sentinel-1 stack with state vectors, for baselines, `Stack` and `SBASNetwork`
+S1_STACK = 'S1A_IW_SLC__1SSV_20160528T141908_20160528T141938_011460_011746_335C_stack.yml'
+
+# The C loader parses the larger recordings several times faster, when libyaml is available
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def load_resource(name: str):
+    """Loads a recording from `tests/yml_tests/Resources`"""
+    with open(os.path.join(RESOURCES, name), 'r') as f:
+        return yaml.load(f, Loader=_Loader)
@@ -0,0 +1,239 @@
+"""
+Local stand-ins for CMR and ASF's download endpoints, so benchmarks run offline and reproducibly.
+Both serve plain HTTP from a background thread on an ephemeral port.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl
+
+from requests.adapters import HTTPAdapter
+
+from asf_search import ASFSession
+
+_RANGE = re.compile(r'bytes=(\d*)-(\d*)$')
+
+
+class _LocalAdapter(HTTPAdapter):
+    """Sends requests for `https://{host}` to a local plain HTTP server instead"""
+
+    def __init__(self, host: str, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.host = host
+        self.base_url = base_url
+
+    def send(self, request, **kwargs):
+        request.url = request.url.replace(f'https://{self.host}', self.base_url, 1)
+        return super().send(request, **kwargs)
+
+
+class _LocalServer:
+    handler = BaseHTTPRequestHandler
+
+    def __init__(self):
+        handler = type(self.handler.__name__, (self.handler,), {'server_state': self})
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_port}'
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _count_request(self) -> int:
+        with self._lock:
+            self.requests += 1
+            return self.requests
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b'', headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+
+class _CMRHandler(_QuietHandler):
+    def do_POST(self):
+        state = self.server_state
+        request_number = state._count_request()
+        form = dict(parse_qsl(self.rfile.read(int(self.headers['Content-Length'])).decode()))
+
+        if state.latency:
+            time.sleep(state.latency)
+
+        if state.fail_every and request_number % state.fail_every == 0:
+            body = json.dumps({'errors': ['injected failure']}).encode()
+            self._send(state.failure_status, body, {'Retry-After': '0'})
+            return
+
+        hits = len(state.items)
+        page_size = int(form.get('page_size', 250))
+        offset = int(self.headers.get('CMR-Search-After') or 0)
+        end = min(offset + page_size, hits)
+
+        body = b''.join(
+            [
+                b'{"hits": %d, "took": 1, "items": [' % hits,
+                b','.join(state.encoded_items[offset:end]),
+                b']}',
+            ]
+        )
+        headers = {'Content-Type': 'application/json'}
+        if page_size and end < hits:
+            headers['CMR-Search-After'] = str(end)
+
+        self._send(200, body, headers)
+
+
+class FakeCMR(_LocalServer):
+    """
+    Replays UMM items as CMR granule search pages, paging with `CMR-Search-After` tokens.
+    Every search matches every item, the query itself is ignored.
+
+    ``` python
+    with FakeCMR(items) as cmr:
+        opts = ASFSearchOptions(host=cmr.host, session=cmr.session())
+        results = asf_search.search(opts=opts)
+    ```
+    """
+
+    handler = _CMRHandler
+    # Searches use `https://{host}`, sessions from `session()` send it to the local server
+    host = 'cmr.benchmark.invalid'
+
+    def __init__(
+        self,
+        items: List[Dict],
+        latency: float = 0.0,
+        fail_every: Optional[int] = None,
+        failure_status: int = 503,
+    ):
+        """
+        :param items: UMM items (`{'umm': ..., 'meta': ...}`) to serve
+        :param latency: seconds to wait before answering each request
+        :param fail_every: answer every nth request with `failure_status` instead.
+            Counted, not random, so runs fail the same requests
+        :param failure_status: the status of injected failures, `429`/`503` are retried
+            by the search throttle, `5xx` by `get_page()` (after several seconds)
+        """
+        super().__init__()
+        self.items = items
+        # Encoded once up front, so the server's own work stays out of the measurements
+        self.encoded_items = [json.dumps(item).encode('utf-8') for item in items]
+        self.latency = latency
+        self.fail_every = fail_every
+        self.failure_status = failure_status
+
+    def session(self, **kwargs) -> ASFSession:
+        """An `ASFSession` that sends requests for `https://{host}` to this server"""
+        session = ASFSession(**kwargs)
+        session.mount(f'https://{self.host}', _LocalAdapter(self.host, self.url, pool_maxsize=32))
+        return session
+
+
+class _DownloadHandler(_QuietHandler):
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        state = self.server_state
+        state._count_request()
+        path = self.path.split('?')[0]
+        is_burst = path.startswith('/bursts/')
+
+        data = state.files.get(path[len('/bursts/') :] if is_burst else path.lstrip('/'))
+        if data is None:
+            self._send(404)
+            return
+
+        if is_burst:
+            with state._lock:
+                first_requested = state.first_requested.setdefault(path, time.monotonic())
+            if time.monotonic() - first_requested < state.extraction_time:
+                self._send(202, headers={'Retry-After': '0'})
+                return
+
+        headers = {'Accept-Ranges': 'bytes', 'Content-Type': 'application/octet-stream'}
+        requested_range = self.headers.get('Range')
+        if requested_range is None:
+            self._send(200, data, headers)
+            return
+
+        match = _RANGE.match(requested_range.strip())
+        if match is None or match.groups() == ('', ''):
+            self._send(416, headers={'Content-Range': f'bytes */{len(data)}'})
+            return
+
+        first, last = match.groups()
+        if first == '':
+            # A suffix range, the last n bytes
+            start, end = max(0, len(data) - int(last)), len(data) - 1
+        else:
+            start, end = int(first), min(int(last) if last else len(data) - 1, len(data) - 1)
+
+        if start > end:
+            self._send(416, headers={'Content-Range': f'bytes */{len(data)}'})
+            return
+
+        headers['Content-Range'] = f'bytes {start}-{end}/{len(data)}'
+        self._send(206, data[start : end + 1], headers)
+
+
+class FakeDownloads(_LocalServer):
+    """
+    Serves files from memory, with `Range` requests (for `remotezip()`).
+    Files requested under `/bursts/` answer `202` until `extraction_time` after their
+    first request, like on-demand burst extraction.
+
+    ``` python
+    with FakeDownloads({'a.zip': data}) as server:
+        download_url(f'{server.url}/a.zip', path)
+        download_url(f'{server.url}/bursts/a.zip', path)  # after 202s
+    ```
+    """
+
+    handler = _DownloadHandler
+
+    def __init__(self, files: Dict[str, bytes], extraction_time: float = 0.0):
+        """
+        :param files: the content of each file, by path
+        :param extraction_time: seconds `/bursts/` files are unavailable for
+        """
+        super().__init__()
+        self.files = files
+        self.extraction_time = extraction_time
+        self.first_requested = {}
+
+    def reset_extractions(self) -> None:
+        """Makes every `/bursts/` file unextracted again"""
+        with self._lock:
+            self.first_requested.clear()
@@ -4,7 +4,7 @@ from setuptools import find_packages, setup
 
 requirements = [
     'requests',
-    'shapely',
+    'shapely>=2.0',
     'pytz',
     'numpy',
     'dateparser',
@@ -23,11 +23,13 @@ test_requirements = [
     'nbformat',
     'nbconvert',
     'ipykernel',
+    'pytest-benchmark',
 ]
 
 extra_requirements = [
     'remotezip>=0.10.0',
     'ciso8601',
+    'orjson',
 ]
 
 # Required for ARIA-S1 GUNW Stacking
@@ -50,6 +52,17 @@ sbasnetwork_plot = [
     'pandas',
 ]
 
+# Required for optional columnar exports (ASFSearchResults.to_arrow())
+arrow = [
+    'pyarrow>=14.0',
+]
+
+# Required for optional instrumentation adapters (asf_search.instrumentation)
+instrumentation = [
+    'prometheus-client',
+    'opentelemetry-api',
+]
+
 with open('README.md', 'r') as readme_file:
     readme = readme_file.read()
 
@@ -73,6 +86,8 @@ setup(
                     'asf-enumeration': asf_enumeration, 
                     'coherence': coherence,
                     'sbasnetwork_plot': sbasnetwork_plot,
+                    'arrow': arrow,
+                    'instrumentation': instrumentation,
                     },
     license='BSD',
     license_files=('LICENSE',),
@@ -0,0 +1,98 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from asf_search import ASFProduct
+
+
+@pytest.fixture(scope='module')
+def product(stack):
+    return stack[0]
+
+
+def _subclasses(product_type):
+    for subclass in product_type.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+@pytest.mark.parametrize('product_type', [ASFProduct, *_subclasses(ASFProduct)])
+def test_products_have_no_instance_dict(product_type):
+    assert not hasattr(product_type.__new__(product_type), '__dict__')
+
+
+def test_geometry_is_stored_as_float64(product):
+    geometry = product.geometry
+
+    assert geometry['type'] == 'Polygon'
+    assert isinstance(product._coordinates, np.ndarray)
+    assert product._coordinates.dtype == np.float64
+    assert product._coordinates.shape == (1, len(geometry['coordinates'][0]), 2)
+    assert np.array_equal(product._coordinates, np.array(geometry['coordinates']))
+
+    # Every access builds new lists, the stored footprint isn't changed through them
+    geometry['coordinates'][0][0][0] = 0.0
+    assert product.geometry['coordinates'][0][0][0] != 0.0
+
+
+@pytest.mark.parametrize(
+    'geometry',
+    [
+        {'coordinates': [-147.7, 64.8], 'type': 'Point'},
+        {'coordinates': [[0, 0], [1, 0], [1, 1], [0, 0]], 'type': 'LineString'},
+        # Rings of different lengths are packed separately
+        {
+            'coordinates': [
+                [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+                [[1, 1], [2, 1], [1, 2], [1, 1]],
+            ],
+            'type': 'Polygon',
+        },
+        {
+            'coordinates': [
+                [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+                [[[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]]],
+            ],
+            'type': 'MultiPolygon',
+        },
+        {'coordinates': None, 'type': 'Polygon'},
+        None,
+    ],
+)
+def test_geometry_round_trip(geometry):
+    product = ASFProduct()
+    product.geometry = geometry
+
+    assert product.geometry == geometry
+
+
+def test_pickle_round_trip(product):
+    loaded = pickle.loads(pickle.dumps(product))
+
+    assert type(loaded) is type(product)
+    assert loaded.properties == product.properties
+    assert loaded.geometry == product.geometry
+    assert loaded.baseline == product.baseline
+    assert loaded.umm == product.umm
+    assert copy.deepcopy(product).geometry == product.geometry
+
+
+def test_unpickles_dict_state(product):
+    # The state of products pickled before they had `__slots__`
+    state = {
+        'meta': product.meta,
+        'umm': product.umm,
+        'properties': product.properties,
+        'geometry': product.geometry,
+        'baseline': product.baseline,
+        'session': product.session,
+    }
+
+    loaded = type(product).__new__(type(product))
+    loaded.__setstate__(state)
+
+    assert loaded.geometry == product.geometry
+    assert isinstance(loaded._coordinates, np.ndarray)
+    assert loaded.properties == product.properties
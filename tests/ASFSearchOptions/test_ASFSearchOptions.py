@@ -78,3 +78,52 @@ def run_test_ASFSearchOptions(**kwargs):
             assert (
                 getattr(options_obj, key) == value
             ), f"ERROR: default param '{key}' left default by user changed, should have value '{val}'. Got '{getattr(options_obj, key)}'."
+
+
+def test_ASFSearchOptions_copy_on_write():
+    opts = ASFSearchOptions(platform='SENTINEL-1', maxResults=250)
+    clone = copy.copy(opts)
+
+    assert dict(clone) == dict(opts)
+
+    clone.platform = 'ALOS'
+    clone.start = '2021-05-01'
+    assert opts.platform == ['SENTINEL-1']
+    assert opts.start is None
+    assert clone.platform == ['ALOS']
+
+    opts.maxResults = None
+    assert clone.maxResults == 250
+    assert opts.host == config['host']
+
+
+def test_ASFSearchOptions_dict_order_and_pickle():
+    import pickle
+
+    opts = ASFSearchOptions(end='2021-06-01', platform='SENTINEL-1', start='2021-05-01')
+    keys = list(validator_map.keys())
+    assert list(dict(opts).keys()) == sorted(dict(opts).keys(), key=keys.index)
+
+    assert dict(pickle.loads(pickle.dumps(opts))) == dict(opts)
+
+    with raises(AttributeError):
+        opts.not_an_option
+
+
+def test_ASFSearchOptions_subquery_fan_out():
+    from asf_search.CMR.subquery import build_subqueries
+    from asf_search.constants import CMR_PAGE_SIZE
+
+    opts = ASFSearchOptions(
+        platform='SENTINEL-1',
+        beamMode=['IW', 'EW', 'SM'],
+        polarization=['VV', 'VV+VH', 'HH', 'HH+HV'],
+        relativeOrbit=list(range(1, 176, 2)),
+        granule_list=[f'S1A_IW_SLC__1SDV_{idx}' for idx in range(2000)],
+    )
+
+    subqueries = build_subqueries(opts)
+
+    assert len(subqueries) == 3 * 4 * 88 * (2000 // CMR_PAGE_SIZE)
+    for subquery in subqueries[:: len(subqueries) // 10]:
+        assert dict(copy.copy(subquery)) == dict(subquery)
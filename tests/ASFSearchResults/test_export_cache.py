@@ -0,0 +1,70 @@
+from collections import Counter
+
+import pytest
+
+from asf_search import ASFProduct
+from asf_search.export.export_translators import (
+    ASFSearchResults_to_properties_list,
+    get_export_properties,
+    get_umm_field,
+)
+from tests.resources import load_results
+
+
+def test_umm_fields_read_once_across_formats(monkeypatch):
+    results = load_results('Fairbanks_ers_stack.yml')
+    umm_ids = {id(product.umm) for product in results}
+
+    reads = Counter()
+    umm_get = ASFProduct.umm_get
+
+    def counting_umm_get(umm, *path):
+        if id(umm) in umm_ids:
+            reads[(id(umm), repr(path))] += 1
+        return umm_get(umm, *path)
+
+    # Products have no instance `__dict__`, so reads are counted on the class
+    monkeypatch.setattr(ASFProduct, 'umm_get', staticmethod(counting_umm_get))
+
+    for export in [results.csv, results.kml, results.jsonlite, results.json, results.jsonlite2]:
+        ''.join(chunk for chunk in export() if chunk)
+
+    assert len(reads) > 0
+    assert max(reads.values()) == 1
+
+
+def test_export_properties_follow_product_changes():
+    product = load_results('Fairbanks_ers_stack.yml')[0]
+
+    first = get_export_properties(product)
+    assert get_export_properties(product) is first
+
+    product.properties['stopTime'] = '2021-01-01T00:00:00.000000Z'
+    product.properties['temporalBaseline'] = 12
+
+    updated = get_export_properties(product)
+    assert updated is not first
+    assert updated['stopTime'] == '2021-01-01T00:00:00Z'
+    assert updated['temporalBaseline'] == 12
+
+
+@pytest.mark.parametrize('resource', ['Fairbanks_ers_stack.yml', 'Fairbanks_S1_stack.yml'])
+def test_properties_list_dates(resource):
+    results = load_results(resource)
+
+    def get_additional_fields(product):
+        path = ['TemporalExtent', 'RangeDateTime', 'BeginningDateTime']
+        return {'sceneDate': get_umm_field(product, path)}
+
+    properties_list = ASFSearchResults_to_properties_list(results, get_additional_fields)
+
+    for product, properties in zip(results, properties_list):
+        if product.properties['platform'].upper().startswith('SENTINEL-1'):
+            assert properties['startTime'] == product.properties['startTime']
+        else:
+            assert properties['startTime'].endswith('Z') and '.' not in properties['startTime']
+            assert '.' not in properties['sceneDate']
+
+        # Writers get their own copy to modify
+        properties['sceneName'] = None
+        assert get_export_properties(product)['sceneName'] is not None
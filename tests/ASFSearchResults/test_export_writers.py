@@ -0,0 +1,109 @@
+import copy
+import io
+import os
+from xml.etree import ElementTree as ETree
+
+import pytest
+
+from asf_search import ASFSearchResults
+from asf_search.export.writers import export_stream
+from asf_search.export.xml_templates import element
+from tests.resources import get_pages, load_results
+
+EXPORTS = {
+    'csv': lambda results: results.csv(),
+    'kml': lambda results: results.kml(),
+    'metalink': lambda results: results.metalink(),
+    'json': lambda results: results.json(),
+    'jsonlite': lambda results: results.jsonlite(),
+    'jsonlite2': lambda results: results.jsonlite2(),
+    'geojsonseq': lambda results: results.geojsonseq(),
+}
+
+
+@pytest.mark.parametrize('format', EXPORTS.keys())
+def test_to_file_matches_streamed_output(tmp_path, format):
+    results = load_results('Fairbanks_S1_stack.yml')
+    expected = ''.join(chunk for chunk in EXPORTS[format](results) if chunk)
+
+    path = tmp_path / f'results.{format}'
+    results.to_file(str(path), format=format, compact=False)
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        assert f.read() == expected
+
+
+@pytest.mark.parametrize('format', EXPORTS.keys())
+def test_export_stream_pages_and_small_buffers(format):
+    results = load_results('Fairbanks_S1_stack.yml')
+    expected = io.StringIO(newline='')
+    export_stream(results, expected, format)
+
+    paged = io.StringIO(newline='')
+    export_stream(get_pages(results, 7), paged, format, buffer_size=256)
+
+    assert paged.getvalue() == expected.getvalue()
+
+
+def test_to_file_infers_format(tmp_path):
+    results = load_results('Fairbanks_ers_stack.yml')
+
+    results.to_file(str(tmp_path / 'results.kml'))
+    with open(tmp_path / 'results.kml', 'r', encoding='utf-8') as f:
+        assert f.read() == ''.join(results.kml())
+
+    results.to_file(str(tmp_path / 'results.geojsonl'))
+    with open(tmp_path / 'results.geojsonl', 'r', encoding='utf-8') as f:
+        assert f.read() == ''.join(results.geojsonseq())
+
+
+def test_to_file_rejects_unknown_formats(tmp_path):
+    results = load_results('Fairbanks_ers_stack.yml')
+
+    with pytest.raises(ValueError):
+        results.to_file(str(tmp_path / 'results.txt'))
+
+    with pytest.raises(ValueError):
+        results.to_file(str(tmp_path / 'results.csv'), format='xlsx')
+
+    assert not os.path.exists(tmp_path / 'results.csv')
+
+
+class _CountingFile(io.StringIO):
+    def __init__(self):
+        super().__init__(newline='')
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def test_export_stream_batches_writes():
+    base = load_results('Fairbanks_S1_stack.yml')
+    results = ASFSearchResults(
+        [copy.copy(product) for _ in range(2000 // len(base)) for product in base]
+    )
+    results.searchComplete = True
+
+    for format in ['csv', 'kml', 'metalink']:
+        # What writing the streamed chunks directly to a file looks like
+        per_chunk = _CountingFile()
+        for chunk in EXPORTS[format](results):
+            if chunk:
+                per_chunk.write(chunk)
+
+        buffered = _CountingFile()
+        export_stream(results, buffered, format)
+
+        assert buffered.getvalue() == per_chunk.getvalue()
+        assert buffered.writes * 10 < per_chunk.writes
+
+
+@pytest.mark.parametrize('text', [None, '', 'text & <more>'])
+@pytest.mark.parametrize('attrib', [None, {'name': '"quoted" & <escaped>'}])
+def test_element_matches_element_tree(text, attrib):
+    node = ETree.Element('tag', attrib or {})
+    node.text = text
+
+    assert element('tag', text, attrib) == ETree.tostring(node, encoding='unicode')
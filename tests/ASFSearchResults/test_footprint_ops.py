@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import Polygon, shape
+
+from asf_search import ASFProduct, ASFSearchResults
+from asf_search.export.export_translators import (
+    ASFSearchResults_to_properties_list,
+    get_page_wkts,
+    get_wkts,
+)
+from asf_search.export.json import JsonStreamArray
+from asf_search.export.jsonlite import JSONLiteStreamArray
+from asf_search.Products import NISARProduct
+from tests.resources import load_results
+
+ANTIMERIDIAN = {
+    'coordinates': [[[179, 60], [-179, 60], [-179, 61], [179, 61], [179, 60]]],
+    'type': 'Polygon',
+}
+
+
+def _product(geometry) -> ASFProduct:
+    product = ASFProduct()
+    product.geometry = geometry
+    return product
+
+
+@pytest.fixture(scope='module')
+def results():
+    products = list(load_results('Fairbanks_S1_stack.yml'))
+    products.append(_product(ANTIMERIDIAN))
+    products.append(_product({'coordinates': None, 'type': 'Polygon'}))
+    return ASFSearchResults(products)
+
+
+def test_footprints_are_cached_until_geometry_changes():
+    product = _product(ANTIMERIDIAN)
+
+    footprint = ASFSearchResults([product]).footprints()[0]
+    assert product.centroid() is not None
+    assert ASFSearchResults([product]).footprints()[0] is footprint
+
+    product.geometry = {
+        'coordinates': [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]],
+        'type': 'Polygon',
+    }
+    assert ASFSearchResults([product]).footprints()[0].equals(shape(product.geometry))
+
+
+def test_centroids(results):
+    centroids = results.centroids()
+
+    assert len(centroids) == len(results)
+    for product, centroid in zip(results[:-1], centroids[:-1]):
+        assert centroid.equals(product.centroid())
+        assert centroid.equals_exact(_unwrapped_centroid(product.geometry), 1e-9)
+
+    # Unwrapped across the antimeridian
+    assert centroids[-2].x == pytest.approx(180)
+    assert centroids[-1] is None
+
+
+def _unwrapped_centroid(geometry):
+    coords = geometry['coordinates'][0]
+    if max(p[0] for p in coords) - min(p[0] for p in coords) > 180:
+        coords = [p if p[0] > 0 else [p[0] + 360, p[1]] for p in coords]
+
+    return Polygon(coords).centroid
+
+
+def test_bounds_and_areas(results):
+    bounds = results.bounds()
+    areas = results.areas()
+
+    assert bounds.shape == (len(results), 4)
+    for product, product_bounds, area in zip(results[:-1], bounds, areas):
+        footprint = shape(product.geometry)
+        assert tuple(product_bounds) == footprint.bounds
+        assert area == pytest.approx(footprint.area)
+
+    assert np.isnan(bounds[-1]).all()
+    assert np.isnan(areas[-1])
+
+
+def test_page_wkts_match_per_product_wkts(results):
+    wkts = get_page_wkts(results)
+
+    assert wkts == [get_wkts(product.geometry) for product in results]
+    wrapped, unwrapped = wkts[-2]
+    assert wrapped != unwrapped
+    assert shapely.get_x(shapely.centroid(shapely.from_wkt(unwrapped))) == pytest.approx(180)
+
+
+def test_nisar_dateline_polygons_are_merged():
+    def points(ring):
+        return {'Boundary': {'Points': [{'Longitude': x, 'Latitude': y} for x, y in ring]}}
+
+    polygons = [
+        [(179, 60), (180, 60), (180, 61), (179, 61), (179, 60)],
+        [(-180, 60), (-179, 60), (-179, 61), (-180, 61), (-180, 60)],
+    ]
+    item = {
+        'umm': {
+            'SpatialExtent': {
+                'HorizontalSpatialDomain': {
+                    'Geometry': {'GPolygons': [points(ring) for ring in polygons]}
+                }
+            }
+        }
+    }
+
+    geometry = NISARProduct.__new__(NISARProduct)._get_geometry(item)
+
+    assert shape({**geometry, 'coordinates': [list(geometry['coordinates'][0])]}).equals(
+        Polygon([(179, 60), (181, 60), (181, 61), (179, 61)])
+    )
+
+
+@pytest.mark.parametrize('stream_type', [JsonStreamArray, JSONLiteStreamArray])
+def test_get_item_without_page_wkts(results, stream_type):
+    # Callers building items one at a time get the same output as whole pages
+    stream = stream_type(results[:-2])
+    properties_list = ASFSearchResults_to_properties_list(
+        results[:-2], stream.get_additional_output_fields
+    )
+
+    items = [stream.getItem({k: v for k, v in p.items() if k != 'wkts'}) for p in properties_list]
+
+    assert items == stream.getPageItems(results[:-2])
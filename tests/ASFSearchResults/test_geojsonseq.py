@@ -0,0 +1,38 @@
+import json
+
+from asf_search.export import results_to_geojson, results_to_geojsonseq
+from tests.resources import get_pages
+
+
+def test_geojsonseq(stack):
+    lines = ''.join(stack.geojsonseq()).splitlines()
+
+    assert len(lines) == len(stack)
+    assert [json.loads(line) for line in lines] == json.loads(''.join(results_to_geojson(stack)))[
+        'features'
+    ]
+    assert all(line == json.dumps(json.loads(line), separators=(',', ':')) for line in lines)
+
+
+def test_geojsonseq_pages_append(stack, tmp_path):
+    path = tmp_path / 'stack.geojsonl'
+    pages = list(get_pages(stack, 4))
+
+    for run in [pages[:2], pages[2:]]:
+        with open(path, 'a') as f:
+            f.writelines(results_to_geojsonseq((page for page in run)))
+
+    with open(path, 'r') as f:
+        features = [json.loads(line) for line in f]
+
+    assert [feature['properties']['fileID'] for feature in features] == [
+        product.properties['fileID'] for product in stack
+    ]
+
+
+def test_geojsonseq_rfc8142(stack):
+    records = ''.join(stack.geojsonseq(rfc8142=True)).split('\x1e')
+
+    assert records[0] == ''
+    assert [json.loads(record) for record in records[1:]] == [p.geojson() for p in stack]
+
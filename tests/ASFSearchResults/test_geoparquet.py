@@ -0,0 +1,111 @@
+import json
+import os
+
+import pytest
+import shapely
+from shapely.geometry import shape
+
+from asf_search import ASFSearchResults
+from asf_search.export import results_to_geoparquet
+from tests.resources import get_pages
+
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def test_geoparquet(stack, tmp_path):
+    path = tmp_path / 'stack.parquet'
+    stack.geoparquet(str(path))
+
+    table = pq.read_table(path)
+    geo = json.loads(table.schema.metadata[b'geo'])
+
+    assert geo['primary_column'] == 'geometry'
+    assert geo['columns']['geometry']['encoding'] == 'WKB'
+    assert table.num_rows == len(stack)
+    assert table.column('sceneName').to_pylist() == [p.properties['sceneName'] for p in stack]
+    assert table.column('pathNumber').to_pylist() == [p.properties['pathNumber'] for p in stack]
+
+    footprints = shapely.from_wkb(table.column('geometry').to_pylist())
+    assert all(
+        footprint.equals(shape(product.geometry)) for footprint, product in zip(footprints, stack)
+    )
+
+
+def test_geoparquet_size(stack, tmp_path, record_property):
+    catalog = ASFSearchResults(list(stack) * 100)
+    path = tmp_path / 'catalog.parquet'
+    catalog.geoparquet(str(path))
+
+    geojson_size = len(json.dumps(catalog.geojson()))
+    record_property('geoparquet_geojson_size_ratio', os.path.getsize(path) / geojson_size)
+
+    assert os.path.getsize(path) < geojson_size / 4
+
+
+def test_geoparquet_stream_pages(stack, tmp_path):
+    path = tmp_path / 'pages.parquet'
+    results_to_geoparquet(get_pages(stack, 10), str(path))
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == (len(stack) + 9) // 10
+    assert parquet.read().column('fileID').to_pylist() == [p.properties['fileID'] for p in stack]
+
+
+def test_geoparquet_mismatched_pages(tmp_path):
+    class FakeProduct:
+        def __init__(self, properties):
+            self.properties = properties
+            self.geometry = {'coordinates': None, 'type': 'Polygon'}
+
+    first = ASFSearchResults([FakeProduct({'sceneName': 'a', 'pathNumber': 1, 'note': None})])
+    second = ASFSearchResults([FakeProduct({'sceneName': 'b', 'note': 2.5, 'extra': 'x'})])
+    second.searchComplete = True
+
+    path = tmp_path / 'mismatched.parquet'
+    results_to_geoparquet((page for page in [first, second]), str(path))
+
+    table = pq.read_table(path)
+    assert table.column('sceneName').to_pylist() == ['a', 'b']
+    assert table.column('pathNumber').to_pylist() == [1, None]
+    assert table.column('note').to_pylist() == [None, 2.5]
+    assert table.column('extra').to_pylist() == [None, 'x']
+    assert table.column_names[-1] == 'geometry'
+    assert pq.ParquetFile(path).metadata.num_row_groups == 2
+    # Nothing is left behind next to the file
+    assert os.listdir(tmp_path) == ['mismatched.parquet']
+
+
+def test_geoparquet_unifies_types_across_pages(tmp_path):
+    class FakeProduct:
+        def __init__(self, properties):
+            self.properties = properties
+            self.geometry = {'coordinates': None, 'type': 'Polygon'}
+
+    pages = [
+        ASFSearchResults([FakeProduct({'value': 1, 'mixed': 1})]),
+        ASFSearchResults([FakeProduct({'value': 2.5, 'mixed': 'b'})]),
+    ]
+
+    path = tmp_path / 'unified.parquet'
+    results_to_geoparquet((page for page in pages), str(path))
+
+    table = pq.read_table(path)
+    assert table.column('value').to_pylist() == [1.0, 2.5]
+    # No common type, stored as strings
+    assert table.column('mixed').to_pylist() == ['1', 'b']
+
+
+def test_geoparquet_dates_are_utc(stack, tmp_path):
+    pa = pytest.importorskip('pyarrow')
+
+    path = tmp_path / 'stack.parquet'
+    stack.geoparquet(str(path))
+
+    assert pq.read_schema(path).field('startTime').type == pa.timestamp('ms', tz='UTC')
+
+
+def test_geoparquet_empty(tmp_path):
+    path = tmp_path / 'empty.parquet'
+    ASFSearchResults([]).geoparquet(str(path))
+
+    assert pq.read_table(path).num_rows == 0
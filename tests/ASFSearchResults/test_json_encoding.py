@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from asf_search import ASFSearchResults
+from asf_search.export import (
+    results_to_geojson,
+    results_to_json,
+    results_to_jsonlite,
+    results_to_jsonlite2,
+)
+from asf_search.export import encoding
+from tests.resources import get_pages
+
+EXPORTS = [results_to_geojson, results_to_json, results_to_jsonlite, results_to_jsonlite2]
+
+
+@pytest.mark.parametrize('export', EXPORTS)
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_compact_matches_default(stack, export, use_orjson, monkeypatch):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(encoding, 'orjson', None)
+
+    expected = json.loads(''.join(export(stack)))
+
+    assert json.loads(''.join(export(stack, compact=True))) == expected
+    assert json.loads(''.join(export(get_pages(stack, 3), compact=True))) == expected
+
+
+@pytest.mark.parametrize(
+    'export, expected',
+    [
+        (results_to_geojson, {'type': 'FeatureCollection', 'features': []}),
+        (results_to_json, [[]]),
+        (results_to_jsonlite, {'results': []}),
+        (results_to_jsonlite2, {'results': []}),
+    ],
+)
+def test_compact_empty(export, expected):
+    assert json.loads(''.join(export(ASFSearchResults([]), compact=True))) == expected
+
+
+def test_encode_compact_fallback():
+    # Wider than orjson's 64 bit integers
+    assert encoding.encode_compact({'value': 2**70}) == '{"value":%d}' % 2**70
+
@@ -0,0 +1,47 @@
+import io
+
+import pytest
+
+from asf_search import ASFSearchResults
+from asf_search.export.parallel import encode_pages
+from asf_search.export.writers import export_stream
+from tests.resources import get_pages, load_results
+
+FORMATS = ['csv', 'kml', 'metalink', 'json', 'jsonlite', 'jsonlite2', 'geojson', 'geojsonseq']
+
+
+def _serial(results, format: str) -> bytes:
+    # Parallel json formats are always compact
+    expected = io.StringIO(newline='')
+    export_stream(results, expected, format, compact=True)
+    return expected.getvalue().encode('utf-8')
+
+
+@pytest.mark.parametrize('format', FORMATS)
+def test_encode_pages_matches_serial(format):
+    results = load_results('Fairbanks_S1_stack.yml')
+    expected = _serial(results, format)
+
+    assert b''.join(encode_pages(results, format, processes=1, page_size=4)) == expected
+    assert b''.join(encode_pages(results, format, processes=2, page_size=4)) == expected
+    assert b''.join(encode_pages(get_pages(results, 5), format, processes=2)) == expected
+
+
+@pytest.mark.parametrize('format', ['csv', 'json', 'kml'])
+def test_encode_pages_empty(format):
+    results = ASFSearchResults([])
+    results.searchComplete = True
+
+    assert b''.join(encode_pages(results, format, processes=2)) == _serial(results, format)
+
+
+def test_to_file_in_parallel(tmp_path):
+    results = load_results('Fairbanks_ers_stack.yml')
+
+    results.to_file(str(tmp_path / 'results.csv'), processes=2)
+    with open(tmp_path / 'results.csv', 'rb') as f:
+        assert f.read() == _serial(results, 'csv')
+
+    with pytest.raises(ValueError):
+        results.to_file(str(tmp_path / 'results.csv'), format='xlsx', processes=2)
+
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from asf_search import ASFSearchResults, ResultColumns
+from asf_search.CMR.translate import try_parse_bool, try_parse_date, try_parse_float, try_parse_int
+
+
+class FakeProduct:
+    def __init__(self, properties: dict):
+        self.properties = properties
+        self.geometry = {'coordinates': None, 'type': 'Polygon'}
+
+
+def test_column_types(stack):
+    columns = stack.columns()
+
+    assert isinstance(columns, ResultColumns)
+    assert len(columns) == len(stack)
+    assert columns['startTime'].dtype == np.dtype('datetime64[ms]')
+    assert columns['pathNumber'].dtype == np.int64
+    assert columns['centerLat'].dtype == np.float64
+    assert columns['sceneName'].dtype == object
+    assert columns['geometry'][0][:1] in (b'\x00', b'\x01')
+
+    product = stack[0]
+    assert columns['pathNumber'][0] == product.properties['pathNumber']
+    assert columns['startTime'][0] == np.datetime64(product.properties['startTime'][:-1])
+
+
+def test_filter_sort_groupby(stack):
+    columns = stack.columns()
+    start = stack[len(stack) // 2].properties['startTime'][:-1]
+
+    recent = columns.filter(columns['startTime'] >= np.datetime64(start), flightDirection='ASCENDING')
+    expected = [
+        p for p in stack
+        if p.properties['startTime'] >= f'{start}Z' and p.properties['flightDirection'] == 'ASCENDING'
+    ]
+    assert recent.to_results().data == expected
+
+    ordered = columns.sort_by('pathNumber', 'startTime', reverse=True).to_results()
+    assert ordered.data == sorted(
+        stack, key=lambda p: (p.properties['pathNumber'], p.properties['startTime']), reverse=True
+    )
+    assert ordered.searchComplete
+
+    groups = columns.groupby('pathNumber', 'flightDirection')
+    assert sum(len(group) for group in groups.values()) == len(stack)
+    for (path, direction), group in groups.items():
+        assert all(
+            p.properties['pathNumber'] == path and p.properties['flightDirection'] == direction
+            for p in group.to_results()
+        )
+
+
+def test_missing_values():
+    products = ASFSearchResults(
+        [
+            FakeProduct({'pathNumber': 2, 'centerLat': 1.5, 'polarization': 'VV'}),
+            FakeProduct({'pathNumber': None, 'centerLat': None, 'polarization': None}),
+            FakeProduct({'pathNumber': 0, 'centerLat': 2.5, 'polarization': 'HH'}),
+        ]
+    )
+    columns = products.columns()
+
+    assert columns.filter(pathNumber=[0, 2]).indices.tolist() == [0, 2]
+    assert columns.filter(columns['centerLat'] > 2).indices.tolist() == [2]
+    assert columns.sort_by('pathNumber').indices.tolist() == [2, 0, 1]
+    assert columns.sort_by('polarization', reverse=True).indices.tolist() == [0, 2, 1]
+    assert list(columns.groupby('pathNumber')) == [0, 2, None]
+    assert columns['geometry'].tolist() == [None, None, None]
+
+
+def test_to_arrow(stack):
+    pa = pytest.importorskip('pyarrow')
+
+    table = stack.to_arrow()
+
+    assert table.num_rows == len(stack)
+    assert table.schema.field('startTime').type == pa.timestamp('ms', tz='UTC')
+    assert table.schema.field('pathNumber').type == pa.int64()
+    assert table.schema.field('geometry').type == pa.binary()
+    assert table.column('sceneName').to_pylist() == [p.properties['sceneName'] for p in stack]
+
+
+class CastProduct(FakeProduct):
+    _base_properties = {
+        'orbit': {'cast': try_parse_int},
+        'doppler': {'cast': try_parse_float},
+        'ascending': {'cast': try_parse_bool},
+        'processed': {'cast': try_parse_date},
+    }
+
+
+def test_missing_columns_keep_their_cast_types():
+    pa = pytest.importorskip('pyarrow')
+
+    properties = {'orbit': None, 'doppler': None, 'ascending': None, 'processed': None}
+    results = ASFSearchResults([CastProduct(properties), CastProduct(properties)])
+    columns = results.columns()
+
+    assert columns['orbit'].dtype == np.int64
+    assert columns['doppler'].dtype == np.float64
+    assert columns['processed'].dtype == np.dtype('datetime64[ms]')
+
+    schema = results.to_arrow().schema
+    assert schema.field('orbit').type == pa.int64()
+    assert schema.field('doppler').type == pa.float64()
+    assert schema.field('ascending').type == pa.bool_()
+    assert schema.field('processed').type == pa.timestamp('ms', tz='UTC')
+
+
+def test_triage_matches_product_loop():
+    rng = np.random.default_rng(0)
+    count = 10000
+    paths = rng.integers(1, 176, count).tolist()
+    frames = rng.integers(1, 500, count).tolist()
+    days = rng.integers(0, 3000, count)
+    dates = (np.datetime64('2016-01-01T00:00:00') + days * np.timedelta64(1, 'D')).astype(str)
+    results = ASFSearchResults(
+        [
+            FakeProduct({'pathNumber': path, 'frameNumber': frame, 'startTime': f'{date}Z'})
+            for path, frame, date in zip(paths, frames, dates)
+        ]
+    )
+
+    selected = results.columns().filter(pathNumber=list(range(1, 60))).sort_by('frameNumber')
+    groups = selected.groupby('pathNumber')
+
+    # The same triage over product dictionaries
+    loop_groups = {}
+    loop_selected = [p for p in results if p.properties['pathNumber'] in range(1, 60)]
+    for product in sorted(loop_selected, key=lambda p: p.properties['frameNumber']):
+        loop_groups.setdefault(product.properties['pathNumber'], []).append(product)
+
+    assert {path: group.to_results().data for path, group in groups.items()} == loop_groups
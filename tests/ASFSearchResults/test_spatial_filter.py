@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from shapely import wkt
+from shapely.geometry import box, mapping, shape
+
+from asf_search import ASFSearchResults
+from asf_search.WKT.footprints import get_footprints
+
+AOI = 'POLYGON((0 0, 10 0, 10 2, 2 2, 2 10, 0 10, 0 0))'
+
+
+class FakeProduct:
+    def __init__(self, name: str, geometry: dict):
+        self.name = name
+        self.geometry = geometry
+
+
+PRODUCTS = [
+    FakeProduct('inside', mapping(box(7, 0.5, 8, 1.5))),
+    FakeProduct('corner', mapping(box(1, 1, 3, 3))),
+    FakeProduct('outside', mapping(box(7, 7, 8, 8))),
+    FakeProduct('covering', mapping(box(-1, -1, 11, 11))),
+    FakeProduct('no footprint', {'coordinates': None, 'type': 'Polygon'}),
+    FakeProduct(
+        'multipolygon',
+        {
+            'type': 'MultiPolygon',
+            'coordinates': [
+                [[[7, 7], [8, 7], [8, 8], [7, 8], [7, 7]]],
+                [[[0.5, 7], [1.5, 7], [1.5, 8], [0.5, 8], [0.5, 7]]],
+            ],
+        },
+    ),
+]
+
+
+def _names(results):
+    return [product.name for product in results]
+
+
+@pytest.mark.parametrize(
+    'predicate, min_overlap, expected',
+    [
+        ('intersects', None, ['inside', 'corner', 'covering', 'multipolygon']),
+        ('covered_by', None, ['inside']),
+        ('covers', None, ['covering']),
+        ('intersects', 0.5, ['inside', 'corner', 'multipolygon']),
+        ('intersects', 0.9, ['inside']),
+    ],
+)
+def test_spatial_filter(predicate, min_overlap, expected):
+    results = ASFSearchResults(PRODUCTS)
+    results.searchComplete = True
+
+    filtered = results.spatial_filter(AOI, predicate=predicate, min_overlap=min_overlap)
+
+    assert _names(filtered) == expected
+    assert isinstance(filtered, ASFSearchResults)
+    assert filtered.searchComplete
+
+
+def test_spatial_filter_keep_missing():
+    filtered = ASFSearchResults(PRODUCTS).spatial_filter(AOI, min_overlap=0.5, keep_missing=True)
+
+    assert _names(filtered) == ['inside', 'corner', 'no footprint', 'multipolygon']
+
+
+def test_spatial_filter_invalid_predicate():
+    with pytest.raises(ValueError):
+        ASFSearchResults(PRODUCTS).spatial_filter(AOI, predicate='touches')
+
+
+def test_get_footprints():
+    footprints = get_footprints(PRODUCTS)
+
+    assert footprints[4] is None
+    assert footprints[0].equals(box(7, 0.5, 8, 1.5))
+    assert footprints[5].geom_type == 'MultiPolygon'
+
+
+def test_spatial_filter_matches_per_product_filter():
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(-10, 20, size=(5000, 2))
+    products = ASFSearchResults(
+        [
+            FakeProduct(
+                str(idx),
+                {
+                    'type': 'Polygon',
+                    'coordinates': [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]],
+                },
+            )
+            for idx, (x, y) in enumerate(corners.tolist())
+        ]
+    )
+
+    filtered = products.spatial_filter(AOI, min_overlap=0.25)
+
+    # The same filter one product at a time
+    aoi = wkt.loads(AOI)
+    expected = []
+    for product in products:
+        footprint = shape(product.geometry)
+        if footprint.intersects(aoi) and footprint.intersection(aoi).area >= 0.25 * footprint.area:
+            expected.append(product)
+
+    assert 0 < len(filtered) < len(products)
+    assert filtered.data == expected
@@ -6,6 +6,10 @@ from requests.cookies import create_cookie
 import http.cookiejar
 import requests
 from multiprocessing import Pool
+import pickle
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib3.util.retry import Retry
 
 from unittest.mock import patch
 
@@ -186,3 +190,67 @@ def _assert_pooled_instance_variables(session):
     assert session.asf_auth_host == auth_host
     assert session.cmr_collections == cmr_collection
     assert session.edl_client_id == edl_client_id
+
+
+def test_ASFSession_connection_pool():
+    session = ASFSession(pool_connections=4, pool_maxsize=64, pool_block=True, max_retries=5)
+
+    for url in ['https://cmr.earthdata.nasa.gov', 'http://localhost']:
+        adapter = session.get_adapter(url)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block
+        assert adapter.max_retries.connect == 5
+        assert adapter.max_retries.read == 0
+
+    # Sessions copied to other processes keep their pool configuration
+    copied = pickle.loads(pickle.dumps(session))
+    assert copied.get_adapter('https://cmr.earthdata.nasa.gov')._pool_maxsize == 64
+
+    retries = Retry(total=1, connect=1)
+    assert ASFSession(max_retries=retries).get_adapter('https://x.org').max_retries is retries
+
+    assert ASFSession().headers['Connection'] == 'keep-alive'
+    assert ASFSession(keep_alive=False).headers['Connection'] == 'close'
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = 0
+
+    def setup(self):
+        _CountingHandler.connections += 1
+        super().setup()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_ASFSession_reuses_connections():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        url = f'http://127.0.0.1:{server.server_port}/'
+
+        _CountingHandler.connections = 0
+        session = ASFSession()
+        for _ in range(5):
+            session.get(url).raise_for_status()
+        assert _CountingHandler.connections == 1
+
+        _CountingHandler.connections = 0
+        session = ASFSession(keep_alive=False)
+        for _ in range(5):
+            session.get(url).raise_for_status()
+        assert _CountingHandler.connections == 5
+    finally:
+        server.shutdown()
+        server.server_close()
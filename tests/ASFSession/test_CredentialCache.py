@@ -0,0 +1,144 @@
+import base64
+import json
+import os
+import pickle
+import stat
+import threading
+import time
+
+import pytest
+import requests_mock
+from requests.cookies import create_cookie
+
+from asf_search import ASFSession
+from asf_search.CredentialCache import CredentialCache, get_token_expiration
+from asf_search.constants import INTERNAL
+
+TOKEN_URL = f'https://{INTERNAL.EDL_HOST}/api/users/find_or_create_token'
+AUTHORIZE_URL = f'https://{INTERNAL.EDL_HOST}/oauth/authorize'
+VALIDATE_URL = f'https://{INTERNAL.EDL_HOST}/oauth/tokens/user'
+
+
+def _make_token(expires_in: float) -> str:
+    def encode(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip('=')
+
+    payload = {'uid': 'user', 'exp': int(time.time() + expires_in)}
+    return f'{encode({"alg": "RS256"})}.{encode(payload)}.signature'
+
+
+def _mock_edl(token: str) -> requests_mock.Adapter:
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('POST', TOKEN_URL, json={'access_token': token})
+    adapter.register_uri('GET', AUTHORIZE_URL, text='')
+    adapter.register_uri('POST', VALIDATE_URL, json={})
+    return adapter
+
+
+@pytest.fixture(autouse=True)
+def mock_asf_urs_cookie(monkeypatch):
+    # requests_mock doesn't set cookies on the session, stand in for the EDL redirect chain
+    def set_asf_urs_cookie(self):
+        self.get(AUTHORIZE_URL).raise_for_status()
+        expires = int(time.time() + 7 * 24 * 60 * 60)
+        self.cookies.set_cookie(
+            create_cookie('asf-urs', 'cookie-value', domain=INTERNAL.ASF_AUTH_HOST, expires=expires)
+        )
+
+    monkeypatch.setattr(ASFSession, '_set_asf_urs_cookie', set_asf_urs_cookie)
+
+
+def _session(cache: CredentialCache, adapter: requests_mock.Adapter) -> ASFSession:
+    session = ASFSession(credential_cache=cache)
+    session.mount('https://', adapter)
+    return session
+
+
+def test_auth_with_creds_reuses_cached_credentials(tmp_path):
+    cache = CredentialCache(str(tmp_path / 'credentials.json'))
+    token = _make_token(expires_in=7 * 24 * 60 * 60)
+    adapter = _mock_edl(token)
+
+    first = _session(cache, adapter).auth_with_creds('user', 'password')
+    assert adapter.call_count == 2
+    assert first.headers['Authorization'] == f'Bearer {token}'
+
+    second = _session(cache, adapter).auth_with_creds('user', 'password')
+    assert adapter.call_count == 2
+    assert second.headers['Authorization'] == f'Bearer {token}'
+    assert second.cookies.get('asf-urs') == 'cookie-value'
+
+    # Only live credentials are cached, never the password
+    assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+    with open(cache.path, 'r') as f:
+        contents = f.read()
+    assert 'password' in contents and '"password": "password"' not in contents
+    assert '"user"' not in contents
+
+    # A different password has to log in
+    _session(cache, adapter).auth_with_creds('user', 'other password')
+    assert adapter.call_count == 4
+
+
+def test_auth_with_creds_refreshes_before_expiry(tmp_path):
+    cache = CredentialCache(str(tmp_path / 'credentials.json'), refresh_margin=60 * 60)
+
+    # Expires within the refresh margin, so it's never reused
+    adapter = _mock_edl(_make_token(expires_in=30 * 60))
+    _session(cache, adapter).auth_with_creds('user', 'password')
+    _session(cache, adapter).auth_with_creds('user', 'password')
+    assert adapter.call_count == 4
+
+    # Capped by max_age, even though the token lasts longer
+    cache = CredentialCache(str(tmp_path / 'other.json'), max_age=60, refresh_margin=0)
+    adapter = _mock_edl(_make_token(expires_in=7 * 24 * 60 * 60))
+    _session(cache, adapter).auth_with_creds('user', 'password')
+    key = CredentialCache.make_key('creds', INTERNAL.EDL_HOST, INTERNAL.ASF_AUTH_HOST, 'user')
+    assert cache.get(key, password='password')['expires'] <= time.time() + 60
+
+
+def test_auth_with_token_skips_validation(tmp_path):
+    cache = CredentialCache(str(tmp_path / 'credentials.json'))
+    token = _make_token(expires_in=7 * 24 * 60 * 60)
+    adapter = _mock_edl(token)
+
+    _session(cache, adapter).auth_with_token(token)
+    session = _session(cache, adapter).auth_with_token(token)
+
+    assert adapter.call_count == 1
+    assert session.headers['Authorization'] == f'Bearer {token}'
+
+
+def test_concurrent_sessions_log_in_once(tmp_path):
+    cache = CredentialCache(str(tmp_path / 'credentials.json'))
+    adapter = _mock_edl(_make_token(expires_in=7 * 24 * 60 * 60))
+    sessions = [_session(cache, adapter) for _ in range(8)]
+
+    threads = [
+        threading.Thread(target=session.auth_with_creds, args=('user', 'password'))
+        for session in sessions
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert adapter.call_count == 2
+    assert len({session.headers['Authorization'] for session in sessions}) == 1
+
+
+def test_credential_cache_pickles_with_session(tmp_path):
+    path = str(tmp_path / 'credentials.json')
+    session = ASFSession(credential_cache=path)
+
+    copied = pickle.loads(pickle.dumps(session))
+    assert isinstance(copied.credential_cache, CredentialCache)
+    assert copied.credential_cache.path == path
+    assert ASFSession().credential_cache is None
+
+
+def test_get_token_expiration():
+    token = _make_token(expires_in=100)
+    assert abs(get_token_expiration(token) - (time.time() + 100)) < 5
+    assert get_token_expiration('not a jwt') is None
+    assert get_token_expiration('a.!!!.c') is None
@@ -0,0 +1,191 @@
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+import pickle
+import threading
+import time
+
+import pytest
+import requests
+import requests_mock
+
+from asf_search import ASFSession
+from asf_search.exceptions import ASFSearchThrottledError
+from asf_search.Throttle import Throttle, get_throttle, parse_retry_after
+from asf_search.download.download import download_url
+from asf_search.search.search_generator import get_page
+
+
+def _response(status_code: int, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b''
+    response._content_consumed = True
+    return response
+
+
+def test_throttle_backs_off_and_recovers():
+    throttle = Throttle(initial_limit=8, max_retries=0)
+
+    throttle.request(lambda: _response(429))
+    assert throttle.limit == 4
+
+    # Only raised while the limit is in use
+    for _ in range(10):
+        throttle.request(lambda: _response(200))
+    assert throttle.limit == 4
+
+    # Sequential requests only ever use one slot, the limit grows past it once
+    throttle = Throttle(initial_limit=1)
+    for _ in range(10):
+        throttle.request(lambda: _response(200))
+    assert throttle.limit == 2
+
+    metrics = throttle.metrics()
+    assert metrics['requests'] == 10
+    assert metrics['in_flight'] == 0
+    assert metrics['throttled'] == 0
+
+
+def test_throttle_adapts_to_service_capacity():
+    capacity = 3
+    lock = threading.Lock()
+    in_flight = [0]
+    served = []
+
+    def send():
+        with lock:
+            in_flight[0] += 1
+            overloaded = in_flight[0] > capacity
+        try:
+            time.sleep(0.01)
+            if overloaded:
+                return _response(429)
+            served.append(1)
+            return _response(200)
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    throttle = Throttle(initial_limit=16, max_retries=50, max_wait=0.02)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        responses = list(executor.map(lambda _: throttle.request(send), range(64)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len(served) == 64
+
+    metrics = throttle.metrics()
+    assert metrics['decreases'] >= 1
+    assert metrics['retries'] == metrics['throttled']
+    # Far fewer rejections than sending all 16 at once for every request would cause
+    assert metrics['throttled'] < 64
+    assert throttle.limit <= 8
+
+
+def test_streamed_responses_hold_their_slot_until_closed():
+    throttle = Throttle(initial_limit=1)
+
+    response = throttle.request(lambda: _response(200), stream=True)
+    assert throttle.metrics()['in_flight'] == 1
+
+    response.close()
+    response.close()
+    assert throttle.metrics()['in_flight'] == 0
+
+
+def test_get_page_throttle_retries_share_one_budget():
+    url = 'https://cmr.example.com/search/granules.umm_json_v1_4'
+    session = ASFSession(throttle=Throttle(max_retries=2))
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST',
+        url,
+        status_code=503,
+        headers={'Retry-After': '0'},
+        json={'errors': ['Service Unavailable']},
+    )
+    session.mount('https://', adapter)
+
+    with pytest.raises(ASFSearchThrottledError):
+        get_page(session=session, url=url, translated_opts=[])
+
+    # Retried by the throttle only, not again for each of get_page's own attempts
+    assert adapter.call_count == 3
+
+
+def test_get_page_honors_retry_after():
+    url = 'https://cmr.example.com/search/granules.umm_json_v1_4'
+    session = ASFSession(throttle=Throttle())
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST',
+        url,
+        [
+            {'status_code': 429, 'headers': {'Retry-After': '0.3'}, 'json': {'errors': []}},
+            {'status_code': 200, 'json': {'hits': 5}},
+        ],
+    )
+    session.mount('https://', adapter)
+
+    start = time.perf_counter()
+    response = get_page(session=session, url=url, translated_opts=[])
+    assert time.perf_counter() - start >= 0.3
+    assert response.json() == {'hits': 5}
+    assert adapter.call_count == 2
+
+    metrics = session.throttle.metrics()
+    assert metrics['throttled'] == 1
+    assert metrics['retries'] == 1
+
+
+def test_download_retries_when_throttled(tmp_path):
+    url = 'https://datapool.example.com/file.zip'
+    session = ASFSession(throttle=Throttle())
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'GET',
+        url,
+        [
+            {'status_code': 503, 'headers': {'Retry-After': '0'}},
+            {'status_code': 200, 'content': b'data'},
+        ],
+    )
+    session.mount('https://', adapter)
+
+    download_url(url, str(tmp_path), 'file.zip', session=session)
+
+    assert (tmp_path / 'file.zip').read_bytes() == b'data'
+    metrics = session.throttle.metrics()
+    assert metrics['throttled'] == 1
+    assert metrics['in_flight'] == 0
+
+
+def test_throttle_can_be_disabled():
+    url = 'https://cmr.example.com/search/granules.umm_json_v1_4'
+    session = ASFSession(throttle=False)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('POST', url, status_code=200, json={'hits': 0})
+    session.mount('https://', adapter)
+
+    requests_before = get_throttle(url).metrics()['requests']
+    get_page(session=session, url=url, translated_opts=[])
+    assert get_throttle(url).metrics()['requests'] == requests_before
+
+
+def test_throttle_pickles_with_session():
+    throttle = Throttle(initial_limit=4, max_limit=16, max_retries=0)
+    throttle.request(lambda: _response(429))
+
+    session = pickle.loads(pickle.dumps(ASFSession(throttle=throttle)))
+    assert session.throttle.max_limit == 16
+    assert session.throttle.limit == 4
+    assert session.throttle.metrics()['throttled'] == 0
+    assert pickle.loads(pickle.dumps(ASFSession())).throttle is True
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('5') == 5
+    assert parse_retry_after('-1') == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+    assert 25 < parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
@@ -5,6 +5,7 @@ import requests_mock
 
 from asf_search.constants.INTERNAL import CMR_COLLECTIONS_PATH, CMR_HOST
 from asf_search.exceptions import CMRError
+from asf_search.ASFSession import ASFSession
 
 
 def test_getMissions_error():
@@ -30,3 +31,16 @@ def test_getMissions_error_parsing():
 
 def run_test_get_project_names(cmr_ummjson, campaigns):
     assert _get_project_names(cmr_ummjson) == campaigns
+
+
+def test_getMissions_uses_session():
+    session = ASFSession()
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', 'https://' + CMR_HOST + CMR_COLLECTIONS_PATH, json={'items': []}
+    )
+    session.mount('https://', adapter)
+
+    assert get_campaigns({'provider': 'ASF'}, session=session) == {'items': []}
+    assert adapter.call_count == 1
+    assert adapter.last_request.headers['Client-Id'] == session.headers['Client-Id']
@@ -0,0 +1,188 @@
+from urllib.parse import parse_qs
+
+import pytest
+import requests_mock
+
+from asf_search import ASFSearchOptions, ASFSession, campaigns, get_searchable_attributes
+from asf_search.CMR import collections_by_processing_level
+from asf_search.CMR.collection_metadata import (
+    CollectionMetadataCache,
+    get_collection_cache,
+    get_collection_metadata,
+    prewarm_collection_metadata,
+    set_collection_cache,
+)
+from asf_search.constants.INTERNAL import CMR_COLLECTIONS_PATH, CMR_HOST
+
+
+def _collection(concept_id: str, short_name: str) -> dict:
+    return {
+        'meta': {'concept-id': concept_id, 'revision-id': 1},
+        'umm': {
+            'ShortName': short_name,
+            'AdditionalAttributes': [
+                {'Name': f'{short_name}_ATTRIBUTE', 'DataType': 'STRING', 'Description': ''}
+            ],
+            'Projects': [{'ShortName': f'{short_name}_CAMPAIGN'}],
+        },
+    }
+
+
+class FakeCollections:
+    """Answers CMR collection searches by concept-id or short name, recording each request"""
+
+    def __init__(self, collections):
+        self.collections = collections
+        self.requests = []
+
+    def __call__(self, request, context):
+        query = parse_qs(request.text)
+        self.requests.append(query)
+        concept_ids = query.get('concept-id[]', [])
+        short_names = [name.lower() for name in query.get('short_name[]', [])]
+
+        return {
+            'items': [
+                item
+                for item in self.collections
+                if item['meta']['concept-id'] in concept_ids
+                or item['umm']['ShortName'].lower() in short_names
+                or 'include_facets' in query
+            ]
+        }
+
+
+@pytest.fixture
+def cache():
+    previous = get_collection_cache()
+    set_collection_cache(CollectionMetadataCache())
+    yield get_collection_cache()
+    set_collection_cache(previous)
+
+
+@pytest.fixture
+def cmr():
+    concept_ids = collections_by_processing_level['SLC']
+    collections = [_collection(concept_id, 'SLC') for concept_id in concept_ids]
+    collections.append(_collection('C1-TEST', 'TEST_V1'))
+    collections.append(_collection('C2-TEST', 'TEST_V1'))
+    return FakeCollections(collections)
+
+
+def _session(cmr: FakeCollections, host: str = CMR_HOST) -> ASFSession:
+    session = ASFSession(cmr_host=host)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('POST', f'https://{host}{CMR_COLLECTIONS_PATH}', json=cmr)
+    session.mount('https://', adapter)
+    return session
+
+
+def test_concept_ids_are_fetched_in_one_request(cache, cmr):
+    session = _session(cmr)
+    concept_ids = collections_by_processing_level['SLC']
+
+    collections = get_collection_metadata(conceptIDs=concept_ids, session=session)
+    assert len(cmr.requests) == 1
+    assert cmr.requests[0]['concept-id[]'] == concept_ids
+    assert [items[0]['meta']['concept-id'] for items in collections.values()] == concept_ids
+
+    # Cached, including for attribute lookups by processing level
+    assert get_collection_metadata(conceptIDs=concept_ids, session=session) == collections
+    assert list(get_searchable_attributes(processingLevel='SLC', session=session)) == [
+        'SLC_ATTRIBUTE'
+    ]
+    assert len(cmr.requests) == 1
+
+
+def test_prewarm(cache, cmr):
+    session = _session(cmr)
+
+    assert prewarm_collection_metadata(['SLC'], session=session) == len(
+        collections_by_processing_level['SLC']
+    )
+    get_searchable_attributes(conceptID=collections_by_processing_level['SLC'][0], session=session)
+    assert len(cmr.requests) == 1
+
+
+def test_short_names(cache, cmr):
+    session = _session(cmr)
+
+    collections = get_collection_metadata(shortNames=['test_v1', 'MISSING'], session=session)
+    assert [item['meta']['concept-id'] for item in collections['test_v1']] == ['C1-TEST', 'C2-TEST']
+    assert collections['MISSING'] == []
+
+    assert get_collection_metadata(shortNames='test_v1', session=session) == {
+        'test_v1': collections['test_v1']
+    }
+    assert len(cmr.requests) == 1
+
+    # Collections that weren't found are looked up again
+    with pytest.raises(ValueError):
+        get_searchable_attributes(shortName='MISSING', session=session)
+    assert len(cmr.requests) == 2
+
+
+def test_cmr_errors_raise_value_error(cache):
+    session = ASFSession()
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST',
+        f'https://{CMR_HOST}{CMR_COLLECTIONS_PATH}',
+        status_code=400,
+        json={'errors': ['Concept-id [NotAValidConceptID-ASF] is not valid.']},
+    )
+    session.mount('https://', adapter)
+
+    with pytest.raises(ValueError):
+        get_searchable_attributes(conceptID='NotAValidConceptID-ASF', session=session)
+
+
+def test_host(cache, cmr):
+    session = _session(cmr, host='cmr.uat.earthdata.nasa.gov')
+
+    get_searchable_attributes(conceptID='C1-TEST', session=session)
+    assert len(cmr.requests) == 1
+
+    # Entries are kept per host
+    adapter = session.get_adapter('https://')
+    adapter.register_uri('POST', f'https://{CMR_HOST}{CMR_COLLECTIONS_PATH}', json=cmr)
+    get_searchable_attributes(conceptID='C1-TEST', session=session, opts=ASFSearchOptions())
+    assert adapter.last_request.hostname == CMR_HOST
+    assert len(cmr.requests) == 2
+
+
+def test_campaigns_are_cached(cache, cmr):
+    session = _session(cmr)
+
+    names = campaigns('TEST', session=session)
+    assert 'TEST_V1_CAMPAIGN' in names
+    assert campaigns('TEST', session=session) == names
+    assert len(cmr.requests) == 1
+
+
+def test_lru_eviction():
+    cache = CollectionMetadataCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_disk_cache(tmp_path):
+    path = str(tmp_path / 'collections')
+    CollectionMetadataCache(path=path).set('key', {'umm': {}})
+
+    # Shared by other caches (and processes) using the same directory
+    assert CollectionMetadataCache(path=path).get('key') == {'umm': {}}
+    assert CollectionMetadataCache(path=path, ttl=0).get('missing') is None
+
+    expired = CollectionMetadataCache(path=path, ttl=-1)
+    expired.set('key', {'umm': {}})
+    assert CollectionMetadataCache(path=path).get('key') is None
+
+    CollectionMetadataCache(path=path).clear()
+    assert not list((tmp_path / 'collections').glob('*.json'))
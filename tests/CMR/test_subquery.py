@@ -0,0 +1,42 @@
+import pytest
+
+from asf_search import ASFSearchOptions, explain
+from asf_search.CMR.subquery import build_subqueries, collapse_ranges
+
+
+@pytest.mark.parametrize(
+    'values, expected',
+    [
+        ([1, 2, 3, (5, 8), 9, 12], [(1, 3), (5, 9), 12]),
+        ([12, 3, 1, 2], [(1, 3), 12]),
+        ([(1, 10), (4, 6), 11], [(1, 11)]),
+        ([7], [7]),
+        ([(10, 1), 2], [(10, 1), 2]),
+    ],
+)
+def test_collapse_ranges(values, expected):
+    assert collapse_ranges(values) == expected
+
+
+def test_orbit_sweep_collapses_to_single_subquery():
+    opts = ASFSearchOptions(platform='SENTINEL-1', relativeOrbit=list(range(1, 176)))
+    subqueries = build_subqueries(opts)
+
+    assert len(subqueries) == 1
+    assert subqueries[0].relativeOrbit == [1, 175]
+
+
+def test_explain():
+    description = explain(
+        platform='SENTINEL-1',
+        beamMode=['IW', 'EW'],
+        relativeOrbit=list(range(1, 176)),
+        start='2021-01-01',
+        end='2021-02-01',
+    )
+    lines = description.splitlines()
+
+    assert lines[0].startswith('2 CMR request(s) to https://')
+    assert lines.count('    attribute[]: string,BEAM_MODE,IW | int,PATH_NUMBER,1,175') == 1
+    assert lines.count('    attribute[]: string,BEAM_MODE,EW | int,PATH_NUMBER,1,175') == 1
+    assert '    temporal: 2021-01-01T00:00:00Z,2021-02-01T00:00:00Z,' in lines
@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+import subprocess
+import sys
+
+import pytest
+
+from asf_search.ASFSearchOptions.validators import parse_date
+from asf_search.dates import parse_datetime, parse_iso8601, parse_user_date, to_epoch
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('2021-05-01', datetime(2021, 5, 1)),
+        ('2021-05-01T12:30:15', datetime(2021, 5, 1, 12, 30, 15)),
+        ('2021-05-01T12:30:15.123456Z', datetime(2021, 5, 1, 12, 30, 15, 123456, timezone.utc)),
+        ('2021-05-01T12:30:15Z', datetime(2021, 5, 1, 12, 30, 15, tzinfo=timezone.utc)),
+    ],
+)
+def test_parse_iso8601(value, expected):
+    assert parse_iso8601(value) == expected
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize('value', ['2021-05', 'yesterday', 'May 1st 2021', '20210501'])
+def test_parse_iso8601_rejects_non_iso(value):
+    with pytest.raises(ValueError):
+        parse_iso8601(value)
+
+
+def test_parse_datetime_falls_back_for_other_formats():
+    assert parse_datetime('2021/05/01 12:30:15') == datetime(2021, 5, 1, 12, 30, 15)
+
+    with pytest.raises(ValueError):
+        parse_datetime('not a date')
+
+
+def test_to_epoch():
+    assert to_epoch('1970-01-01T00:01:00Z') == 60.0
+
+
+def test_parse_user_date():
+    assert parse_user_date(
+        '2021-05-01T12:30:15', settings={'RETURN_AS_TIMEZONE_AWARE': True}
+    ) == datetime(2021, 5, 1, 12, 30, 15, tzinfo=timezone.utc)
+    assert parse_user_date('2021-05-01T12:30:15') == datetime(2021, 5, 1, 12, 30, 15)
+    assert parse_user_date('3 weeks ago') is not None
+    assert parse_user_date('asdf') is None
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('2021-05-01', '2021-05-01T00:00:00Z'),
+        ('2021-05-01T12:30:15.5Z', '2021-05-01T12:30:15Z'),
+        ('May 1st 2021', '2021-05-01T00:00:00Z'),
+    ],
+)
+def test_parse_date_validator(value, expected):
+    assert parse_date(value) == expected
+
+
+def test_iso8601_dates_skip_dateparser():
+    output = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys; import asf_search; '
+            "opts = asf_search.ASFSearchOptions(start='2021-05-01', end='2021-06-01T00:00:00Z'); "
+            "print('dateparser' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == 'False'
@@ -0,0 +1,91 @@
+import subprocess
+import sys
+
+import asf_search
+
+# Heavy or optional dependencies that should only load when the relevant feature is used
+DEFERRED_MODULES = [
+    'shapely',
+    'numpy',
+    'dateparser',
+    'tenacity',
+    'requests',
+    'asf_enumeration',
+    'asf_search.CMR.datasets',
+    'asf_search.Products',
+    'asf_search.SBASNetwork',
+    'asf_search.Pair',
+    'asf_search.export',
+]
+
+
+def _import_times(statement: str) -> dict:
+    """Runs `statement` in a fresh interpreter with `-X importtime`,
+    returns a dict of module name -> cumulative import time in microseconds"""
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_import_defers_heavy_modules(record_property):
+    times = _import_times('import asf_search')
+    record_property('asf_search_import_us', times['asf_search'])
+
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    assert loaded == [], f'`import asf_search` eagerly imported {loaded}'
+
+
+def test_lazy_attribute_loads_on_first_use():
+    times = _import_times('import asf_search; asf_search.ASFSession')
+
+    # `importlib.import_module()` isn't reported by `-X importtime`, but its own imports are
+    assert 'requests' in times
+    assert 'shapely' not in times
+
+
+def test_lazy_attributes_resolve_to_public_api():
+    from asf_search.ASFSession import ASFSession
+    from asf_search.ASFSearchOptions import ASFSearchOptions
+    from asf_search.search.search import search
+    from asf_search.health.health import health
+
+    assert asf_search.ASFSession is ASFSession
+    assert asf_search.ASFSearchOptions is ASFSearchOptions
+    assert asf_search.search is search
+    assert asf_search.health is health
+
+    for name in asf_search.__all__:
+        assert getattr(asf_search, name) is not None
+
+    assert set(asf_search.__all__).issubset(dir(asf_search))
+
+
+def test_unknown_attributes_import_nothing():
+    statement = (
+        'import asf_search; '
+        "assert not hasattr(asf_search, 'nope'); "
+        "assert not hasattr(asf_search, '__wrapped__')"
+    )
+    times = _import_times(statement)
+
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    assert loaded == [], f'looking up unknown attributes imported {loaded}'
+
+
+def test_search_results_defer_pyarrow():
+    times = _import_times('import asf_search; asf_search.ASFSearchResults; asf_search.search')
+
+    assert 'shapely' in times
+    assert 'pyarrow' not in times
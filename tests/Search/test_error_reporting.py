@@ -0,0 +1,156 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import subprocess
+import sys
+import threading
+from urllib.parse import parse_qs
+
+import pytest
+
+import asf_search
+from asf_search import ASFSearchOptions, ASFSession
+from asf_search.search import error_reporting
+from asf_search.search.error_reporting import (
+    ErrorReporter,
+    flush_error_reports,
+    report_search_error,
+)
+
+
+class _ReportHandler(BaseHTTPRequestHandler):
+    """A stand-in for the error reporting endpoint, recording each report it receives"""
+
+    # Cleared to hold reports until the test sets it again
+    release = threading.Event()
+    received = threading.Semaphore(0)
+    messages = []
+    headers = []
+
+    def do_POST(self):
+        # Held before waiting, so a report that was timed out on isn't recorded by a later test
+        messages = type(self).messages
+        type(self).headers.append(self.headers)
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8')
+        type(self).received.release()
+        type(self).release.wait()
+        messages.append(parse_qs(body)['Message'][0])
+
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def report_endpoint():
+    _ReportHandler.release = threading.Event()
+    _ReportHandler.release.set()
+    _ReportHandler.received = threading.Semaphore(0)
+    _ReportHandler.messages = []
+    _ReportHandler.headers = []
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ReportHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f'http://127.0.0.1:{server.server_port}/'
+    finally:
+        _ReportHandler.release.set()
+        server.shutdown()
+        server.server_close()
+
+
+def test_reports_are_sent_without_credentials(monkeypatch, report_endpoint):
+    monkeypatch.setattr(asf_search, 'REPORT_ERRORS', True)
+    monkeypatch.setattr(error_reporting._reporter, 'url', report_endpoint)
+
+    session = ASFSession()
+    session.headers.update({'Authorization': 'Bearer secret'})
+    session.cookies.set('asf-urs', 'secret')
+
+    report_search_error(ASFSearchOptions(platform='SENTINEL-1', session=session), 'CMR 500')
+    assert flush_error_reports(timeout=5)
+
+    assert len(_ReportHandler.messages) == 1
+    assert 'CMR 500' in _ReportHandler.messages[0]
+    headers = _ReportHandler.headers[0]
+    assert headers['User-Agent'] == session.headers['User-Agent']
+    # Neither the EDL token nor the auth cookies are sent to the reporting endpoint
+    assert 'Authorization' not in headers
+    assert 'Cookie' not in headers
+
+
+def test_reports_do_not_block(report_endpoint):
+    _ReportHandler.release.clear()
+    reporter = ErrorReporter(url=report_endpoint, batch_window=0)
+
+    # Returns while the report is still being sent
+    assert reporter.submit('CMR 500')
+    assert _ReportHandler.received.acquire(timeout=5)
+    assert not reporter.flush(timeout=0)
+    assert len(_ReportHandler.messages) == 0
+
+    _ReportHandler.release.set()
+    assert reporter.flush(timeout=5)
+    assert len(_ReportHandler.messages) == 1
+    assert 'CMR 500' in _ReportHandler.messages[0]
+
+
+def test_reports_are_deduplicated_and_batched(report_endpoint):
+    reporter = ErrorReporter(url=report_endpoint, batch_window=0.5)
+
+    for idx in range(5):
+        assert reporter.submit(f'CMR 500 on page {idx}')
+        assert not reporter.submit(f'CMR 500 on page {idx}')
+
+    assert reporter.flush(timeout=5)
+    assert len(_ReportHandler.messages) == 1
+    assert _ReportHandler.messages[0].startswith('These 5 error messages')
+    for idx in range(5):
+        assert f'CMR 500 on page {idx}' in _ReportHandler.messages[0]
+
+
+def test_reports_are_dropped_when_queue_is_full(report_endpoint):
+    _ReportHandler.release.clear()
+    reporter = ErrorReporter(url=report_endpoint, max_queued=2, batch_size=1, batch_window=0)
+
+    assert reporter.submit('CMR 500 on page 0')
+    assert _ReportHandler.received.acquire(timeout=5)
+    queued = [reporter.submit(f'CMR 500 on page {idx}') for idx in range(1, 10)]
+
+    # One report is being sent, two are waiting, the rest are dropped
+    assert queued.count(True) == 2
+    assert reporter.dropped == 7
+
+    _ReportHandler.release.set()
+    assert reporter.flush(timeout=10)
+    assert len(_ReportHandler.messages) == 3
+
+
+def test_reports_time_out(report_endpoint):
+    # The endpoint never answers while the report is being sent
+    _ReportHandler.release.clear()
+    reporter = ErrorReporter(url=report_endpoint, batch_window=0, timeout=0.2)
+    reporter.submit('CMR 500')
+
+    assert reporter.flush(timeout=30)
+    assert len(_ReportHandler.messages) == 0
+
+
+def test_reports_are_flushed_at_exit(report_endpoint):
+    script = (
+        'import asf_search\n'
+        'from asf_search.search import error_reporting\n'
+        f'error_reporting._reporter.url = {report_endpoint!r}\n'
+        'error_reporting._reporter.batch_window = 60\n'
+        'asf_search.REPORT_ERRORS = True\n'
+        'error_reporting.report_search_error(asf_search.ASFSearchOptions(), "CMR 500")\n'
+    )
+
+    subprocess.run([sys.executable, '-c', script], check=True, timeout=60)
+
+    # Sent on the way out, without waiting out the batch window
+    assert len(_ReportHandler.messages) == 1
+    assert 'CMR 500' in _ReportHandler.messages[0]
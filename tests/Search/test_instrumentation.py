@@ -0,0 +1,167 @@
+import io
+
+import pytest
+import requests_mock
+import yaml
+
+from asf_search import ASFSearchOptions, ASFSession, instrumentation, search_generator
+from asf_search.ASFSearchResults import ASFSearchResults
+from asf_search.download.download import download_url
+from asf_search.export.writers import export_stream
+
+
+@pytest.fixture
+def events():
+    received = []
+    instrumentation.register(received.append)
+    try:
+        yield received
+    finally:
+        instrumentation.unregister(received.append)
+
+
+@pytest.fixture(scope='module')
+def items():
+    with open('tests/yml_tests/Resources/Fairbanks_S1_stack.yml', 'r') as f:
+        products = yaml.safe_load(f)[:5]
+
+    return [{'umm': product['umm'], 'meta': product['meta']} for product in products]
+
+
+def test_search_events(events, items):
+    session = ASFSession()
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('POST', requests_mock.ANY, json={'hits': len(items), 'items': items})
+    session.mount('https://', adapter)
+
+    pages = list(search_generator(opts=ASFSearchOptions(platform='SENTINEL-1', session=session)))
+    assert sum(len(page) for page in pages) == len(items)
+
+    by_name = {event.name: event for event in events}
+    assert [event.name for event in events] == [
+        'search.request',
+        'search.decode',
+        'search.subclass',
+        'search.page',
+        'search.subquery',
+    ]
+
+    page = by_name['search.page']
+    assert page.parent_id is None
+    assert page.items == len(items)
+    for name in ['search.request', 'search.decode', 'search.subclass']:
+        assert by_name[name].parent_id == page.span_id
+        assert 0 <= by_name[name].duration <= page.duration
+
+    request = by_name['search.request']
+    assert request.status == 200
+    assert request.bytes == by_name['search.decode'].bytes > 0
+    assert by_name['search.subclass'].items == len(items)
+    assert by_name['search.subquery'].items == len(items)
+    assert by_name['search.subquery'].attributes['pages'] == 1
+
+
+def test_download_events(events, tmp_path):
+    url = 'https://datapool.example.com/file.zip'
+    session = ASFSession()
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'GET',
+        url,
+        [
+            {'status_code': 429, 'headers': {'Retry-After': '0'}},
+            {'status_code': 200, 'content': b'x' * 1000},
+        ],
+    )
+    session.mount('https://', adapter)
+
+    download_url(url, str(tmp_path), 'file.zip', session=session)
+
+    assert len(events) == 1
+    event = events[0]
+    assert event.name == 'download.file'
+    assert event.status == 200
+    assert event.bytes == 1000
+    assert event.retries == 1
+    assert event.attributes['url'] == url
+
+
+def test_export_events(events, stack):
+    results = ASFSearchResults(stack[:20])
+
+    fh = io.StringIO()
+    export_stream(results, fh, 'geojson', buffer_size=4096)
+
+    assert len(events) > 1
+    assert all(event.name == 'export.chunk' for event in events)
+    assert sum(event.bytes for event in events) == len(fh.getvalue())
+    assert events[0].attributes['format'] == 'geojson'
+
+
+def test_span_records_errors_and_isolates_callbacks(events):
+    def broken(event):
+        raise RuntimeError('broken callback')
+
+    instrumentation.register(broken)
+    try:
+        with pytest.raises(ValueError):
+            with instrumentation.span('outer', label='value'):
+                with instrumentation.span('inner') as inner:
+                    inner.items = 3
+                    instrumentation.add_retry()
+                raise ValueError('failed')
+    finally:
+        instrumentation.unregister(broken)
+
+    inner, outer = events
+    assert inner.parent_id == outer.span_id
+    assert inner.items == 3
+    assert inner.retries == 1
+    assert inner.error is None
+    assert outer.error == 'ValueError: failed'
+    assert outer.attributes == {'label': 'value'}
+
+
+def test_nothing_is_measured_without_callbacks():
+    assert not instrumentation.enabled()
+    with instrumentation.span('search.page') as event:
+        assert event is None
+
+
+def test_prometheus_metrics():
+    prometheus_client = pytest.importorskip('prometheus_client')
+    registry = prometheus_client.CollectorRegistry()
+    metrics = instrumentation.PrometheusMetrics(registry=registry)
+
+    metrics(instrumentation.Event('download.file', 0, 0.5, status=200, bytes=100, retries=2))
+    metrics(instrumentation.Event('download.file', 0, 0.5, status=200, bytes=50))
+
+    labels = {'event': 'download.file'}
+    assert registry.get_sample_value('asf_search_event_bytes_total', labels) == 150
+    assert registry.get_sample_value('asf_search_event_retries_total', labels) == 2
+    assert (
+        registry.get_sample_value('asf_search_events_total', {**labels, 'status': '200'}) == 2
+    )
+
+
+def test_opentelemetry_spans():
+    pytest.importorskip('opentelemetry.sdk')
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    spans = instrumentation.OpenTelemetrySpans(tracer=provider.get_tracer('test'))
+
+    instrumentation.register(spans)
+    try:
+        with instrumentation.span('search.page'):
+            with instrumentation.span('search.request'):
+                pass
+    finally:
+        instrumentation.unregister(spans)
+
+    finished = {span.name: span for span in exporter.get_finished_spans()}
+    assert finished['search.request'].parent.span_id == finished['search.page'].context.span_id
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+import importlib
+
+from asf_search import ASFSearchOptions, ASFSearchResults
+from asf_search.constants import INTERNAL
+
+sharded_search_module = importlib.import_module('asf_search.search.sharded_search')
+
+
+class FakeProduct:
+    def __init__(self, idx: int, time: datetime):
+        self.meta = {'concept-id': f'G{idx}-ASF'}
+        self.time = time
+
+    def get_sort_keys(self):
+        return (self.time.strftime('%Y-%m-%dT%H:%M:%SZ'), self.meta['concept-id'])
+
+
+# Most of the data is recent, like most real collections
+EPOCH = datetime(2015, 1, 1, tzinfo=timezone.utc)
+PRODUCTS = [
+    FakeProduct(idx, EPOCH + timedelta(hours=int(idx**1.5))) for idx in range(2000)
+]
+
+
+def _in_range(opts: ASFSearchOptions):
+    return [product for product in PRODUCTS if opts.start <= product.time <= opts.end]
+
+
+def _fake_search_generator(opts: ASFSearchOptions):
+    products = _in_range(opts)
+    for idx in range(0, len(products), INTERNAL.CMR_PAGE_SIZE):
+        page = ASFSearchResults(products[idx : idx + INTERNAL.CMR_PAGE_SIZE], opts=opts)
+        page.searchComplete = idx + INTERNAL.CMR_PAGE_SIZE >= len(products)
+        yield page
+
+
+def test_sharded_search(monkeypatch):
+    count_requests = []
+
+    def fake_search_count(opts: ASFSearchOptions):
+        count_requests.append(opts)
+        return len(_in_range(opts))
+
+    monkeypatch.setattr(sharded_search_module, 'search_count', fake_search_count)
+    monkeypatch.setattr(sharded_search_module, 'search_generator', _fake_search_generator)
+
+    opts = ASFSearchOptions(start='2015-01-01', end='2030-01-01', platform='SENTINEL-1')
+    intervals = sharded_search_module.get_temporal_shards(opts, 8)
+
+    assert len(intervals) == 8
+    assert all(intervals[idx][1] == intervals[idx + 1][0] for idx in range(len(intervals) - 1))
+    assert sum(interval[2] for interval in intervals) == len(PRODUCTS)
+    # Recent intervals are split more finely to balance hits
+    assert max(interval[2] for interval in intervals) <= len(PRODUCTS) // 2
+
+    results = sharded_search_module.sharded_search(opts=opts, shards=8)
+
+    assert results.searchComplete
+    assert len(results) == len(PRODUCTS)
+    assert [p.get_sort_keys() for p in results] == sorted(
+        [p.get_sort_keys() for p in PRODUCTS], reverse=True
+    )
+
+
+def test_temporal_shards_count_products_on_boundaries(monkeypatch):
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    mid = datetime(2015, 1, 2, tzinfo=timezone.utc)
+    end = datetime(2015, 1, 3, tzinfo=timezone.utc)
+    times = [mid] * 600 + [mid + timedelta(minutes=idx + 1) for idx in range(600)]
+
+    def fake_search_count(opts: ASFSearchOptions):
+        return len([time for time in times if opts.start <= time <= opts.end])
+
+    monkeypatch.setattr(sharded_search_module, 'search_count', fake_search_count)
+
+    opts = ASFSearchOptions(start=start.isoformat(), end=end.isoformat())
+    assert sharded_search_module.get_temporal_shards(opts, 2) == [
+        (start, mid, 600),
+        (mid, end, 1200),
+    ]
+
+
+def test_sharded_search_small_search_falls_back(monkeypatch):
+    monkeypatch.setattr(sharded_search_module, 'search_count', lambda opts: 10)
+    monkeypatch.setattr(sharded_search_module, 'search', lambda opts: 'search()')
+
+    assert sharded_search_module.sharded_search(platform='SENTINEL-1') == 'search()'
+    assert sharded_search_module.sharded_search(platform='SENTINEL-1', maxResults=5000) == 'search()'
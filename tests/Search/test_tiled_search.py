@@ -0,0 +1,89 @@
+import importlib
+
+from shapely.geometry import Polygon, box, mapping
+
+from asf_search import ASFSearchOptions, ASFSearchResults
+
+tiled_search_module = importlib.import_module('asf_search.search.tiled_search')
+
+L_SHAPE = 'POLYGON((0 0, 10 0, 10 2, 2 2, 2 10, 0 10, 0 0))'
+
+
+class FakeProduct:
+    def __init__(self, name: str, footprint):
+        self.meta = {'concept-id': name}
+        self.geometry = mapping(footprint)
+
+    def get_sort_keys(self):
+        return ('', self.meta['concept-id'])
+
+
+# One product inside each arm of the L, one straddling the corner, one in the empty corner
+PRODUCTS = [
+    FakeProduct('G1-ASF', box(7, 0.5, 8, 1.5)),
+    FakeProduct('G2-ASF', box(0.5, 7, 1.5, 8)),
+    FakeProduct('G3-ASF', box(1, 1, 3, 3)),
+    FakeProduct('G4-ASF', box(7, 7, 8, 8)),
+]
+
+
+def test_tiled_search(monkeypatch):
+    searched = []
+
+    def fake_search(opts: ASFSearchOptions):
+        from shapely import wkt
+
+        searched.append(opts)
+        # CMR searches the convex hull of the AOI
+        hull = wkt.loads(opts.intersectsWith).convex_hull
+        results = ASFSearchResults(
+            [p for p in PRODUCTS if hull.intersects(box(*_bounds(p)))], opts=opts
+        )
+        results.searchComplete = True
+        return results
+
+    monkeypatch.setattr(tiled_search_module, 'search', fake_search)
+
+    results = tiled_search_module.tiled_search(L_SHAPE, platform='SENTINEL-1')
+    assert len(searched) > 1
+    # each tile pages with its own CMR-Search-After header
+    assert len({id(opts.session.headers) for opts in searched}) == len(searched)
+    assert sorted(p.meta['concept-id'] for p in results) == ['G1-ASF', 'G2-ASF', 'G3-ASF']
+    assert results.searchComplete
+
+    searched.clear()
+    results = tiled_search_module.tiled_search(L_SHAPE, max_tiles=1, exact=True)
+    assert len(searched) == 1
+    assert sorted(p.meta['concept-id'] for p in results) == ['G1-ASF', 'G2-ASF', 'G3-ASF']
+
+
+# A footprint crossing the antimeridian, and one without a footprint
+ANTIMERIDIAN = FakeProduct('G5-ASF', Polygon([(179, 60), (-179, 60), (-179, 61), (179, 61)]))
+NO_FOOTPRINT = FakeProduct('G6-ASF', box(0, 0, 1, 1))
+NO_FOOTPRINT.geometry = {'coordinates': None, 'type': 'Polygon'}
+
+
+def test_tiled_search_exact(monkeypatch):
+    def fake_search(opts: ASFSearchOptions):
+        results = ASFSearchResults([ANTIMERIDIAN, NO_FOOTPRINT], opts=opts)
+        results.searchComplete = True
+        return results
+
+    monkeypatch.setattr(tiled_search_module, 'search', fake_search)
+
+    def search(aoi):
+        results = tiled_search_module.tiled_search(aoi, max_tiles=1, exact=True)
+        assert results.searchComplete
+        return [p.meta['concept-id'] for p in results]
+
+    # West of the antimeridian, which the wrapped footprint (179 to -179) doesn't reach
+    assert search(box(-179.8, 60.2, -179.2, 60.8).wkt) == ['G5-ASF', 'G6-ASF']
+    assert search(box(179.2, 60.2, 179.8, 60.8).wkt) == ['G5-ASF', 'G6-ASF']
+    # Covered by the wrapped footprint, but nowhere near the product
+    assert search(box(0, 60.2, 1, 60.8).wkt) == ['G6-ASF']
+
+
+def _bounds(product):
+    coords = product.geometry['coordinates'][0]
+    xs, ys = [c[0] for c in coords], [c[1] for c in coords]
+    return min(xs), min(ys), max(xs), max(ys)
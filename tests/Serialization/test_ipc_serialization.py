@@ -0,0 +1,98 @@
+import pytest
+
+from asf_search import ASFSearchOptions, ASFSearchResults, ASFSession
+from asf_search.export.ipc import results_from_ipc, results_to_ipc
+from tests.resources import load_results
+
+pa = pytest.importorskip('pyarrow')
+
+
+def _load_results(*resources: str) -> ASFSearchResults:
+    return load_results(*resources, opts=ASFSearchOptions(platform='SENTINEL-1', maxResults=250))
+
+
+def _assert_same_products(expected: ASFSearchResults, actual: ASFSearchResults, umm: bool = True):
+    assert len(actual) == len(expected)
+    for original, loaded in zip(expected, actual):
+        assert type(loaded) is type(original)
+        assert loaded.properties == original.properties
+        assert loaded.geometry == original.geometry
+        assert loaded.meta == original.meta
+        assert loaded.baseline == original.baseline
+        assert loaded.umm == (original.umm if umm else None)
+
+
+@pytest.mark.parametrize('memory_map', [True, False])
+def test_ipc_round_trip(tmp_path, memory_map):
+    results = _load_results('Fairbanks_S1_stack.yml', 'Fairbanks_ers_stack.yml')
+    path = str(tmp_path / 'results.arrow')
+
+    results.to_ipc(path)
+    session = ASFSession()
+    loaded = ASFSearchResults.from_ipc(path, session=session, memory_map=memory_map)
+
+    _assert_same_products(results, loaded)
+    assert all(product.session is session for product in loaded)
+    assert loaded.searchComplete
+    assert dict(loaded.searchOptions) == dict(results.searchOptions)
+
+    # Restored products work the same as the originals
+    assert ''.join(loaded.csv()) == ''.join(results.csv())
+    assert loaded.find_urls() == results.find_urls()
+
+
+def test_ipc_authenticated_session_options(tmp_path):
+    session = ASFSession()
+    session.headers.update({'Authorization': 'Bearer secret-token'})
+    session.cookies.set('asf-urs', 'secret-cookie')
+    results = _load_results('Fairbanks_S1_stack.yml')
+    results.searchOptions = ASFSearchOptions(platform='SENTINEL-1', session=session)
+    path = str(tmp_path / 'results.arrow')
+
+    results.to_ipc(path)
+    with open(path, 'rb') as f:
+        contents = f.read()
+    assert b'secret' not in contents
+
+    loader_session = ASFSession()
+    loaded = results_from_ipc(path, session=loader_session)
+    assert loaded.searchOptions.platform == ['SENTINEL-1']
+    assert loaded.searchOptions.session is loader_session
+
+
+def test_ipc_slices_and_options(tmp_path):
+    results = _load_results('Fairbanks_S1_stack.yml')
+    results.searchComplete = False
+    results.searchOptions = None
+    path = str(tmp_path / 'results.arrow')
+
+    results_to_ipc(results, path, include_umm=False, compression='zstd')
+    loaded = results_from_ipc(path, start=2, stop=5)
+
+    _assert_same_products(ASFSearchResults(results[2:5]), loaded, umm=False)
+    assert loaded.searchOptions is None
+    assert not loaded.searchComplete
+
+    assert len(results_from_ipc(path, start=len(results) + 1)) == 0
+
+
+def test_ipc_rejects_other_files(tmp_path):
+    path = str(tmp_path / 'other.arrow')
+    table = pa.table({'a': [1, 2]})
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    with pytest.raises(ValueError):
+        results_from_ipc(path)
+
+    table = table.replace_schema_metadata(
+        {'format': 'asf_search.ASFSearchResults', 'version': '1000'}
+    )
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    with pytest.raises(ValueError, match='version 1000'):
+        results_from_ipc(path)
+
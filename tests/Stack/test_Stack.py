@@ -43,8 +43,9 @@ def test_stack_from_ref_scene(mocker, reference, stack_results):
         **{"start": "2022-01-01", "end": "2022-04-02"}
     )
 
+    # Products have no instance `__dict__`, so `stack()` is patched on the class
     mock_stack = mocker.patch.object(
-        reference,
+        type(reference),
         "stack",
         return_value=stack_results,
     )
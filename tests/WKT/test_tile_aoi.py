@@ -0,0 +1,40 @@
+from shapely import wkt
+from shapely.ops import unary_union
+
+from asf_search.WKT.tile_aoi import tile_aoi
+
+# An L shaped area, its convex hull is more than twice its area
+L_SHAPE = wkt.loads('POLYGON((0 0, 10 0, 10 2, 2 2, 2 10, 0 10, 0 0))')
+
+
+def test_tile_aoi_covers_aoi_tightly():
+    tiles = tile_aoi(L_SHAPE, max_tiles=16, min_fill=0.8)
+
+    assert 1 < len(tiles) <= 16
+    assert unary_union(tiles).symmetric_difference(L_SHAPE).area < 1e-9
+    assert all(tile.area >= 0.8 * tile.convex_hull.area for tile in tiles)
+    assert sum(tile.convex_hull.area for tile in tiles) < L_SHAPE.convex_hull.area
+
+
+def test_tile_aoi_splits_small_unfilled_tiles():
+    # The notched square wastes more area than the L, but already covers its convex hull
+    notched = wkt.loads('POLYGON((0 0, 100 0, 100 80, 80 80, 80 100, 0 100, 0 0))')
+    small_l = wkt.loads('POLYGON((200 200, 210 200, 210 202, 202 202, 202 210, 200 210, 200 200))')
+    tiles = tile_aoi(unary_union([notched, small_l]), max_tiles=16, min_fill=0.8)
+
+    assert all(tile.area >= 0.8 * tile.convex_hull.area for tile in tiles)
+
+
+def test_tile_aoi_respects_max_tiles():
+    assert len(tile_aoi(L_SHAPE, max_tiles=4, min_fill=1.0)) <= 4
+    assert len(tile_aoi(L_SHAPE, max_tiles=3)) == 1
+
+
+def test_tile_aoi_leaves_simple_shapes():
+    assert tile_aoi('POINT(1 2)')[0].wkt == 'POINT (1 2)'
+    assert len(tile_aoi('POLYGON((0 0, 1 0, 1 1, 0 1, 0 0))')) == 1
+
+    multipart = tile_aoi(
+        'MULTIPOLYGON(((0 0, 1 0, 1 1, 0 1, 0 0)), ((20 20, 21 20, 21 21, 20 21, 20 20)))'
+    )
+    assert len(multipart) == 2
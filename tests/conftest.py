@@ -0,0 +1,9 @@
+import pytest
+
+from tests.resources import load_results
+
+
+@pytest.fixture(scope='module')
+def stack():
+    """A Sentinel-1 stack over Fairbanks, built once per test module"""
+    return load_results('Fairbanks_S1_stack.yml')
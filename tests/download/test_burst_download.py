@@ -0,0 +1,139 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import copy
+import os
+import threading
+import time
+
+import pytest
+import yaml
+
+from asf_search import ASFSession, download_bursts
+from asf_search.ASFSearchResults import ASFSearchResults
+from asf_search.exceptions import ASFDownloadError
+from asf_search.search.search_generator import as_ASFProduct
+
+
+class _BurstHandler(BaseHTTPRequestHandler):
+    """Answers 202 for each path until `extraction_time` after its first request, like burst extraction"""
+
+    protocol_version = 'HTTP/1.1'
+    extraction_time = 0.5
+    lock = threading.Lock()
+    first_requested = {}
+    in_flight = 0
+    max_in_flight = 0
+    requests = 0
+    # How many paths had been requested when the first extraction was ready
+    requested_before_ready = None
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests += 1
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            first_requested = cls.first_requested.setdefault(self.path, time.monotonic())
+
+        try:
+            # Long enough for concurrent requests to overlap
+            time.sleep(0.02)
+            if time.monotonic() - first_requested < cls.extraction_time:
+                self.send_response(202)
+                self.send_header('Retry-After', '0')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            with cls.lock:
+                if cls.requested_before_ready is None:
+                    cls.requested_before_ready = len(cls.first_requested)
+
+            body = self.path.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def burst_server():
+    _BurstHandler.extraction_time = 0.5
+    _BurstHandler.first_requested = {}
+    _BurstHandler.in_flight = 0
+    _BurstHandler.max_in_flight = 0
+    _BurstHandler.requests = 0
+    _BurstHandler.requested_before_ready = None
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _BurstHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope='module')
+def burst_items():
+    with open('tests/yml_tests/Resources/SLC_BURST_stack.yml', 'r') as f:
+        return yaml.safe_load(f)[:12]
+
+
+def _get_bursts(items, host: str, count: int) -> ASFSearchResults:
+    session = ASFSession()
+    products = [as_ASFProduct(copy.deepcopy(item), session) for item in items[:count]]
+    for idx, product in enumerate(products):
+        # Burst urls all end in the burst index, the saved name comes from the product
+        product.properties['url'] = f'{host}/{idx}/3.tiff'
+
+    return ASFSearchResults(products)
+
+
+def test_download_bursts_extracts_concurrently(burst_items, burst_server, tmp_path):
+    bursts = _get_bursts(burst_items, burst_server, 12)
+
+    download_bursts(bursts, str(tmp_path), max_in_flight=4, poll_interval=0.05, max_poll_interval=0.2)
+
+    for idx, product in enumerate(bursts):
+        with open(tmp_path / product.properties['fileName'], 'rb') as f:
+            assert f.read() == f'/{idx}/3.tiff'.encode('utf-8')
+
+    assert 1 < _BurstHandler.max_in_flight <= 4
+    # Every extraction was started before the first one finished, instead of waiting on each in turn
+    assert _BurstHandler.requested_before_ready == len(bursts)
+
+
+def test_download_bursts_skips_existing_files(burst_items, burst_server, tmp_path):
+    bursts = _get_bursts(burst_items, burst_server, 3)
+    existing = tmp_path / bursts[0].properties['fileName']
+    existing.write_bytes(b'already downloaded')
+
+    with pytest.warns(UserWarning, match='File already exists'):
+        bursts.download_bursts(str(tmp_path), max_in_flight=2)
+
+    assert existing.read_bytes() == b'already downloaded'
+    assert '/0/3.tiff' not in _BurstHandler.first_requested
+    assert len(os.listdir(tmp_path)) == 3
+
+
+def test_download_bursts_times_out(burst_items, burst_server, tmp_path):
+    _BurstHandler.extraction_time = 60
+    bursts = _get_bursts(burst_items, burst_server, 2)
+
+    with pytest.raises(ASFDownloadError, match='Failed to download 2 of 2 files'):
+        download_bursts(bursts, str(tmp_path), timeout=0.3, poll_interval=0.05)
+
+    assert len(os.listdir(tmp_path)) == 0
+
+
+def test_download_bursts_requires_directory(tmp_path):
+    with pytest.raises(ASFDownloadError):
+        download_bursts([], str(tmp_path / 'missing'))
@@ -0,0 +1,30 @@
+import os
+from typing import Iterator, Optional
+
+import yaml
+
+from asf_search import ASFSearchOptions, ASFSearchResults, ASFSession
+from asf_search.search.search_generator import as_ASFProduct
+
+RESOURCES = os.path.join(os.path.dirname(__file__), 'yml_tests', 'Resources')
+
+
+def load_results(*resources: str, opts: Optional[ASFSearchOptions] = None) -> ASFSearchResults:
+    """Builds complete search results from the products recorded in `yml_tests/Resources`"""
+    session = ASFSession()
+    products = []
+    for resource in resources:
+        with open(os.path.join(RESOURCES, resource), 'r') as f:
+            products.extend(as_ASFProduct(item, session) for item in yaml.safe_load(f))
+
+    results = ASFSearchResults(products, opts=opts)
+    results.searchComplete = True
+    return results
+
+
+def get_pages(results: ASFSearchResults, page_size: int) -> Iterator[ASFSearchResults]:
+    """Splits results into pages, the way `search_generator()` yields them"""
+    for idx in range(0, len(results), page_size):
+        page = ASFSearchResults(results[idx : idx + page_size])
+        page.searchComplete = idx + page_size >= len(results)
+        yield page